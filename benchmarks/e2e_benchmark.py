@@ -0,0 +1,197 @@
+"""
+スタブの管理画面（tests/stub_admin.py）に対してブラウザ操作の流れ全体を実行し、処理速度を計測する
+
+実サイト・スプレッドシート・Slackには接続しない。一時ディレクトリに設定ファイル
+（config/settings.ini を元に [BROWSER] の処理方法などを上書き）・セレクター・判定条件を作成し、
+main.py と同じ Runtime（ブラウザ起動・ログイン・検索・応募者の処理）で計測する。
+
+使用例:
+    python benchmarks/e2e_benchmark.py --records 200 --per-page 20 --latency 0.05 --modes batch,id,in_page
+"""
+from datetime import datetime
+from pathlib import Path
+import argparse
+import configparser
+import json
+import os
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from src.modules.runtime import Runtime
+from src.utils.environment import EnvironmentUtils as env
+from src.utils.metrics import metrics
+from tests.stub_admin import (
+    JUDGE_LIST_CSV, SELECTORS_CSV, StubAdminServer, StubAdminSite, generate_records
+)
+
+# 処理方法ごとの [BROWSER] の設定
+MODES = {
+    'batch': {'process_by_id': 'false'},
+    'id': {'process_by_id': 'true', 'id_process_mode': 'search'},
+    'in_page': {'process_by_id': 'true', 'id_process_mode': 'in_page'},
+    'http': {'process_by_id': 'true', 'id_process_mode': 'search', 'http_listing': 'true'},
+}
+
+
+def prepare_project(root: Path, mode: str, args) -> None:
+    """
+    計測用のプロジェクトディレクトリ（config/ 以下）を作成
+
+    Args:
+        root: 作成先
+        mode: 処理方法（MODES のキー）
+        args: コマンドライン引数
+    """
+    config = configparser.ConfigParser()
+    config.read(PROJECT_ROOT / 'config' / 'settings.ini', encoding='utf-8')
+    overrides = {
+        'BROWSER': dict(
+            MODES[mode],
+            headless=str(not args.headed).lower(),
+            auto_update=str(args.auto_update).lower(),
+            bulk_check=str(args.bulk_check).lower(),
+            repeat_until_empty='true',
+            workers='1',
+        ),
+        'SESSION': {'enabled': 'false'},
+        'SCHEDULE': {'enabled': 'false'},
+        'JUDGE': {'use_judge_list': 'false'},
+        'LOGGING': {'level': 'INFO'},
+        'METRICS': {'enabled': 'true', 'output_dir': 'logs/metrics'},
+    }
+    for section, values in overrides.items():
+        if not config.has_section(section):
+            config.add_section(section)
+        for key, value in values.items():
+            config.set(section, key, value)
+
+    config_dir = root / 'config'
+    config_dir.mkdir(parents=True, exist_ok=True)
+    with open(config_dir / 'settings.ini', 'w', encoding='utf-8') as f:
+        config.write(f)
+    (config_dir / 'selectors.csv').write_text(SELECTORS_CSV, encoding='utf-8')
+    (config_dir / 'judge_list.csv').write_text(JUDGE_LIST_CSV, encoding='utf-8')
+
+
+def run_mode(mode: str, args) -> dict:
+    """
+    1つの処理方法で、スタブサーバーの起動から処理の完了までを計測
+
+    Returns:
+        dict: 計測結果（処理件数・所要時間・件数/秒・処理段階ごとの集計・待機時間の集計）
+    """
+    site = StubAdminSite(
+        records=generate_records(args.records, seed=args.seed),
+        per_page=args.per_page,
+        latency=args.latency,
+        update_latency=args.update_latency,
+        jitter=args.jitter,
+        seed=args.seed
+    )
+    root = Path(tempfile.mkdtemp(prefix=f'e2e_{mode}_'))
+    prepare_project(root, mode, args)
+
+    cwd = os.getcwd()
+    base_dir = env.get_project_root()
+    runtime = None
+    with StubAdminServer(site) as server:
+        os.environ.update({
+            'ADMIN_URL': server.admin_url,
+            'BASIC_AUTH_ID': 'stub',
+            'BASIC_AUTH_PASSWORD': 'stub',
+            'LOGIN_ID': site.login_id,
+            'LOGIN_PASSWORD': site.password,
+            'SLACK_WEBHOOK': '',
+        })
+        os.environ.pop('SPREADSHEET_KEY', None)
+        try:
+            # Runtime は config/ 以下を相対パスで読み込むため、作業ディレクトリも移動する
+            env.set_project_root(root)
+            os.chdir(root)
+
+            runtime = Runtime(test_mode=True)
+            started = time.perf_counter()
+            runtime.ensure_ready()
+            ready_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            applicants = runtime.run()
+            run_seconds = time.perf_counter() - started
+            waits = runtime.browser.ready.stats()
+        finally:
+            if runtime:
+                runtime.close()
+            os.chdir(cwd)
+            env.set_project_root(base_dir)
+
+    return {
+        'mode': mode,
+        'records': args.records,
+        'processed': len(applicants),
+        'confirmed': site.confirmed_count(),
+        'requests': site.requests,
+        'ready_seconds': round(ready_seconds, 3),
+        'run_seconds': round(run_seconds, 3),
+        'records_per_second': round(len(applicants) / run_seconds, 2) if run_seconds else None,
+        'spans': metrics.summary(),
+        'waits': waits,
+    }
+
+
+def print_result(result: dict) -> None:
+    """計測結果を表示（処理段階は合計時間の長い順）"""
+    print(f"\n=== {result['mode']} ===")
+    print(
+        f"処理件数: {result['processed']}/{result['records']}件 / 確認完了: {result['confirmed']}件 / "
+        f"リクエスト: {result['requests']}回"
+    )
+    print(
+        f"準備: {result['ready_seconds']:.2f}秒 / 処理: {result['run_seconds']:.2f}秒 / "
+        f"{result['records_per_second']}件/秒"
+    )
+    for name, stat in sorted(result['spans'].items(), key=lambda item: -item[1]['total']):
+        print(
+            f"  {name:40s} {stat['count']:6d}回 合計{stat['total']:8.2f}秒 "
+            f"p50 {stat['p50']:.3f} p95 {stat['p95']:.3f} 最大 {stat['max']:.3f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='スタブの管理画面に対するブラウザ操作のベンチマーク')
+    parser.add_argument('--records', type=int, default=100, help='スタブのレコード数')
+    parser.add_argument('--per-page', type=int, default=20, help='1ページのレコード数')
+    parser.add_argument('--latency', type=float, default=0.0, help='各リクエストの応答遅延（秒）')
+    parser.add_argument('--update-latency', type=float, default=None, help='更新リクエストの応答遅延（秒）')
+    parser.add_argument('--jitter', type=float, default=0.0, help='応答遅延のばらつきの最大秒数')
+    parser.add_argument('--seed', type=int, default=0, help='レコード生成の乱数シード')
+    parser.add_argument('--modes', default='batch,id', help=f"計測する処理方法（カンマ区切り: {', '.join(MODES)}）")
+    parser.add_argument('--auto-update', action='store_true', help='更新を確定する（スタブのレコードが確認完了になる）')
+    parser.add_argument('--no-bulk-check', dest='bulk_check', action='store_false', help='一括処理でページ単位の一括チェックを使わない')
+    parser.add_argument('--headed', action='store_true', help='ブラウザを表示する')
+    parser.add_argument('--output', type=Path, default=None, help='結果のJSONの出力先')
+    args = parser.parse_args()
+
+    modes = [mode.strip() for mode in args.modes.split(',') if mode.strip()]
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        parser.error(f"不明な処理方法: {', '.join(unknown)}")
+
+    results = []
+    for mode in modes:
+        result = run_mode(mode, args)
+        print_result(result)
+        results.append(result)
+
+    output = args.output or PROJECT_ROOT / 'benchmarks' / 'results' / f"e2e_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({'args': {k: str(v) for k, v in vars(args).items()}, 'results': results}, f, ensure_ascii=False, indent=2)
+    print(f"\n結果を出力しました: {output}")
+
+
+if __name__ == '__main__':
+    main()
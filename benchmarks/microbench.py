@@ -0,0 +1,235 @@
+"""
+ブラウザを使わない処理（パターン判定・スキップ判定・スプレッドシートの行作成・集計・Slack通知の作成）の
+マイクロベンチマーク
+
+benchmarks/workload.py の合成データを件数（scale）ごとに生成し、各処理の1件あたりの時間を計測する。
+結果はJSONに出力し、--baseline を指定した場合は基準の結果と比較して、
+1件あたりの時間が --threshold を超えて悪化した処理があれば終了コード1で終了する。
+（計測中はログ出力を止め、処理そのものの時間を計測する）
+
+使用例:
+    python benchmarks/microbench.py --scales 1000,10000,100000 --save-baseline benchmarks/baseline.json
+    python benchmarks/microbench.py --baseline benchmarks/baseline.json --threshold 0.2
+"""
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PROJECT_ROOT))
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from src.modules.adoption import Adoption
+from src.modules.checker import ApplicantChecker
+from src.modules.logger import Logger
+from src.utils.metrics import metrics
+from src.utils.notifications import Notifier
+from tests.stub_admin import JUDGE_LIST_CSV
+from workload import SELECTORS_CSV, generate_applicants
+
+
+def build_checker(directory: Path, use_judge_list: bool = False) -> ApplicantChecker:
+    """一時ディレクトリのCSVを使用するApplicantChecker"""
+    selectors = directory / 'selectors.csv'
+    judge_list = directory / 'judge_list.csv'
+    selectors.write_text(SELECTORS_CSV, encoding='utf-8')
+    judge_list.write_text(JUDGE_LIST_CSV, encoding='utf-8')
+    checker = ApplicantChecker(selectors, judge_list)
+    checker.use_judge_list = use_judge_list
+    return checker
+
+
+def aggregate_stats(applicants, include_pattern_99=False):
+    """Runtime.run と同じパターン別の集計"""
+    pattern_counts = Counter(applicant['pattern'] for applicant in applicants if 'pattern' in applicant)
+    return {
+        'total': len(applicants),
+        'patterns': {k: v for k, v in pattern_counts.items() if k != '99' or include_pattern_99}
+    }
+
+
+def make_benchmarks(applicants, checker, judge_checker, adoption, notifier):
+    """
+    計測する処理の一覧を作成
+
+    Returns:
+        dict: {名前: (処理の関数, 処理件数)}
+    """
+    current_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    stats = aggregate_stats(applicants)
+    # Slack通知の作成は件数によらず1回分の処理のため、件数1,000件ごとに1回として計測する
+    notify_count = max(1, len(applicants) // 1000)
+
+    def check_pattern():
+        for applicant in applicants:
+            checker.check_pattern(applicant)
+
+    def check_pattern_judge_list():
+        for applicant in applicants:
+            judge_checker.check_pattern(applicant)
+
+    def classify_many():
+        checker.classify_many(applicants)
+
+    def should_skip():
+        for applicant in applicants:
+            adoption._should_skip_confirmation_process(applicant)
+
+    def build_rows():
+        for i, applicant in enumerate(applicants):
+            Logger._build_row(i + 2, current_date, applicant)
+
+    def counter_stats():
+        aggregate_stats(applicants)
+
+    def notifier_blocks():
+        for _ in range(notify_count):
+            notifier.build_payload('success', stats=stats, spreadsheet_key='benchmark')
+
+    return {
+        'checker.check_pattern': (check_pattern, len(applicants)),
+        'checker.check_pattern[judge_list]': (check_pattern_judge_list, len(applicants)),
+        'checker.classify_many': (classify_many, len(applicants)),
+        'adoption.should_skip_confirmation': (should_skip, len(applicants)),
+        'logger.build_row': (build_rows, len(applicants)),
+        'stats.counter': (counter_stats, len(applicants)),
+        'notifier.build_payload': (notifier_blocks, notify_count),
+    }
+
+
+def measure(func, ops: int, repeat: int) -> dict:
+    """
+    処理を repeat 回実行し、最短・中央値と1件あたりの時間を求める
+
+    Returns:
+        dict: {ops, best_s, median_s, per_op_us}
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    return {
+        'ops': ops,
+        'best_s': round(best, 6),
+        'median_s': round(statistics.median(timings), 6),
+        'per_op_us': round(best / ops * 1e6, 4),
+    }
+
+
+def run(scales, repeat: int, seed: int) -> dict:
+    """
+    全ての件数で全ての処理を計測
+
+    Returns:
+        dict: {処理名: {件数: 計測結果}}
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        checker = build_checker(directory)
+        judge_checker = build_checker(directory, use_judge_list=True)
+        adoption = Adoption(None, checker.get_selectors(), checker=checker)
+        notifier = Notifier('http://localhost/benchmark')
+
+        for scale in scales:
+            applicants = generate_applicants(scale, seed=seed)
+            # 行作成・集計はパターン判定後のデータを使用する（計測対象外）
+            for applicant, (pattern, reason) in zip(applicants, checker.classify_many(applicants)):
+                applicant['pattern'] = str(pattern)
+                applicant['pattern_reason'] = reason
+
+            benchmarks = make_benchmarks(applicants, checker, judge_checker, adoption, notifier)
+            logging.disable(logging.CRITICAL)
+            try:
+                for name, (func, ops) in benchmarks.items():
+                    results.setdefault(name, {})[str(scale)] = measure(func, ops, repeat)
+            finally:
+                logging.disable(logging.NOTSET)
+                # check_pattern などの span の記録が件数分たまるため、件数ごとにクリアする
+                metrics.reset()
+            for name in benchmarks:
+                stat = results[name][str(scale)]
+                print(f"{name:38s} {scale:>9,d}件 {stat['per_op_us']:10.3f}µs/件 (最短 {stat['best_s']:.4f}秒)")
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    基準の結果と比較し、1件あたりの時間が threshold を超えて悪化した処理を求める
+
+    Args:
+        results: 今回の結果（run の戻り値）
+        baseline: 基準の結果
+        threshold: 許容する悪化の割合（0.2 = 20%）
+
+    Returns:
+        list: (処理名, 件数, 基準のµs/件, 今回のµs/件, 比率) のリスト
+    """
+    regressions = []
+    for name, scales in results.items():
+        for scale, stat in scales.items():
+            base = baseline.get(name, {}).get(scale)
+            if not base or not base['per_op_us']:
+                continue
+            ratio = stat['per_op_us'] / base['per_op_us']
+            if ratio > 1 + threshold:
+                regressions.append((name, scale, base['per_op_us'], stat['per_op_us'], round(ratio, 3)))
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='ブラウザを使わない処理のマイクロベンチマーク')
+    parser.add_argument('--scales', default='1000,10000,100000', help='件数（カンマ区切り、最大1000000程度）')
+    parser.add_argument('--repeat', type=int, default=3, help='各処理の繰り返し回数（最短の時間を採用）')
+    parser.add_argument('--seed', type=int, default=0, help='合成データの乱数シード')
+    parser.add_argument('--output', type=Path, default=None, help='結果のJSONの出力先')
+    parser.add_argument('--baseline', type=Path, default=None, help='比較する基準の結果（JSON）')
+    parser.add_argument('--threshold', type=float, default=0.2, help='許容する悪化の割合（0.2 = 20%%）')
+    parser.add_argument('--save-baseline', type=Path, default=None, help='今回の結果を基準として保存する')
+    args = parser.parse_args()
+
+    scales = [int(scale) for scale in args.scales.split(',') if scale.strip()]
+    results = run(scales, args.repeat, args.seed)
+    report = {
+        'meta': {
+            'created_at': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+
+    output = args.output or PROJECT_ROOT / 'benchmarks' / 'results' / f"microbench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    for path in filter(None, [output, args.save_baseline]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n結果を出力しました: {output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ 基準より{args.threshold:.0%}以上遅くなった処理があります:")
+            for name, scale, base, current, ratio in regressions:
+                print(f"  {name} {scale}件: {base}µs/件 -> {current}µs/件 (x{ratio})")
+            return 1
+        print(f"\n✅ 基準からの悪化はありません（許容: {args.threshold:.0%}）")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
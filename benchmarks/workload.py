@@ -0,0 +1,105 @@
+"""
+ブラウザを使わないベンチマーク用の応募者データ（合成データ）の生成
+
+実際の検索結果と同じ項目（status, training_start_date, zaiseki, oiwai, remark など）を、
+全てのステータス・「未定」・不正な日付・在籍確認の〇/×・備考の有無を含む分布で生成する。
+"""
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional
+import random
+
+# (値, 重み)
+STATUS_WEIGHTS = [
+    ('採用', 40), ('保留', 10), ('不合格', 10), ('連絡取れず', 8),
+    ('辞退', 8), ('欠席', 6), ('選考中', 14), ('', 4),
+]
+ZAISEKI_WEIGHTS = [('', 50), ('〇', 30), ('×', 15), ('×（退職）', 5)]
+OIWAI_WEIGHTS = [('', 80), ('済', 15), ('未', 5)]
+REMARK_WEIGHTS = [('', 85), ('研修日調整中', 8), ('本人都合で延期', 5), ('  ', 2)]
+MALFORMED_DATES = ['2024/13/45', '2024-02-30', '未設', '24/4/1', 'abc', '']
+
+SELECTORS_CSV = """page,element,description,action_type,selector_type,selector_value
+adoption,status,ステータス,select,css_selector,select.status
+"""
+
+
+def _choices(rng: random.Random, weights, count: int) -> List[str]:
+    """重み付きで count 個を選択"""
+    values, w = zip(*weights)
+    return rng.choices(values, weights=w, k=count)
+
+
+def _training_dates(rng: random.Random, today: date, count: int) -> List[str]:
+    """研修初日（未定・実行月以降・1ヶ月以上経過・その間・不正な値）を count 個生成"""
+    month_start = today.replace(day=1)
+    dates = []
+    for kind in rng.choices(['undecided', 'from_month', 'elapsed', 'between', 'malformed'],
+                            weights=[25, 25, 25, 20, 5], k=count):
+        if kind == 'undecided':
+            dates.append('未定')
+            continue
+        if kind == 'malformed':
+            dates.append(rng.choice(MALFORMED_DATES))
+            continue
+        if kind == 'from_month':
+            value = month_start + timedelta(days=rng.randint(0, 90))
+        elif kind == 'elapsed':
+            value = today - timedelta(days=rng.randint(32, 400))
+        else:
+            value = today - timedelta(days=rng.randint(1, 27))
+        dates.append(value.strftime(rng.choice(['%Y/%m/%d', '%Y-%m-%d'])))
+    return dates
+
+
+def iter_applicants(count: int, seed: int = 0, today: Optional[date] = None,
+                    chunk_size: int = 100_000) -> Iterator[Dict]:
+    """
+    応募者データを1件ずつ生成（100万件でも chunk_size 件ずつ乱数を引く）
+
+    Args:
+        count: 件数
+        seed: 乱数のシード（同じシードからは同じデータ）
+        today: 研修初日の基準日（未指定時は今日）
+        chunk_size: まとめて乱数を引く件数
+
+    Yields:
+        Dict: 応募者データ（id, application_id, applicant_name, status, training_start_date, zaiseki, oiwai, remark, pattern_reason）
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    for offset in range(0, count, chunk_size):
+        size = min(chunk_size, count - offset)
+        columns = zip(
+            _choices(rng, STATUS_WEIGHTS, size),
+            _training_dates(rng, today, size),
+            _choices(rng, ZAISEKI_WEIGHTS, size),
+            _choices(rng, OIWAI_WEIGHTS, size),
+            _choices(rng, REMARK_WEIGHTS, size),
+        )
+        for i, (status, training_start_date, zaiseki, oiwai, remark) in enumerate(columns, offset):
+            yield {
+                'id': str(100000 + i),
+                'application_id': str(500000 + i),
+                'applicant_name': f"応募者{i + 1}",
+                'status': status,
+                'training_start_date': training_start_date,
+                'zaiseki': zaiseki,
+                'oiwai': oiwai,
+                'remark': remark,
+                'pattern_reason': '',
+            }
+
+
+def generate_applicants(count: int, seed: int = 0, today: Optional[date] = None) -> List[Dict]:
+    """
+    応募者データのリストを生成
+
+    Args:
+        count: 件数（1,000〜1,000,000件程度を想定）
+        seed: 乱数のシード
+        today: 研修初日の基準日（未指定時は今日）
+
+    Returns:
+        List[Dict]: 応募者データのリスト
+    """
+    return list(iter_applicants(count, seed, today))
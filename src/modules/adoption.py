@@ -2,10 +2,94 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.select import Select
 from datetime import datetime
+import logging
+from ..utils.logging_config import get_logger, log_event
+from ..utils.metrics import metrics
+from .table_parser import normalize_record, snapshot_locator, snapshot_spec
 import time
-from ..utils.logging_config import get_logger
 import traceback
 
+# 検索結果テーブルの全レコードを1回のexecute_scriptで取得するスクリプト
+# arguments[0]: table_parser.snapshot_spec() が返す {要素名: [方式('css'|'xpath'), 値]} の辞書
+# 戻り値: テーブルが無い場合はnull、それ以外はレコードごとの辞書の配列（要素が無い項目はnull）
+SNAPSHOT_SCRIPT = """
+var spec = arguments[0];
+var table = document.querySelector("#recruitment-list table.table-sm");
+if (!table) { return null; }
+var rows = table.querySelectorAll("tbody > tr");
+
+function find(row, locator) {
+    if (!row || !locator) { return null; }
+    if (locator[0] === 'xpath') {
+        return document.evaluate(
+            locator[1], row, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    return row.querySelector(locator[1]);
+}
+function text(el) {
+    if (!el) { return null; }
+    return (el.innerText || el.textContent || '').trim();
+}
+function selectedText(el) {
+    if (!el) { return null; }
+    if (el.tagName === 'SELECT') {
+        var option = el.options[el.selectedIndex];
+        return option ? option.text.trim() : '';
+    }
+    return text(el);
+}
+
+var records = [];
+for (var i = 0; i + 2 < rows.length; i += 3) {
+    var row1 = rows[i], row2 = rows[i + 1], row3 = rows[i + 2];
+    var training = find(row1, spec.training_start_date);
+    var checkbox = find(row3, spec.confirm_checkbox);
+    records.push({
+        index: i / 3,
+        id: text(find(row1, spec.applicant_id)),
+        application_id: text(row1.querySelector("td:nth-child(2)")),
+        applicant_name: text(row1.querySelector("td:nth-child(3)")),
+        status: selectedText(find(row1, spec.status)),
+        training_start_date: training ? (training.getAttribute('data-value') || '') : null,
+        zaiseki: selectedText(find(row2, spec.zaiseki_ok)),
+        oiwai: text(find(row3, spec.celebration)),
+        pattern_reason: text(find(row3, spec.pattern_reason)),
+        remark: text(find(row3, spec.remark)),
+        checked: checkbox ? !!checkbox.checked : null
+    });
+}
+return records;
+"""
+
+# 検索結果（#recruitment-list）のHTMLとページのURLを取得するスクリプト（スナップショットの保存用）
+ARCHIVE_SCRIPT = """
+var list = document.querySelector("#recruitment-list");
+return list ? [list.outerHTML, location.href] : null;
+"""
+
+# 応募者ごとのイベント（record）に出力する項目
+RECORD_EVENT_FIELDS = (
+    'id', 'status', 'training_start_date', 'zaiseki', 'oiwai', 'remark',
+    'pattern', 'pattern_reason', 'confirm_checkbox', 'confirm_onoff'
+)
+
+def log_record_event(logger, applicant_data, elapsed):
+    """
+    応募者1件の取得値・判定結果・操作内容を1件のイベント（record）として出力
+
+    Args:
+        logger: 出力先のロガー
+        applicant_data: 処理した応募者データ
+        elapsed: 処理時間（秒）
+    """
+    log_event(
+        logger,
+        'record',
+        elapsed_ms=round(elapsed * 1000, 1),
+        **{key: applicant_data.get(key) for key in RECORD_EVENT_FIELDS}
+    )
+
 class Adoption:
     def __init__(self, browser, selectors, checker=None, env=None):
         """
@@ -24,6 +108,7 @@ class Adoption:
         self.check_changes_made = False
         self.logger = get_logger(__name__)
         
+    @metrics.timed('adoption.check_search_results')
     def check_search_results(self):
         """
         検索結果を確認
@@ -39,7 +124,8 @@ class Adoption:
                     "#recruitment-list table.table-sm"
                 ))
             )
-            time.sleep(2)
+            # テーブルの描画が落ち着くまで待機
+            self.browser.ready.dom_quiet('adoption.check_search_results')
             self.logger.info("✅ テーブルの読み込み完了")
 
             # 検索結果の確認
@@ -71,22 +157,298 @@ class Adoption:
             self.logger.error(f"❌ 検索結果の確認でエラー: {str(e)}")
             return False, 0
 
-    def process_record(self, rows, record_index):
+    def _snapshot_locator(self, element):
+        """
+        selectors.csvの定義をスナップショット用のロケーターに変換
+
+        Args:
+            element: セレクター定義の要素名
+
+        Returns:
+            list: ['css' または 'xpath', セレクター値]。定義が無い場合はNone
+        """
+        return snapshot_locator(self.selectors, element)
+
+    def _snapshot_spec(self):
+        """スナップショットスクリプトに渡すロケーター定義を作成"""
+        return snapshot_spec(self.selectors)
+
+    @metrics.timed('adoption.snapshot_page')
+    def snapshot_page(self):
+        """
+        現在のページの全レコードを1回のexecute_scriptでまとめて取得
+
+        レコードごとに find_element / Select / get_attribute を呼ぶと
+        その都度chromedriverへの往復が発生するため、テーブル全体をブラウザ側で読み取る。
+
+        Returns:
+            list: レコードごとの辞書のリスト（id, application_id, applicant_name, status,
+                  training_start_date, zaiseki, oiwai, pattern_reason, remark, checked）。
+                  取得に失敗した場合はNone
+        """
+        try:
+            records = self.browser.driver.execute_script(SNAPSHOT_SCRIPT, self._snapshot_spec())
+            if records is None:
+                self.logger.warning("スナップショット対象のテーブルが見つかりません")
+                return None
+
+            snapshot = [normalize_record(record) for record in records]
+
+            self.logger.info(f"✅ スナップショット取得: {len(snapshot)}件")
+            return snapshot
+
+        except Exception as e:
+            self.logger.error(f"❌ スナップショットの取得でエラー: {str(e)}")
+            return None
+
+    @metrics.timed('adoption.archive_page')
+    def archive_page(self, snapshot=None):
+        """
+        現在のページの検索結果（#recruitment-list）のHTMLをスナップショットとして保存
+
+        Args:
+            snapshot: snapshot_pageで取得したレコード（取得時の判定結果として一緒に保存する）
+
+        Returns:
+            Path: 保存したファイル。保存しなかった場合はNone
+        """
+        archive = getattr(self.browser, 'snapshot_archive', None)
+        if archive is None or not archive.enabled:
+            return None
+        try:
+            result = self.browser.driver.execute_script(ARCHIVE_SCRIPT)
+            if not result:
+                return None
+            html, url = result
+
+            decisions = []
+            if snapshot and self.checker:
+                for record, (pattern, reason) in zip(snapshot, self.checker.classify_many(snapshot)):
+                    decisions.append({
+                        'id': record.get('id'),
+                        'application_id': record.get('application_id'),
+                        'pattern': pattern,
+                        'pattern_reason': reason
+                    })
+            return archive.save(html, url=url, decisions=decisions)
+
+        except Exception as e:
+            self.logger.warning(f"スナップショットの保存に失敗: {str(e)}")
+            return None
+
+    def classify_records(self, records):
+        """
+        ページ内のレコードをまとめてパターン判定（状態ストアで前回から変化が無いと分かるレコードは判定しない）
+
+        Args:
+            records: snapshot_page / get_applicant_info で取得したレコードのリスト
+
+        Returns:
+            tuple: (classifications, unchanged)
+                   classifications: records と同じ順の (パターン, 判定理由)。判定を省略したレコードは保存した判定結果
+                   unchanged: 判定を省略したレコードのインデックスと、保存した {pattern, pattern_reason, action}
+        """
+        store = getattr(self.browser, 'state_store', None)
+        if store is None or not store.enabled:
+            return self.checker.classify_many(records), {}
+
+        rules = self.checker.rules_signature()
+        unchanged = store.unchanged(records, rules)
+        targets = [record for index, record in enumerate(records) if index not in unchanged]
+        results = iter(self.checker.classify_many(targets))
+        classifications = []
+        decided = []
+        for index, record in enumerate(records):
+            if index in unchanged:
+                classifications.append((unchanged[index]['pattern'], unchanged[index]['pattern_reason']))
+                continue
+            pattern, reason = next(results)
+            classifications.append((pattern, reason))
+            decided.append(dict(record, pattern=pattern, pattern_reason=reason))
+        store.record(decided, rules)
+        return classifications, unchanged
+
+    def unchanged_applicant(self, record, decision):
+        """
+        判定を省略したレコードの応募者データを、保存した判定結果・操作から作成（応募IDごとの処理用）
+
+        応募ID検索・チェックを行わずに、_check_and_record_applicant と同じ項目で記録・通知に出力する。
+
+        Args:
+            record: snapshot_page / get_applicant_info で取得したレコード
+            decision: StateStore.unchanged が返した {pattern, pattern_reason, action}
+
+        Returns:
+            dict: 応募者データ
+        """
+        applicant_data = {
+            key: record.get(key, '')
+            for key in ['application_id', 'applicant_name', 'status', 'training_start_date', 'zaiseki', 'oiwai', 'remark']
+        }
+        applicant_data['id'] = applicant_data['application_id']
+        applicant_data['pattern'] = str(decision['pattern'])
+        applicant_data['pattern_reason'] = decision['pattern_reason']
+        if decision['action'] == 'スキップ':
+            applicant_data['confirm_checkbox'] = 'スキップ'
+            applicant_data['confirm_onoff'] = 'スキップ（備考欄記載あり）'
+        else:
+            applicant_data['confirm_checkbox'] = 'パターン99'
+            applicant_data['confirm_onoff'] = 'パターン99対象外'
+        log_record_event(self.logger, applicant_data, 0)
+        return applicant_data
+
+    def record_state(self, applicants):
+        """
+        処理した応募者データの判定結果・操作を状態ストアに保存
+
+        Args:
+            applicants: process_record / _check_and_record_applicant で処理した応募者データのリスト
+        """
+        store = getattr(self.browser, 'state_store', None)
+        if store is not None and store.enabled:
+            store.record(applicants, self.checker.rules_signature())
+
+    def _applicant_data_from_snapshot(self, record):
+        """
+        スナップショットのレコードをprocess_recordで扱う応募者データに変換
+
+        Args:
+            record: snapshot_pageが返したレコード
+
+        Returns:
+            dict: 応募者データ。応募IDが取得できていない場合はNone
+        """
+        if not record.get('id'):
+            self.logger.error(f"❌ 応募IDの取得に失敗: {record.get('index', 0) + 1}レコード目")
+            return None
+
+        applicant_data = {
+            key: record[key]
+            for key in ['id', 'application_id', 'status', 'training_start_date', 'zaiseki', 'oiwai', 'pattern_reason', 'remark']
+        }
+        self.logger.debug(
+            "応募ID: %s / ステータス: %s / 研修初日: %s / 在籍確認: %s / お祝い: %s / 備考: %s",
+            applicant_data['id'], applicant_data['status'], applicant_data['training_start_date'],
+            applicant_data['zaiseki'], applicant_data['oiwai'], applicant_data['remark']
+        )
+        return applicant_data
+
+    def process_record(self, rows, record_index, snapshot=None, defer_check=False, classification=None):
         """
         1レコード分の情報を処理
         
         Args:
             rows: テーブルの行要素リスト
             record_index: レコードのインデックス
+            snapshot: snapshot_pageで取得済みのレコード情報（指定時は要素の再取得を行わない）
+            defer_check: Trueの場合はチェックボックスを操作せず、チェック対象のconfirm_checkboxを空のまま返す
+                         （process_page_bulkでページ単位にまとめてチェックする）
+            classification: classify_manyで判定済みの (パターン, 判定理由)（指定時は判定を省略）
             
         Returns:
             dict: 処理したレコードの情報
         """
         try:
+            started = time.perf_counter()
             record_offset = record_index * 3
-            self.logger.info(f"\n=== {record_index + 1}レコード目の情報取得とパターン分析 ===")
+            self.logger.debug("=== %sレコード目の情報取得とパターン分析 ===", record_index + 1)
             
             # データ収集
+            if snapshot is not None:
+                applicant_data = self._applicant_data_from_snapshot(snapshot)
+            else:
+                applicant_data = self._extract_record_data(rows, record_index)
+            if applicant_data is None:
+                return None
+
+            # パターン判定
+            if classification is not None:
+                pattern, reason = classification
+            else:
+                pattern, reason = self.checker.check_pattern(applicant_data)
+            self.logger.debug("判定結果: パターン%s（%s）", pattern, reason)
+            
+            # パターン情報を追加
+            applicant_data['pattern'] = str(pattern)
+            
+            # パターン判定理由を追加（pattern_reason - パターン判定の結果を格納）
+            self.logger.debug("パターン判定理由を更新: %r -> %r", applicant_data.get('pattern_reason'), reason)
+            applicant_data['pattern_reason'] = reason
+            
+            # 備考欄が設定されていない場合は空文字を設定（remark - ユーザーが入力する備考欄）
+            if 'remark' not in applicant_data:
+                applicant_data['remark'] = ''
+                self.logger.debug("備考欄(remark): 未設定のため空文字を設定")
+            
+            # お祝いフラグが未設定の場合は空文字で初期化
+            if 'oiwai' not in applicant_data:
+                applicant_data['oiwai'] = ''
+            
+            applicant_data['confirm_checkbox'] = ''
+            applicant_data['confirm_onoff'] = ''
+
+            # スキップ条件をチェック
+            should_skip = self._should_skip_confirmation_process(applicant_data)
+            
+            # パターン99以外かつスキップ条件に該当しない場合の処理
+            if pattern != 99 and not should_skip and defer_check:
+                # チェックボックスの操作は呼び出し元でまとめて行う
+                self.logger.debug("チェック対象としてページ単位の一括チェックに回します")
+            elif pattern != 99 and not should_skip:
+                # チェックボックスの操作
+                selector_type = self.selectors['confirm_checkbox']['selector_type'].upper()
+                selector_value = self.selectors['confirm_checkbox']['selector_value']
+                
+                # browser.pyのclick_checkboxメソッドを使用
+                click_success = self.browser.click_checkbox(
+                    rows[record_offset + 2], 
+                    selector_value, 
+                    max_retries=3
+                )
+                
+                if click_success:
+                    applicant_data['confirm_checkbox'] = 'チェック'
+                    self.check_changes_made = True
+                    
+                    # auto_updateの設定を取得して更新状態を設定
+                    auto_update = self.env.get_config_value('BROWSER', 'auto_update', default=False)
+                    applicant_data['confirm_onoff'] = '更新' if auto_update else '更新キャンセル'
+                else:
+                    applicant_data['confirm_checkbox'] = 'エラー'
+            elif should_skip:
+                # スキップ条件に該当する場合
+                applicant_data['confirm_checkbox'] = 'スキップ'
+                applicant_data['confirm_onoff'] = 'スキップ（備考欄記載あり）'
+                self.logger.debug("確認完了処理をスキップしました（スキップ条件に該当）")
+            elif pattern == 99:
+                # パターン99の場合（従来通り）
+                self.logger.debug("パターン99のため確認完了処理をスキップ")
+                applicant_data['confirm_checkbox'] = 'パターン99'
+                applicant_data['confirm_onoff'] = 'パターン99対象外'
+
+            # 一括チェックに回した場合はチェック後にprocess_page_bulkで出力
+            if not defer_check:
+                log_record_event(self.logger, applicant_data, time.perf_counter() - started)
+            return applicant_data
+
+        except Exception as e:
+            self.logger.error(f"❌ レコード処理でエラー: {str(e)}")
+            return None
+
+    @metrics.timed('adoption.extract_record')
+    def _extract_record_data(self, rows, record_index):
+        """
+        WebDriverの要素操作で1レコード分の情報を取得（snapshot_pageが使えない場合の経路）
+        
+        Args:
+            rows: テーブルの行要素リスト
+            record_index: レコードのインデックス
+            
+        Returns:
+            dict: 取得したレコードの情報。応募IDが取得できない場合はNone
+        """
+        try:
+            record_offset = record_index * 3
             applicant_data = {}
             
             # 応募IDを取得
@@ -97,7 +459,7 @@ class Adoption:
                     getattr(By, selector_type), selector_value
                 ).text.strip()
                 applicant_data['id'] = applicant_id
-                self.logger.info(f"✅ {self.selectors['applicant_id']['description']}: {applicant_id}")
+                self.logger.debug("%s: %s", self.selectors['applicant_id']['description'], applicant_id)
             except Exception as e:
                 self.logger.error(f"❌ 応募IDの取得に失敗: {str(e)}")
                 return None
@@ -109,7 +471,7 @@ class Adoption:
                 getattr(By, selector_type), selector_value
             ))
             applicant_data['status'] = status_select.first_selected_option.text
-            self.logger.info(f"✅ {self.selectors['status']['description']}: {applicant_data['status']}")
+            self.logger.debug("%s: %s", self.selectors['status']['description'], applicant_data['status'])
             
             # 研修初日取得
             try:
@@ -126,7 +488,7 @@ class Adoption:
                     training_date = '未定'
                 
                 applicant_data['training_start_date'] = training_date
-                self.logger.info(f"✅ {self.selectors['training_start_date']['description']}: {training_date}")
+                self.logger.debug("%s: %s", self.selectors['training_start_date']['description'], training_date)
             except Exception as e:
                 self.logger.warning(f"研修日の取得に失敗: {str(e)}")
                 applicant_data['training_start_date'] = '未定'
@@ -138,10 +500,9 @@ class Adoption:
                 getattr(By, selector_type), selector_value
             ))
             applicant_data['zaiseki'] = zaiseki_select.first_selected_option.text
-            self.logger.info(f"✅ {self.selectors['zaiseki_ok']['description']}: {applicant_data['zaiseki']}")
+            self.logger.debug("%s: %s", self.selectors['zaiseki_ok']['description'], applicant_data['zaiseki'])
             
             # 3行目の要素を取得（お祝い、パターン判定理由、管理者メモなど）
-            self.logger.info("\n【3行目】")
             for element, key in [('celebration', 'oiwai'), ('pattern_reason', 'pattern_reason'), ('remark', 'remark')]:
                 if element in self.selectors:
                     try:
@@ -159,80 +520,86 @@ class Adoption:
                             value = element_obj.text if element_info['action_type'] == 'get_text' else ''
                             
                         applicant_data[key] = value
-                        self.logger.info(f"✅ {element_info['description']}: {value}")
+                        self.logger.debug("%s: %s", element_info['description'], value)
                     except Exception as e:
                         self.logger.error(f"❌ {element_info['description']}の取得に失敗: {str(e)}")
                         applicant_data[key] = ''
 
-            # パターン判定
-            pattern, reason = self.checker.check_pattern(applicant_data)
-            self.logger.info(f"\n判定結果: パターン{pattern}")
-            self.logger.info(f"判定理由: {reason}")
-            
-            # パターン情報を追加
-            applicant_data['pattern'] = str(pattern)
-            
-            # パターン判定理由を追加（pattern_reason - パターン判定の結果を格納）
-            self.logger.info(f"DEBUG: adoption.py - パターン判定理由を設定前の値: {applicant_data.get('pattern_reason', '未設定')}")
-            applicant_data['pattern_reason'] = reason
-            self.logger.info(f"DEBUG: adoption.py - パターン判定理由を設定後 -> key: 'pattern_reason', value: '{applicant_data['pattern_reason']}'")
-            
-            # 備考欄が設定されていない場合は空文字を設定（remark - ユーザーが入力する備考欄）
-            if 'remark' not in applicant_data:
-                applicant_data['remark'] = ''
-                self.logger.info("備考欄(remark): 未設定のため空文字を設定")
-            else:
-                self.logger.info(f"備考欄(remark): {applicant_data['remark']}")
-            
-            # お祝いフラグが未設定の場合は空文字で初期化
-            if 'oiwai' not in applicant_data:
-                applicant_data['oiwai'] = ''
-            
-            applicant_data['confirm_checkbox'] = ''
-            applicant_data['confirm_onoff'] = ''
-
-            # スキップ条件をチェック
-            should_skip = self._should_skip_confirmation_process(applicant_data)
-            
-            # パターン99以外かつスキップ条件に該当しない場合の処理
-            if pattern != 99 and not should_skip:
-                # チェックボックスの操作
-                selector_type = self.selectors['confirm_checkbox']['selector_type'].upper()
-                selector_value = self.selectors['confirm_checkbox']['selector_value']
-                
-                # browser.pyのclick_checkboxメソッドを使用
-                click_success = self.browser.click_checkbox(
-                    rows[record_offset + 2], 
-                    selector_value, 
-                    max_retries=3
-                )
-                
-                if click_success:
-                    applicant_data['confirm_checkbox'] = 'チェック'
-                    self.check_changes_made = True
-                    
-                    # auto_updateの設定を取得して更新状態を設定
-                    auto_update = self.env.get_config_value('BROWSER', 'auto_update', default=False)
-                    applicant_data['confirm_onoff'] = '更新' if auto_update else '更新キャンセル'
-                else:
-                    applicant_data['confirm_checkbox'] = 'エラー'
-            elif should_skip:
-                # スキップ条件に該当する場合
-                applicant_data['confirm_checkbox'] = 'スキップ'
-                applicant_data['confirm_onoff'] = 'スキップ（備考欄記載あり）'
-                self.logger.info(f"✅ 確認完了処理をスキップしました")
-            elif pattern == 99:
-                # パターン99の場合（従来通り）
-                self.logger.info(f"パターン99のため確認完了処理をスキップ")
-                applicant_data['confirm_checkbox'] = 'パターン99'
-                applicant_data['confirm_onoff'] = 'パターン99対象外'
-
             return applicant_data
 
         except Exception as e:
-            self.logger.error(f"❌ レコード処理でエラー: {str(e)}")
+            self.logger.error(f"❌ レコード情報の取得でエラー: {str(e)}")
             return None
 
+    def process_page_bulk(self, rows, record_count, snapshot):
+        """
+        ページ内の全レコードを判定し、チェック対象（パターン1〜4かつスキップ条件に該当しない）を
+        1回のスクリプト呼び出しでまとめてチェック
+        
+        Args:
+            rows: テーブルの行要素リスト（スナップショットが無いレコードの取得に使用）
+            record_count: ページ内のレコード数
+            snapshot: snapshot_pageで取得したレコード情報のリスト
+            
+        Returns:
+            list: 処理したレコードの情報のリスト
+        """
+        applicants = []
+        targets = []
+        # ページ内のレコードをまとめてパターン判定（前回から変化が無いレコードは保存した判定結果を使用）
+        classifications, _ = self.classify_records(snapshot)
+        # applicants と同じ順の処理時間（秒）
+        elapsed = []
+        for record_index in range(record_count):
+            started = time.perf_counter()
+            record_snapshot = snapshot[record_index] if record_index < len(snapshot) else None
+            applicant_data = self.process_record(
+                rows,
+                record_index,
+                snapshot=record_snapshot,
+                defer_check=True,
+                classification=classifications[record_index] if record_snapshot is not None else None
+            )
+            if not applicant_data:
+                continue
+            elapsed.append(time.perf_counter() - started)
+            applicants.append(applicant_data)
+            # パターン99・スキップ対象はprocess_recordでconfirm_checkboxが設定済み
+            if not applicant_data['confirm_checkbox']:
+                targets.append((record_index, applicant_data))
+        
+        if targets:
+            self._bulk_check(targets)
+        for applicant_data, seconds in zip(applicants, elapsed):
+            log_record_event(self.logger, applicant_data, seconds)
+        self.record_state(applicants)
+        return applicants
+
+    def _bulk_check(self, targets):
+        """
+        チェック対象をまとめてチェックし、結果を応募者データに設定
+
+        Args:
+            targets: (レコードのインデックス, 応募者データ) のリスト
+        """
+        # チェック対象をまとめてチェックし、同じ呼び出しでチェック状態を確認
+        checked_states = self.browser.bulk_check_checkboxes(
+            [record_index for record_index, _ in targets],
+            self._snapshot_locator('confirm_checkbox')
+        )
+        auto_update = self.env.get_config_value('BROWSER', 'auto_update', default=False)
+        
+        for (record_index, applicant_data), checked in zip(targets, checked_states):
+            if checked:
+                applicant_data['confirm_checkbox'] = 'チェック'
+                applicant_data['confirm_onoff'] = '更新' if auto_update else '更新キャンセル'
+                self.check_changes_made = True
+            else:
+                applicant_data['confirm_checkbox'] = 'エラー'
+                self.logger.warning(f"❌ {record_index + 1}レコード目のチェックに失敗しました（応募ID: {applicant_data['id']}）")
+        
+        self.logger.info(f"✅ 一括チェック: {sum(1 for checked in checked_states if checked)}/{len(targets)}件")
+
     def _should_skip_confirmation_process(self, applicant_data):
         """
         確認完了処理をスキップすべきかどうかを判定
@@ -284,6 +651,7 @@ class Adoption:
             self.logger.error(f"スキップ条件判定でエラー: {str(e)}")
             return False
 
+    @metrics.timed('adoption.extract_record')
     def get_applicant_info(self, rows, record_index):
         """
         応募者情報のみを取得（チェックはしない）
@@ -336,7 +704,7 @@ class Adoption:
                     getattr(By, selector_type), selector_value
                 ))
                 applicant_data['status'] = status_select.first_selected_option.text
-                self.logger.info(f"✅ {self.selectors['status']['description']}: {applicant_data['status']}")
+                self.logger.debug("%s: %s", self.selectors['status']['description'], applicant_data['status'])
             except Exception as e:
                 self.logger.warning(f"ステータスの取得に失敗: {str(e)}")
                 applicant_data['status'] = ''
@@ -356,7 +724,7 @@ class Adoption:
                     training_date = '未定'
                 
                 applicant_data['training_start_date'] = training_date
-                self.logger.info(f"✅ {self.selectors['training_start_date']['description']}: {training_date}")
+                self.logger.debug("%s: %s", self.selectors['training_start_date']['description'], training_date)
             except Exception as e:
                 self.logger.warning(f"研修日の取得に失敗: {str(e)}")
                 applicant_data['training_start_date'] = '未定'
@@ -370,7 +738,7 @@ class Adoption:
                         getattr(By, selector_type), selector_value
                     ))
                     applicant_data['zaiseki'] = zaiseki_select.first_selected_option.text
-                    self.logger.info(f"✅ {self.selectors['zaiseki_ok']['description']}: {applicant_data['zaiseki']}")
+                    self.logger.debug("%s: %s", self.selectors['zaiseki_ok']['description'], applicant_data['zaiseki'])
                 except Exception as e:
                     self.logger.warning(f"在籍確認の取得に失敗: {str(e)}")
                     applicant_data['zaiseki'] = ''
@@ -387,7 +755,7 @@ class Adoption:
                         # ボタン要素からテキスト取得（get_attributeではなく.textを使用）
                         remark_text = remark_element.text.strip()
                         applicant_data['remark'] = remark_text
-                        self.logger.info(f"✅ {self.selectors['remark']['description']}(remark): {remark_text}")
+                        self.logger.debug("%s(remark): %s", self.selectors['remark']['description'], remark_text)
                     else:
                         applicant_data['remark'] = ''
                         self.logger.warning("備考欄(remark)取得のための3行目が存在しません")
@@ -430,11 +798,12 @@ class Adoption:
             
             # チェックボックスの操作
             selector_value = self.selectors['confirm_checkbox']['selector_value']
-            self.logger.info(f"チェックボックスのセレクター値: {selector_value}")
+            self.logger.debug("チェックボックスのセレクター値: %s", selector_value)
             
-            # デバッグ情報: 行のHTML構造を出力
-            row_html = row3.get_attribute('outerHTML')
-            self.logger.info(f"行のHTML構造: {row_html[:200]}...")  # 長すぎる場合は切り詰める
+            # デバッグ情報: 行のHTML構造を出力（取得にブラウザとの通信が発生するため、DEBUG時のみ）
+            if self.logger.isEnabledFor(logging.DEBUG):
+                row_html = row3.get_attribute('outerHTML')
+                self.logger.debug("行のHTML構造: %s...", row_html[:200])  # 長すぎる場合は切り詰める
             
             # browser.pyのclick_checkboxメソッドを使用
             click_success = self.browser.click_checkbox(
@@ -444,7 +813,7 @@ class Adoption:
             )
             
             if click_success:
-                self.logger.info(f"応募ID のチェックボックスをクリックしました")
+                self.logger.debug("応募ID のチェックボックスをクリックしました")
                 return True
             else:
                 self.logger.warning(f"応募ID のチェックボックスのクリックに失敗しました")
@@ -455,14 +824,14 @@ class Adoption:
                     self.logger.info("別の方法でチェックボックスをクリックします")
                     self.browser.driver.execute_script("""
                         var rows = document.querySelectorAll("#recruitment-list table.table-sm tbody > tr");
-                        var checkboxes = rows[2].querySelectorAll("input[type='checkbox']");
+                        var checkboxes = rows[arguments[0] * 3 + 2].querySelectorAll("input[type='checkbox']");
                         if (checkboxes.length > 0) {
                             checkboxes[0].click();
                             return true;
                         }
                         return false;
-                    """)
-                    time.sleep(1)
+                    """, record_index)
+                    self.browser.ready.dom_quiet('adoption.check_single_record.fallback')
                     return True
                 except Exception as e2:
                     self.logger.error(f"別の方法でのチェックボックスクリックにも失敗: {str(e2)}")
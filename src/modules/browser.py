@@ -3,25 +3,40 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 import configparser
-import time
+import logging
 import pandas as pd
+from urllib.parse import urlparse, parse_qsl
 from selenium.webdriver.support.select import Select
 from ..utils.environment import EnvironmentUtils as env
-from .adoption import Adoption
-from ..utils.logging_config import get_logger
+from .adoption import Adoption, log_record_event
+from .listing_fetcher import ListingFetcher, page_url
+from .readiness import Readiness
+from .session import SessionCache
+from .snapshot_archive import SnapshotArchive
+from .state_store import StateStore
+from .driver_resolver import DriverResolver
+from ..utils.logging_config import get_logger, log_event
+from ..utils.metrics import metrics
+import time
 import traceback
 
 class Browser:
     def __init__(self, settings_path='config/settings.ini', selectors_path='config/selectors.csv'):
         self.driver = None
+        self.settings_path = settings_path
+        self.selectors_path = selectors_path
         self.settings = self._load_settings(settings_path)
         self.selectors = self._load_selectors(selectors_path)
         self.wait = None
+        self.ready = None
         self.logger = get_logger(__name__)
         self.env = env()  # 環境ユーティリティのインスタンスを作成
         self.logger_instance = None  # ロガーインスタンスの初期化
+        self.snapshot_archive = SnapshotArchive()  # 検索結果ページのスナップショットの保存先
+        self.state_store = StateStore()  # 前回の実行で見た応募者の状態
+        # 応募IDの収集で、状態ストアにより応募ID検索・チェックを省略した応募者データ（応募ID: データ、出力済みはNone）
+        self._unchanged_applicants = {}
 
     def _load_settings(self, settings_path):
         """設定ファイルを読み込む"""
@@ -56,8 +71,15 @@ class Browser:
             EC.visibility_of_element_located((by_type, selector['selector_value']))
         )
 
-    def setup(self):
-        """ChromeDriverのセットアップ"""
+    @metrics.timed('browser.setup')
+    def setup(self, use_profile=True):
+        """
+        ChromeDriverのセットアップ
+        
+        Args:
+            use_profile: [SESSION] user_data_dir のChromeプロファイルを使用するかどうか
+                         （複数ブラウザを同時に起動する場合はFalse）
+        """
         self.logger.info("ブラウザのセットアップを開始")
         options = webdriver.ChromeOptions()
         options.add_argument('--ignore-certificate-errors')
@@ -66,16 +88,18 @@ class Browser:
         if self.settings.getboolean('BROWSER', 'headless', fallback=True):
             options.add_argument('--headless=new')
         
-        # ChromeDriverManagerのパスを修正
-        driver_path = ChromeDriverManager().install()
-        # THIRD_PARTY_NOTICES.chromedriverが返された場合、正しい実行ファイルパスに修正
-        if driver_path.endswith('THIRD_PARTY_NOTICES.chromedriver'):
-            import os
-            driver_path = os.path.join(os.path.dirname(driver_path), 'chromedriver.exe')
+        # セッション再利用用のChromeプロファイル（設定時のみ）
+        user_data_dir = SessionCache.get_user_data_dir() if use_profile else None
+        if user_data_dir:
+            options.add_argument(f'--user-data-dir={user_data_dir}')
+        
+        # ChromeDriverのパスを解決（Chromeのバージョンが変わっていなければキャッシュを再利用）
+        driver_path = DriverResolver().resolve()
         
         service = Service(driver_path)
         self.driver = webdriver.Chrome(service=service, options=options)
-        self.wait = WebDriverWait(self.driver, 20)
+        self.ready = Readiness(self.driver)
+        self.wait = WebDriverWait(self.driver, self.ready.max_timeout)
         self.driver.maximize_window()
 
     def login(self, url, basic_auth, login_credentials):
@@ -86,20 +110,18 @@ class Browser:
         auth_url = f'https://{basic_auth["id"]}:{basic_auth["password"]}@{base_url}/login'
         
         self.driver.get(auth_url)
-        time.sleep(2)
+        self.ready.document_ready('browser.login.open')
 
-        # ログインフォームの入力
+        # ログインフォームの入力（_get_elementが表示を待機する）
         username_field = self._get_element('login', 'username')
         username_field.send_keys(login_credentials['id'])
-        time.sleep(1)
         
         password_field = self._get_element('login', 'password')
         password_field.send_keys(login_credentials['password'])
-        time.sleep(1)
         
         submit_button = self._get_element('login', 'submit_button')
         submit_button.click()
-        time.sleep(3)
+        self.ready.network_idle('browser.login.submit')
 
     def go_to_adoptions(self, test_mode=False):
         """応募者一覧ページへ遷移"""
@@ -114,12 +136,12 @@ class Browser:
             params = '&'.join([f'{k}={v}' for k, v in base_params.items()])
             search_url = f"{self.settings.get('URL', 'base_url')}/admin/adoptions?{params}"
             
-            print(f"DEBUG: 応募者一覧ページへ遷移: {search_url}")
+            self.logger.debug("応募者一覧ページへ遷移: %s", search_url)
             self.driver.get(search_url)
             
-            # 要素が読み込まれるまで待機
-            self.wait.until(EC.presence_of_all_elements_located)
-            time.sleep(2)
+            # ページの読み込みと通信の完了を待機
+            self.ready.document_ready('browser.go_to_adoptions')
+            self.ready.network_idle('browser.go_to_adoptions.idle')
             
             print("応募者一覧ページへの遷移完了")
             return True
@@ -131,32 +153,35 @@ class Browser:
     def get_page_title(self):
         """ページタイトルを取得"""
         try:
-            print("DEBUG: ページタイトルの取得を試みます")
+            self.logger.debug("ページタイトルの取得を試みます")
             title_element = self._get_element('top', 'page_title')
             title_text = title_element.text
-            print(f"DEBUG: 取得したタイトル = {title_text}")
+            self.logger.debug("取得したタイトル = %s", title_text)
             return title_text
         except Exception as e:
-            print(f"DEBUG: タイトル取得でエラー: {str(e)}")
-            print(f"DEBUG: 現在のページソース: {self.driver.page_source[:500]}")
+            self.logger.error(f"タイトル取得でエラー: {str(e)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("現在のページソース: %s", self.driver.page_source[:500])
             raise
 
     def get_page_heading(self):
         """ページ見出しを取得"""
         try:
-            print("DEBUG: ページ見出しの取得を試みます")
+            self.logger.debug("ページ見出しの取得を試みます")
             heading_element = self._get_element('top', 'page_heading')
             heading_text = heading_element.text
-            print(f"DEBUG: 取得した見出し = {heading_text}")
+            self.logger.debug("取得した見出し = %s", heading_text)
             return heading_text
         except Exception as e:
-            print(f"DEBUG: 見出し取得でエラー: {str(e)}")
-            print(f"DEBUG: 現在のURL = {self.driver.current_url}")
-            print(f"DEBUG: 現在のページソース: {self.driver.page_source[:500]}")
+            self.logger.error(f"見出し取得でエラー: {str(e)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("現在のURL = %s", self.driver.current_url)
+                self.logger.debug("現在のページソース: %s", self.driver.page_source[:500])
             raise
 
     def quit(self):
         """ブラウザを終了"""
+        self.state_store.close()
         if self.driver:
             self.driver.quit()
 
@@ -199,16 +224,9 @@ class Browser:
                     selectors['search_button']['selector_value']
                 )
                 
-                # 画面上部にスクロールして要素の重なりを避ける
-                self.driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(1)
-                
-                # 検索ボタンが見えるようにスクロール
-                self.driver.execute_script(
-                    "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", 
-                    search_button
-                )
-                time.sleep(2)  # スクロール完了を待機
+                # 検索ボタンが見えるようにスクロール（即時スクロールのため待機不要）
+                self.ready.scroll_into_view(search_button)
+                table_mark = self.ready.mark_table()
                 
                 # 要素が他の要素に隠れていないか確認してからクリック
                 try:
@@ -221,8 +239,8 @@ class Browser:
                     self.driver.execute_script("arguments[0].click();", search_button)
                     self.logger.info("✅ 検索ボタンをクリックしました（JavaScriptクリック）")
                 
-                # 検索結果の読み込みを待機
-                time.sleep(3)
+                # 検索結果の再描画を待機
+                self.ready.table_rerendered('browser.search_applicants', table_mark)
                 
                 return True
                 
@@ -233,10 +251,11 @@ class Browser:
                 try:
                     # 1. フォームを直接送信
                     self.logger.info("別の方法で検索を実行します（フォーム送信）")
+                    table_mark = self.ready.mark_table()
                     self.driver.execute_script("""
                         document.querySelector('form').submit();
                     """)
-                    time.sleep(3)
+                    self.ready.table_rerendered('browser.search_applicants.form_submit', table_mark)
                     return True
                 except Exception as e2:
                     self.logger.error(f"❌ フォーム送信でもエラー: {str(e2)}")
@@ -291,7 +310,14 @@ class Browser:
             # 処理方法の設定を取得
             process_by_id = env.get_config_value('BROWSER', 'process_by_id', False)
             
-            if process_by_id:
+            if process_by_id and env.get_config_value('BROWSER', 'workers', 1) > 1:
+                # 応募IDごとの処理を複数ブラウザで並列に実行する方法
+                return self._process_by_worker_pool(checker, env, adoption, process_next_page)
+            elif process_by_id and env.get_config_value('BROWSER', 'http_listing', False) \
+                    and env.get_config_value('BROWSER', 'id_process_mode', 'search') == 'search':
+                # 検索結果の一覧はHTTPで読み取り、チェック対象の応募IDだけをブラウザで処理する方法
+                return self._process_listed_application_ids(checker, env, adoption, process_next_page)
+            elif process_by_id:
                 # 応募IDごとに処理する方法
                 return self._process_by_application_id(checker, env, adoption, process_next_page)
             else:
@@ -302,6 +328,7 @@ class Browser:
             self.logger.error(f"❌ 応募者データの処理でエラー: {str(e)}")
             return []
 
+    @metrics.timed('browser.go_to_next_page')
     def go_to_next_page(self):
         """
         次のページに移動する
@@ -324,26 +351,131 @@ class Browser:
                 return False
             
             # 次ページボタンをクリック
+            table_mark = self.ready.mark_table()
             next_page_button.click()
             
-            # モーダルダイアログが表示された場合は確認ボタンをクリック
-            try:
-                confirm_button = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "#modal-confirm_change_page button.btn-primary"))
-                )
-                confirm_button.click()
-            except Exception:
-                # モーダルが表示されない場合は無視
-                pass
-            
+            # ページ移動の確認モーダルに対応し、ページの再描画を待機
+            self._confirm_page_change(table_mark, 'browser.go_to_next_page')
             self.logger.info("次のページに移動しました")
-            time.sleep(2)  # ページ読み込みを待機
             return True
             
         except Exception as e:
             self.logger.error(f"次ページへの移動でエラー: {str(e)}")
             return False
 
+    def _confirm_page_change(self, table_mark, site):
+        """
+        ページ移動の確認モーダルが表示された場合は確認ボタンをクリックし、テーブルの再描画を待機
+        
+        Args:
+            table_mark: ページ移動前にmark_tableで付けた目印
+            site: 待機時間の集計キー
+        """
+        # モーダルが出ずにテーブルが切り替わった場合はその時点で待機を終える
+        confirm_locator = (By.CSS_SELECTOR, "#modal-confirm_change_page button.btn-primary")
+        self.ready.until(
+            f'{site}.modal',
+            lambda driver: (
+                EC.element_to_be_clickable(confirm_locator)(driver)
+                or self.ready.table_replaced(table_mark)
+            ),
+            timeout=5,
+            required=False
+        )
+        try:
+            confirm_button = self.driver.find_element(*confirm_locator)
+            if confirm_button.is_displayed():
+                confirm_button.click()
+        except Exception:
+            # モーダルが表示されない場合は無視
+            pass
+        
+        # ページの再描画を待機
+        self.ready.table_rerendered(site, table_mark)
+
+    def get_current_page(self):
+        """
+        検索結果の現在のページ番号を取得
+        
+        Returns:
+            int: ページネーションのアクティブ項目、またはURLのpageパラメータから求めたページ番号。
+                 判別できない場合はNone
+        """
+        try:
+            active = self.driver.execute_script("""
+                var active = document.querySelector('.pagination .active');
+                return active ? active.textContent.trim() : null;
+            """)
+            if active and active.isdigit():
+                return int(active)
+            
+            query = dict(parse_qsl(urlparse(self.driver.current_url).query))
+            if 'page' in query and query['page'].isdigit():
+                return int(query['page'])
+            return 1 if active is None else None
+            
+        except Exception as e:
+            self.logger.warning(f"現在のページ番号の取得に失敗: {str(e)}")
+            return None
+
+    def go_to_page(self, page_number):
+        """
+        指定したページに直接移動する
+        
+        ページネーションにそのページへのリンクがあればクリックし、
+        無ければ現在の /admin/adoptions のURLのpageパラメータを書き換えて遷移する。
+        
+        Args:
+            page_number: 移動先のページ番号（1始まり）
+            
+        Returns:
+            bool: 移動後のテーブルが指定ページを表示している場合はTrue
+        """
+        try:
+            if self.get_current_page() == page_number:
+                return True
+            
+            table_mark = self.ready.mark_table()
+            
+            # ページネーションのリンクを探す
+            link = self.driver.execute_script("""
+                var page = String(arguments[0]);
+                var pattern = new RegExp('[?&]page=' + page + '(&|$)');
+                var links = document.querySelectorAll('.pagination a');
+                for (var i = 0; i < links.length; i++) {
+                    if (links[i].textContent.trim() === page || pattern.test(links[i].href || '')) {
+                        return links[i];
+                    }
+                }
+                return null;
+            """, page_number)
+            
+            if link is not None:
+                self.driver.execute_script("arguments[0].click();", link)
+                self._confirm_page_change(table_mark, 'browser.go_to_page')
+            else:
+                # pageパラメータを書き換えたURLへ遷移
+                parsed = urlparse(self.driver.current_url)
+                if not parsed.path.rstrip('/').endswith('/adoptions'):
+                    self.logger.warning(f"採用確認ページではないためページ {page_number} に移動できません: {parsed.path}")
+                    return False
+                self.driver.get(page_url(self.driver.current_url, page_number))
+                self.ready.table_rerendered('browser.go_to_page.url', table_mark)
+            
+            # 指定ページが表示されていることを確認
+            current_page = self.get_current_page()
+            if current_page != page_number:
+                self.logger.warning(f"ページ {page_number} への移動を確認できません（現在: {current_page}）")
+                return False
+            
+            self.logger.info(f"ページ {page_number} に移動しました")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"ページ {page_number} への移動でエラー: {str(e)}")
+            return False
+
+    @metrics.timed('browser.click_checkbox')
     def click_checkbox(self, row_element, selector_value, max_retries=3):
         """
         チェックボックスをクリックする
@@ -361,28 +493,64 @@ class Browser:
                 # チェックボックスを見つける
                 checkbox = row_element.find_element(By.CSS_SELECTOR, selector_value)
                 
-                # チェックボックスが見えるようにスクロール
-                self.driver.execute_script(
-                    "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", 
-                    checkbox
-                )
-                time.sleep(1)  # スクロールが完了するまで待機
+                # チェックボックスが見えるようにスクロール（即時スクロールのため待機不要）
+                self.ready.scroll_into_view(checkbox)
                 
-                # JavaScriptを使用してクリック
+                # JavaScriptを使用してクリックし、チェック状態が切り替わるまで待機
+                was_selected = checkbox.is_selected()
                 self.driver.execute_script("arguments[0].click();", checkbox)
-                time.sleep(1)  # クリック後の処理が完了するまで待機
+                self.ready.until(
+                    'browser.click_checkbox',
+                    lambda driver: checkbox.is_selected() != was_selected,
+                    timeout=5
+                )
                 
                 return True
                 
             except Exception as e:
                 self.logger.warning(f"❌ チェックボックスの操作に失敗 (試行回数: {attempt + 1}): {str(e)}")
                 
-                # 最後の試行でなければ少し待ってリトライ
+                # 最後の試行でなければDOMが落ち着くのを待ってリトライ
                 if attempt < max_retries - 1:
-                    time.sleep(2)
+                    self.ready.dom_quiet('browser.click_checkbox.retry')
         
         return False
 
+    def bulk_check_checkboxes(self, record_indices, locator):
+        """
+        指定したレコードのチェックボックスを1回のexecute_scriptでまとめてチェックする
+        
+        既にチェック済みのものはクリックせず（チェックを外さないため）、
+        同じスクリプト内でクリック後のチェック状態を確認して返す。
+        
+        Args:
+            record_indices: チェックするレコードのインデックスのリスト（3行で1レコード）
+            locator: 3行目の行内でチェックボックスを探すロケーター ['css' または 'xpath', 値]
+            
+        Returns:
+            list: レコードごとのチェック状態（チェック済みならTrue）
+        """
+        try:
+            states = self.driver.execute_script("""
+                var indices = arguments[0], locator = arguments[1];
+                var rows = document.querySelectorAll("#recruitment-list table.table-sm tbody > tr");
+                return indices.map(function(index) {
+                    var row = rows[index * 3 + 2];
+                    if (!row) { return false; }
+                    var checkbox = locator[0] === 'xpath'
+                        ? document.evaluate(locator[1], row, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+                        : row.querySelector(locator[1]);
+                    if (!checkbox) { return false; }
+                    if (!checkbox.checked) { checkbox.click(); }
+                    return !!checkbox.checked;
+                });
+            """, list(record_indices), locator)
+            return [bool(state) for state in states]
+            
+        except Exception as e:
+            self.logger.error(f"❌ チェックボックスの一括操作でエラー: {str(e)}")
+            return [False] * len(record_indices)
+
     def _process_by_application_id(self, checker, env, adoption, process_next_page=True):
         """
         応募IDごとに処理
@@ -397,6 +565,12 @@ class Browser:
             list: 処理した応募者データのリスト
         """
         all_processed_applicants = []  # 処理した応募者データを格納するリスト
+        self._unchanged_applicants = {}
+        
+        # in_page: 表示中の検索結果から応募IDの行を探して処理し、見つからない場合のみ応募ID検索を行う
+        in_page = env.get_config_value('BROWSER', 'id_process_mode', 'search') == 'in_page'
+        # in_pageモードで処理済みの応募ID（更新キャンセル時などに同じ行を繰り返し処理しないため）
+        processed_ids = set()
         
         try:
             # 現在のページ番号を追跡
@@ -405,9 +579,14 @@ class Browser:
             # 処理を続ける限りループ
             while True:
                 self.logger.info(f"=== ページ {current_page} の処理を開始 ===")
+                page_started = time.perf_counter()
+                processed_count = len(all_processed_applicants)
                 
                 # ステップ1: 現在のページからチェック対象の応募IDを収集
                 application_ids = self._collect_application_ids(checker, adoption)
+                if in_page:
+                    application_ids = [app_id for app_id in application_ids if app_id not in processed_ids]
+                all_processed_applicants.extend(self._take_unchanged_applicants())
                 
                 # チェック対象の応募IDがない場合
                 if not application_ids:
@@ -422,24 +601,42 @@ class Browser:
                         break
                 
                 # ステップ2: 収集した応募IDを一つずつ処理
+                # （in_pageモードで応募ID検索にフォールバックした場合は、検索結果が絞り込まれた状態になる）
+                page_moved = False
                 for app_id in application_ids:
-                    result, applicant_data = self._process_single_application_id(app_id, checker, env, adoption)
+                    if in_page:
+                        if page_moved:
+                            if not self._return_to_page(current_page):
+                                break
+                            page_moved = False
+                        
+                        located, result, applicant_data = self._process_application_id_in_page(
+                            app_id, checker, env, adoption
+                        )
+                        if not located:
+                            self.logger.info(f"応募ID: {app_id} の行が表示中のページに見つからないため、応募ID検索で処理します")
+                            result, applicant_data = self._process_single_application_id(app_id, checker, env, adoption)
+                            page_moved = True
+                        processed_ids.add(app_id)
+                    else:
+                        result, applicant_data = self._process_single_application_id(app_id, checker, env, adoption)
                     if result and applicant_data:
                         all_processed_applicants.append(applicant_data)
                 
-                # ステップ3: 初期検索条件に戻る（応募IDを指定せずに検索）
-                if not self._search_by_application_id():
-                    self.logger.warning("初期検索条件への復帰に失敗しました")
-                    break
+                log_event(
+                    self.logger,
+                    'page',
+                    mode='application_id',
+                    page=current_page,
+                    targets=len(application_ids),
+                    records=len(all_processed_applicants) - processed_count,
+                    elapsed_ms=round((time.perf_counter() - page_started) * 1000, 1)
+                )
                 
-                # ステップ4: 現在のページに戻る（必要に応じて）
-                if current_page > 1:
-                    self.logger.info(f"ページ {current_page} に戻ります")
-                    # 現在のページまでページネーションを実行
-                    for i in range(1, current_page):
-                        if not self.go_to_next_page():
-                            self.logger.warning(f"ページ {current_page} への移動に失敗しました")
-                            break
+                # ステップ3・4: 初期検索条件で現在のページに戻る（in_pageモードで移動していない場合は不要）
+                if not in_page or page_moved:
+                    if not self._return_to_page(current_page):
+                        break
                 
                 # ステップ5: 同じページを再確認（処理済みの応募IDは should_check で除外される）
                 self.logger.info(f"ページ {current_page} を再確認します")
@@ -459,6 +656,279 @@ class Browser:
             traceback.print_exc()  # スタックトレースを出力
             return all_processed_applicants
 
+    def _process_listed_application_ids(self, checker, env, adoption, process_next_page=True):
+        """
+        全ページのチェック対象の応募IDを先に収集し（HTTPでの取得を優先）、応募IDごとに検索して処理
+        
+        Args:
+            checker: ApplicantCheckerクラスのインスタンス
+            env: EnvironmentUtilsクラス
+            adoption: Adoptionクラスのインスタンス
+            process_next_page: 次ページも収集するかどうか
+            
+        Returns:
+            list: 処理した応募者データのリスト
+        """
+        all_processed_applicants = []
+        self._unchanged_applicants = {}
+        started = time.perf_counter()
+        
+        try:
+            application_ids = self._collect_all_application_ids(checker, env, adoption, process_next_page)
+            all_processed_applicants.extend(self._take_unchanged_applicants())
+            if not application_ids:
+                self.logger.info("チェック対象の応募IDがありません")
+                return all_processed_applicants
+            
+            for app_id in application_ids:
+                result, applicant_data = self._process_single_application_id(app_id, checker, env, adoption)
+                if result and applicant_data:
+                    all_processed_applicants.append(applicant_data)
+            
+            log_event(
+                self.logger,
+                'page',
+                mode='listed',
+                targets=len(application_ids),
+                records=len(all_processed_applicants),
+                elapsed_ms=round((time.perf_counter() - started) * 1000, 1)
+            )
+            self.logger.info(f"✅ 全ての処理が完了しました")
+            self.logger.info(f"処理したデータ件数: {len(all_processed_applicants)}")
+            return all_processed_applicants
+            
+        except Exception as e:
+            self.logger.error(f"❌ 応募IDごとの処理でエラー: {str(e)}")
+            traceback.print_exc()  # スタックトレースを出力
+            return all_processed_applicants
+
+    def _process_by_worker_pool(self, checker, env, adoption, process_next_page=True):
+        """
+        全ページからチェック対象の応募IDを収集し、複数ブラウザで並列に処理
+        
+        Args:
+            checker: ApplicantCheckerクラスのインスタンス
+            env: EnvironmentUtilsクラス
+            adoption: Adoptionクラスのインスタンス
+            process_next_page: 次ページも収集するかどうか
+            
+        Returns:
+            list: 全ワーカーが処理した応募者データのリスト
+        """
+        # 循環importを避けるためここでimport
+        from .worker_pool import ApplicantWorkerPool
+        
+        self._unchanged_applicants = {}
+        try:
+            # ステップ1: 全ページからチェック対象の応募IDを収集（更新前にまとめて収集する）
+            application_ids = self._collect_all_application_ids(checker, env, adoption, process_next_page)
+            unchanged_applicants = self._take_unchanged_applicants()
+            
+            if not application_ids:
+                self.logger.info("チェック対象の応募IDがありません")
+                return unchanged_applicants
+            
+            # ステップ2: ワーカーごとのブラウザで並列に処理
+            pool = ApplicantWorkerPool(
+                checker,
+                env,
+                env.get_config_value('BROWSER', 'workers', 1),
+                settings_path=self.settings_path,
+                selectors_path=self.selectors_path,
+                logger_instance=self.logger_instance
+            )
+            return unchanged_applicants + pool.run(application_ids)
+            
+        except Exception as e:
+            self.logger.error(f"❌ 応募IDごとの並列処理でエラー: {str(e)}")
+            traceback.print_exc()  # スタックトレースを出力
+            return []
+
+    def _collect_all_application_ids(self, checker, env, adoption, process_next_page=True):
+        """
+        全ページからチェック対象の応募IDを収集
+        
+        [BROWSER] http_listing = true の場合はブラウザのCookieを引き継いでHTTPで全ページを取得し、
+        取得できなかった場合はブラウザで1ページずつ移動して収集する。
+        
+        Args:
+            checker: ApplicantCheckerクラスのインスタンス
+            env: EnvironmentUtilsクラス
+            adoption: Adoptionクラスのインスタンス
+            process_next_page: 次ページも収集するかどうか
+            
+        Returns:
+            list: 収集した応募IDのリスト（重複なし・ページ順）
+        """
+        if env.get_config_value('BROWSER', 'http_listing', False):
+            application_ids = self._collect_application_ids_by_http(checker, adoption, process_next_page)
+            if application_ids is not None:
+                return application_ids
+            self.logger.warning("HTTPで検索結果を取得できないため、ブラウザで収集します")
+        
+        application_ids = []
+        current_page = 1
+        while True:
+            self.logger.info(f"=== ページ {current_page} の応募IDを収集 ===")
+            for app_id in self._collect_application_ids(checker, adoption):
+                if app_id not in application_ids:
+                    application_ids.append(app_id)
+            if not process_next_page or not self.go_to_next_page():
+                break
+            current_page += 1
+        return application_ids
+
+    def _add_unchanged_applicant(self, adoption, record, decision):
+        """
+        状態ストアで変化が無いと分かったスキップ済みの応募者を、応募ID検索を行わずに出力する対象に加える
+
+        Args:
+            adoption: Adoptionクラスのインスタンス
+            record: 収集したレコード
+            decision: StateStore.unchanged が返した {pattern, pattern_reason, action}
+        """
+        app_id = record.get('application_id')
+        if app_id and app_id not in self._unchanged_applicants:
+            self._unchanged_applicants[app_id] = adoption.unchanged_applicant(record, decision)
+
+    def _take_unchanged_applicants(self):
+        """
+        _add_unchanged_applicant で加えた未出力の応募者データを取り出し、スプレッドシートに記録
+
+        Returns:
+            list: 応募者データのリスト
+        """
+        applicants = [data for data in self._unchanged_applicants.values() if data is not None]
+        self._unchanged_applicants = dict.fromkeys(self._unchanged_applicants)
+        if applicants and self.logger_instance:
+            self.logger_instance.log_applicants(applicants)
+        return applicants
+
+    def _collect_application_ids_by_http(self, checker, adoption, process_next_page=True):
+        """
+        ブラウザのCookieを引き継いだHTTPで全ページを取得し、チェック対象の応募IDを収集
+        
+        Args:
+            checker: ApplicantCheckerクラスのインスタンス
+            adoption: Adoptionクラスのインスタンス
+            process_next_page: 次ページも収集するかどうか
+            
+        Returns:
+            list: 収集した応募IDのリスト。HTTPで取得できなかった場合はNone
+        """
+        fetcher = ListingFetcher(checker.get_selectors())
+        try:
+            fetcher.load_cookies(self.driver)
+            pages = fetcher.fetch_all(self.driver.current_url, process_next_page)
+        finally:
+            fetcher.close()
+        if pages is None:
+            return None
+        
+        application_ids = []
+        for page in pages:
+            # 前回から変化が無いレコードは判定を省略（保存した判定結果を使用）
+            classifications, unchanged = adoption.classify_records(page['records'])
+            self.snapshot_archive.save(page['html'], url=page['url'], decisions=[
+                {
+                    'id': record['id'],
+                    'application_id': record['application_id'],
+                    'pattern': pattern,
+                    'pattern_reason': reason
+                }
+                for record, (pattern, reason) in zip(page['records'], classifications)
+            ])
+            targets = 0
+            for index, (record, (pattern, reason)) in enumerate(zip(page['records'], classifications)):
+                # パターン1〜4が対象
+                app_id = record['application_id']
+                if index in unchanged:
+                    # 前回スキップ条件に該当し変化が無いものは、応募ID検索を行わずに保存した結果を出力する
+                    if 1 <= pattern <= 4:
+                        self._add_unchanged_applicant(adoption, record, unchanged[index])
+                    continue
+                if 1 <= pattern <= 4 and app_id:
+                    targets += 1
+                    if app_id not in application_ids:
+                        application_ids.append(app_id)
+                        self.logger.debug("チェック対象の応募ID: %s を追加しました (パターン%s: %s)", app_id, pattern, reason)
+            self.logger.info(f"ページ {page['page']}: {len(page['records'])}件中 チェック対象 {targets}件")
+        return application_ids
+
+    def _return_to_page(self, page_number):
+        """
+        応募IDを指定せずに再検索し、指定したページに戻る
+        
+        Args:
+            page_number: 戻るページ番号
+            
+        Returns:
+            bool: 初期検索条件への復帰に成功した場合はTrue
+        """
+        # 初期検索条件に戻る（応募IDを指定せずに検索）
+        if not self._search_by_application_id():
+            self.logger.warning("初期検索条件への復帰に失敗しました")
+            return False
+        
+        # 現在のページに戻る（必要に応じて）
+        if page_number > 1:
+            self.logger.info(f"ページ {page_number} に戻ります")
+            if self.go_to_page(page_number):
+                return True
+            
+            # 直接移動できない場合は1ページ目から次ページへ順に移動
+            self.logger.info("ページ番号への直接移動に失敗したため、次ページボタンで移動します")
+            if self.get_current_page() != 1 and not self._search_by_application_id():
+                self.logger.warning("初期検索条件への復帰に失敗しました")
+                return False
+            for i in range(1, page_number):
+                if not self.go_to_next_page():
+                    self.logger.warning(f"ページ {page_number} への移動に失敗しました")
+                    break
+        return True
+
+    def _process_application_id_in_page(self, app_id, checker, env, adoption):
+        """
+        表示中の検索結果から応募IDの行を探し、その場でチェック・更新する
+        
+        Args:
+            app_id: 処理する応募ID
+            checker: ApplicantCheckerクラスのインスタンス
+            env: EnvironmentUtilsクラス
+            adoption: Adoptionクラスのインスタンス
+            
+        Returns:
+            tuple: (bool, bool, dict) - (行が見つかったか, 処理成功フラグ, 応募者データ)
+        """
+        try:
+            self.logger.debug("応募ID: %s の処理を開始（表示中のページ内）", app_id)
+            
+            # 更新後にテーブルが再描画されるため、応募IDごとに最新の状態を取得
+            snapshot = adoption.snapshot_page()
+            record = next(
+                (record for record in snapshot or [] if record['application_id'] == str(app_id)),
+                None
+            )
+            if record is None:
+                return False, False, None
+            
+            rows = self.driver.find_elements(By.CSS_SELECTOR, "#recruitment-list table.table-sm tbody > tr")
+            
+            # get_applicant_infoと同じ項目に揃える（idは_check_and_record_applicantでapplication_idから設定）
+            applicant_data = {
+                key: record[key]
+                for key in ['application_id', 'applicant_name', 'status', 'training_start_date', 'zaiseki', 'oiwai', 'remark']
+            }
+            result, applicant_data = self._check_and_record_applicant(
+                app_id, rows, record['index'], applicant_data, checker, env, adoption
+            )
+            return True, result, applicant_data
+            
+        except Exception as e:
+            self.logger.error(f"❌ 応募ID: {app_id} の処理でエラー: {str(e)}")
+            traceback.print_exc()  # スタックトレースを出力
+            return True, False, None
+
     def _collect_application_ids(self, checker, adoption):
         """
         現在のページからチェック対象の応募IDを収集
@@ -486,32 +956,49 @@ class Browser:
             )
             rows = table.find_elements(By.CSS_SELECTOR, "tbody > tr")
             
-            # 処理対象の応募IDを収集
-            application_ids = []
+            # ページ全体を1回のスクリプト呼び出しで取得（失敗時は要素ごとの取得にフォールバック）
+            snapshot = adoption.snapshot_page()
+            adoption.archive_page(snapshot)
             
+            # 応募者データを取得（チェックボックスはクリックしない）
+            records = []
             for record_index in range(record_count):
                 try:
-                    # get_applicant_info メソッドを使用して応募者データを取得（チェックボックスはクリックしない）
-                    applicant_data = adoption.get_applicant_info(rows, record_index)
+                    if snapshot is not None:
+                        applicant_data = snapshot[record_index] if record_index < len(snapshot) else None
+                    else:
+                        applicant_data = adoption.get_applicant_info(rows, record_index)
                     
                     # 応募者データが取得できた場合
                     if applicant_data and 'status' in applicant_data:
-                        # パターン判定を行う
-                        pattern, reason = checker.check_pattern(applicant_data)
-                        
-                        # パターン1〜4が対象
-                        should_check = 1 <= pattern <= 4
-                        
-                        if should_check:
-                            app_id = applicant_data.get('application_id')
-                            if app_id:
-                                application_ids.append(app_id)
-                                self.logger.info(f"チェック対象の応募ID: {app_id} を追加しました (パターン{pattern}: {reason})")
+                        records.append(applicant_data)
                 except Exception as e:
                     self.logger.error(f"レコード {record_index} の処理でエラー: {str(e)}")
                     traceback.print_exc()  # スタックトレースを出力
                     continue
             
+            # ページ内のレコードをまとめてパターン判定（前回から変化が無いレコードは保存した判定結果を使用）
+            classifications, unchanged = adoption.classify_records(records)
+            
+            # 処理対象の応募IDを収集
+            application_ids = []
+            
+            for index, (applicant_data, (pattern, reason)) in enumerate(zip(records, classifications)):
+                # パターン1〜4が対象
+                should_check = 1 <= pattern <= 4
+                
+                if index in unchanged:
+                    # 前回スキップ条件に該当し変化が無いものは、応募ID検索を行わずに保存した結果を出力する
+                    if should_check:
+                        self._add_unchanged_applicant(adoption, applicant_data, unchanged[index])
+                    continue
+                
+                if should_check:
+                    app_id = applicant_data.get('application_id')
+                    if app_id:
+                        application_ids.append(app_id)
+                        self.logger.debug("チェック対象の応募ID: %s を追加しました (パターン%s: %s)", app_id, pattern, reason)
+            
             return application_ids
             
         except Exception as e:
@@ -533,7 +1020,7 @@ class Browser:
             bool: 処理に成功した場合はTrue、失敗した場合はFalse
         """
         try:
-            self.logger.info(f"応募ID: {app_id} の処理を開始")
+            self.logger.debug("応募ID: %s の処理を開始", app_id)
             
             # 応募IDで検索
             if not self._search_by_application_id(app_id):
@@ -561,18 +1048,41 @@ class Browser:
                 self.logger.warning(f"応募ID: {app_id} のデータ取得に失敗しました")
                 return False, None
             
+            return self._check_and_record_applicant(app_id, rows, 0, applicant_data, checker, env, adoption)
+            
+        except Exception as e:
+            self.logger.error(f"❌ 応募ID: {app_id} の処理でエラー: {str(e)}")
+            traceback.print_exc()  # スタックトレースを出力
+            return False, None
+
+    def _check_and_record_applicant(self, app_id, rows, record_index, applicant_data, checker, env, adoption):
+        """
+        取得済みの応募者データを判定し、チェック・更新・ログ記録まで行う
+        
+        Args:
+            app_id: 処理する応募ID
+            rows: テーブルの行要素のリスト
+            record_index: 対象レコードのインデックス
+            applicant_data: get_applicant_info相当の応募者データ
+            checker: ApplicantCheckerクラスのインスタンス
+            env: EnvironmentUtilsクラス
+            adoption: Adoptionクラスのインスタンス
+            
+        Returns:
+            tuple: (bool, dict) - (処理成功フラグ, 応募者データ)
+        """
+        try:
+            started = time.perf_counter()
             # パターン判定を行う
             pattern, reason = checker.check_pattern(applicant_data)
             applicant_data['pattern'] = str(pattern)
             applicant_data['pattern_reason'] = reason
-            self.logger.info(f"DEBUG: browser.py - パターン判定結果設定: パターン={pattern}, 理由={reason}")
+            self.logger.debug("パターン判定結果設定: パターン=%s, 理由=%s", pattern, reason)
             
             # 備考欄が設定されていない場合は空文字を設定
             if 'remark' not in applicant_data:
                 applicant_data['remark'] = ''
-                self.logger.info("備考欄(remark): 未設定のため空文字を設定")
-            else:
-                self.logger.info(f"備考欄(remark): {applicant_data['remark']}")
+                self.logger.debug("備考欄(remark): 未設定のため空文字を設定")
             
             # スキップ条件をチェック
             should_skip = adoption._should_skip_confirmation_process(applicant_data)
@@ -581,16 +1091,16 @@ class Browser:
                 # スキップ条件に該当する場合
                 applicant_data['confirm_checkbox'] = 'スキップ'
                 applicant_data['confirm_onoff'] = 'スキップ（備考欄記載あり）'
-                self.logger.info(f"✅ 応募ID: {app_id} はスキップ条件に該当するため、確認完了処理をスキップしました")
+                self.logger.debug("応募ID: %s はスキップ条件に該当するため、確認完了処理をスキップしました", app_id)
             elif pattern == 99:
                 # パターン99の場合
                 applicant_data['confirm_checkbox'] = 'パターン99'
                 applicant_data['confirm_onoff'] = 'パターン99対象外'
-                self.logger.info(f"応募ID: {app_id} はパターン99のため、確認完了処理をスキップしました")
+                self.logger.debug("応募ID: %s はパターン99のため、確認完了処理をスキップしました", app_id)
             else:
                 # 通常の処理
                 # チェックボックスをクリック
-                if not adoption.check_single_record(rows, 0):
+                if not adoption.check_single_record(rows, record_index):
                     self.logger.warning(f"応募ID: {app_id} のチェックに失敗しました")
                     return False, None
                 
@@ -610,18 +1120,21 @@ class Browser:
             if 'application_id' in applicant_data and 'id' not in applicant_data:
                 applicant_data['id'] = applicant_data['application_id']
             
+            # 判定結果・操作を状態ストアに保存
+            adoption.record_state([applicant_data])
+            
             # ログに記録
             if hasattr(self, 'logger_instance') and self.logger_instance:
                 try:
                     log_success = self.logger_instance.log_applicants([applicant_data])
                     if log_success:
-                        self.logger.info(f"応募ID: {app_id} のデータをログに記録しました")
+                        self.logger.debug("応募ID: %s のデータをログに記録しました", app_id)
                     else:
                         self.logger.warning(f"応募ID: {app_id} のデータのログ記録に失敗しました")
                 except Exception as log_error:
                     self.logger.error(f"ログ記録中にエラーが発生: {str(log_error)}")
             
-            self.logger.info(f"応募ID: {app_id} の処理が完了しました")
+            log_record_event(self.logger, applicant_data, time.perf_counter() - started)
             return True, applicant_data
             
         except Exception as e:
@@ -629,6 +1142,7 @@ class Browser:
             traceback.print_exc()  # スタックトレースを出力
             return False, None
 
+    @metrics.timed('browser.search_by_application_id')
     def _search_by_application_id(self, application_id=None):
         """
         応募IDで検索を実行
@@ -650,12 +1164,10 @@ class Browser:
                 # 応募IDフィールドをクリア
                 application_id_field = self.driver.find_element(By.CSS_SELECTOR, "#application_number")
                 application_id_field.clear()
-                time.sleep(0.5)
                 
-                # 応募IDを入力（指定がある場合のみ）
+                # 応募IDを入力（指定がある場合のみ。send_keysは入力完了まで戻らない）
                 if application_id:
                     application_id_field.send_keys(str(application_id))
-                    time.sleep(0.5)
                 
                 # 検索ボタンをクリック
                 search_button = self.driver.find_element(
@@ -663,19 +1175,15 @@ class Browser:
                     self.selectors['adoption']['search_button']['selector_value']
                 )
                 
-                # 検索ボタンが見えるようにスクロール
-                self.driver.execute_script(
-                    "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", 
-                    search_button
-                )
-                time.sleep(1.5)  # スクロールが完了するまで待機
+                # 検索ボタンが見えるようにスクロール（即時スクロールのため待機不要）
+                self.ready.scroll_into_view(search_button)
                 
                 # JavaScriptを使用してクリック
+                table_mark = self.ready.mark_table()
                 self.driver.execute_script("arguments[0].click();", search_button)
                 
-                # 要素が読み込まれるまで待機
-                self.wait.until(EC.presence_of_all_elements_located)
-                time.sleep(2)
+                # 検索結果テーブルの再描画を待機
+                self.ready.table_rerendered('browser.search_by_application_id', table_mark)
                 
                 if application_id:
                     self.logger.info(f"応募ID: {application_id} の検索が完了しました")
@@ -690,10 +1198,11 @@ class Browser:
                 try:
                     # フォームを直接送信
                     self.logger.info("別の方法で検索を実行します（フォーム送信）")
+                    table_mark = self.ready.mark_table()
                     self.driver.execute_script("""
                         document.querySelector('form').submit();
                     """)
-                    time.sleep(3)
+                    self.ready.table_rerendered('browser.search_by_application_id.form_submit', table_mark)
                     return True
                 except Exception as e2:
                     self.logger.error(f"❌ フォーム送信でもエラー: {str(e2)}")
@@ -703,6 +1212,7 @@ class Browser:
             self.logger.error(f"応募ID検索処理でエラー: {str(e)}")
             return False
 
+    @metrics.timed('browser.click_update_button')
     def _click_update_button(self, auto_update):
         """
         更新ボタンをクリックする
@@ -718,21 +1228,18 @@ class Browser:
             update_button_selector = self.selectors['adoption']['update_button']['selector_value']
             
             # 更新ボタンを見つける
-            update_button = WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, update_button_selector))
+            update_button = self.ready.until(
+                'browser.update_button.find',
+                EC.presence_of_element_located((By.CSS_SELECTOR, update_button_selector)),
+                timeout=5
             )
             
-            # 更新ボタンが見えるようにスクロール
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", 
-                update_button
-            )
-            time.sleep(1.5)  # スクロールが完了するまで待機
+            # 更新ボタンが見えるようにスクロール（即時スクロールのため待機不要）
+            self.ready.scroll_into_view(update_button)
             
-            # JavaScriptを使用してクリック
+            # JavaScriptを使用してクリック（確認ダイアログの表示は下で待機する）
             self.driver.execute_script("arguments[0].click();", update_button)
             self.logger.info("更新ボタンをクリックしました")
-            time.sleep(2)  # 更新処理の完了を待機
             
             # 確認ダイアログが表示された場合は確認/キャンセルボタンをクリック
             try:
@@ -743,30 +1250,32 @@ class Browser:
                     # 更新キャンセルボタンをクリック
                     confirm_button_selector = self.selectors['adoption']['update_cancel_button']['selector_value']
                     
-                confirm_button = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, confirm_button_selector))
-                )
+                confirm_locator = (By.CSS_SELECTOR, confirm_button_selector)
+                confirm_button = self.ready.clickable('browser.update_button.confirm_modal', confirm_locator, timeout=5)
                 
-                # JavaScriptを使用してクリック
+                # JavaScriptを使用してクリックし、確認ダイアログが閉じるまで待機
                 self.driver.execute_script("arguments[0].click();", confirm_button)
                 self.logger.info(f"{'更新確定' if auto_update else '更新キャンセル'}ボタンをクリックしました")
-                time.sleep(3)  # 確認処理の完了を待機
+                self.ready.invisible('browser.update_button.confirm_closed', confirm_locator)
                 
                 # 更新確定後に「閉じる」ボタンが表示される場合があるので対応
                 if auto_update:
                     try:
                         close_button_selector = self.selectors['adoption']['close_button']['selector_value']
-                        close_button = WebDriverWait(self.driver, 5).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, close_button_selector))
-                        )
+                        close_locator = (By.CSS_SELECTOR, close_button_selector)
+                        close_button = self.ready.clickable('browser.update_button.close_modal', close_locator, timeout=5)
                         
                         # JavaScriptを使用してクリック
                         self.driver.execute_script("arguments[0].click();", close_button)
                         self.logger.info("閉じるボタンをクリックしました")
-                        time.sleep(2)  # 閉じる処理の完了を待機
+                        self.ready.invisible('browser.update_button.close_closed', close_locator)
                     except Exception as e:
                         # 閉じるボタンが表示されない場合は無視
                         self.logger.info(f"閉じるボタンは表示されませんでした: {str(e)}")
+                
+                # モーダルの背景が消え、更新通信が落ち着くまで待機
+                self.ready.modal_closed('browser.update_button.modal_closed')
+                self.ready.network_idle('browser.update_button.idle')
             
             except Exception as e:
                 # 確認ダイアログが表示されない場合は無視
@@ -785,7 +1294,12 @@ class Browser:
                     if "更新" in button.text:
                         self.driver.execute_script("arguments[0].click();", button)
                         self.logger.info("テキストで特定した更新ボタンをクリックしました")
-                        time.sleep(2)
+                        self.ready.visible(
+                            'browser.update_button.recovery_modal',
+                            (By.CSS_SELECTOR, ".modal-footer"),
+                            timeout=5,
+                            required=False
+                        )
                         
                         # 確認ダイアログが表示された場合
                         try:
@@ -800,7 +1314,7 @@ class Browser:
                                 if btn.is_displayed():
                                     self.driver.execute_script("arguments[0].click();", btn)
                                     self.logger.info(f"{'更新確定' if auto_update else '更新キャンセル'}ボタンをクリックしました")
-                                    time.sleep(2)
+                                    self.ready.modal_closed('browser.update_button.recovery_closed')
                                     break
                         
                         except:
@@ -831,6 +1345,7 @@ class Browser:
             repeat_same_page = True
             
             while repeat_same_page:
+                page_started = time.perf_counter()
                 # 検索結果の確認
                 has_data, record_count = adoption.check_search_results()
                 if not has_data:
@@ -846,18 +1361,37 @@ class Browser:
                 )
                 rows = table.find_elements(By.CSS_SELECTOR, "tbody > tr")
                 
-                # 変更があったかどうかのフラグ
-                changes_made = False
+                # ページ全体を1回のスクリプト呼び出しで取得（失敗時は要素ごとの取得にフォールバック）
+                snapshot = adoption.snapshot_page()
+                adoption.archive_page(snapshot)
                 
                 # 現在のページの応募者データを処理
                 applicants_to_log = []
-                for record_index in range(record_count):
-                    applicant_data = adoption.process_record(rows, record_index)
-                    if applicant_data:
-                        applicants_to_log.append(applicant_data)
-                        # チェックボックスがクリックされたかどうかを確認
-                        if applicant_data.get('confirm_checkbox') == 'チェック':
-                            changes_made = True
+                if snapshot is not None and env.get_config_value('BROWSER', 'bulk_check', False):
+                    # チェック対象をページ単位でまとめてチェック
+                    applicants_to_log = adoption.process_page_bulk(rows, record_count, snapshot)
+                else:
+                    # スナップショットがあればページ内のレコードをまとめてパターン判定
+                    # （前回から変化が無いレコードは保存した判定結果を使用）
+                    classifications, _ = adoption.classify_records(snapshot) if snapshot is not None else ([], {})
+                    for record_index in range(record_count):
+                        record_snapshot = None
+                        classification = None
+                        if snapshot is not None and record_index < len(snapshot):
+                            record_snapshot = snapshot[record_index]
+                            classification = classifications[record_index]
+                        applicant_data = adoption.process_record(
+                            rows, record_index, snapshot=record_snapshot, classification=classification
+                        )
+                        if applicant_data:
+                            applicants_to_log.append(applicant_data)
+                    adoption.record_state(applicants_to_log)
+                
+                # チェックボックスがクリックされたかどうかを確認
+                changes_made = any(
+                    applicant_data.get('confirm_checkbox') == 'チェック'
+                    for applicant_data in applicants_to_log
+                )
                 
                 # 処理した応募者データを記録
                 all_processed_applicants.extend(applicants_to_log)
@@ -877,14 +1411,24 @@ class Browser:
                                 EC.element_to_be_clickable((By.CSS_SELECTOR, search_button_selector))
                             )
                             
-                            # JavaScriptを使用してクリック
+                            # JavaScriptを使用してクリックし、テーブルの再描画を待機
+                            table_mark = self.ready.mark_table()
                             self.driver.execute_script("arguments[0].click();", search_button)
+                            self.ready.table_rerendered('browser.process_by_batch.research', table_mark)
                             self.logger.info("検索ボタンをクリックして同じページを再読み込みしました")
-                            time.sleep(3)  # 検索処理の完了を待機
                         except Exception as e:
                             self.logger.error(f"検索ボタンのクリックでエラー: {str(e)}")
                             # エラーが発生しても処理を続行
                 
+                log_event(
+                    self.logger,
+                    'page',
+                    mode='batch',
+                    records=len(applicants_to_log),
+                    checked=sum(1 for applicant_data in applicants_to_log if applicant_data.get('confirm_checkbox') == 'チェック'),
+                    elapsed_ms=round((time.perf_counter() - page_started) * 1000, 1)
+                )
+                
                 # 変更がなかった場合、または更新後の再検索が完了した場合は同一ページの繰り返し処理を終了
                 repeat_same_page = False
                 
@@ -1,9 +1,15 @@
-from datetime import datetime
+from datetime import date, datetime
 from dateutil.relativedelta import relativedelta
 from typing import Dict, List, Optional
 from pathlib import Path
 import csv
+import hashlib
 import logging
+import numpy as np
+import pandas as pd
+from .judge_table import JudgeTable, DATE_CONDITIONS
+from ..utils.environment import EnvironmentUtils as env
+from ..utils.metrics import metrics
 
 class ApplicantChecker:
     def __init__(self, selectors_file: Path, judge_list_file: Path):
@@ -14,6 +20,10 @@ class ApplicantChecker:
         """
         self.selectors = self._load_selectors(selectors_file)
         self.patterns = self._load_judge_patterns(judge_list_file)
+        # judge_list.csv をコンパイルした判定表（CSV更新時は自動で読み込み直す）
+        self.judge_table = JudgeTable(judge_list_file)
+        # check_pattern で judge_list.csv の判定表を使用するかどうか（falseの場合は組み込みの判定）
+        self.use_judge_list = env.get_config_value('JUDGE', 'use_judge_list', False)
         self.logger = logging.getLogger(__name__)
 
     def _load_selectors(self, file_path: Path) -> Dict[str, str]:
@@ -75,6 +85,21 @@ class ApplicantChecker:
         """
         return self.selectors
 
+    def rules_signature(self) -> str:
+        """
+        現在の判定条件の識別子を取得します（判定条件が変わると値が変わります）。
+
+        Returns:
+            str: 組み込みの判定の場合は 'builtin'、judge_list.csv の場合はファイル内容のハッシュ
+        """
+        if not self.use_judge_list:
+            return 'builtin'
+        try:
+            content = self.judge_table.file_path.read_bytes()
+        except OSError:
+            content = b''
+        return f"judge_list:{hashlib.sha1(content).hexdigest()}"
+
     def _check_training_date_condition(self, condition: str, actual_date: str) -> bool:
         """
         研修日の条件チェック
@@ -86,30 +111,9 @@ class ApplicantChecker:
         Returns:
             bool: 条件を満たすかどうか
         """
-        if actual_date == "未定":
+        if condition not in ("{実行月以降}", "{1ヶ月以上経過}"):
             return False
-        
-        try:
-            # 日付文字列をdatetimeオブジェクトに変換
-            training_date = datetime.strptime(actual_date, "%Y/%m/%d")
-            current_date = datetime.now()
-            
-            if condition == "{実行月以降}":
-                # 実行月以降の判定
-                return (training_date.year > current_date.year) or (
-                    training_date.year == current_date.year and 
-                    training_date.month >= current_date.month
-                )
-                
-            elif condition == "{1ヶ月以上経過}":
-                # 1ヶ月以上経過の判定
-                one_month_ago = current_date - relativedelta(months=1)
-                return one_month_ago >= training_date
-                
-        except ValueError:
-            return False
-        
-        return False
+        return self.judge_table.bucket(actual_date) in DATE_CONDITIONS[condition]
 
     def should_check_applicant(self, applicant: Dict) -> Optional[str]:
         """
@@ -170,28 +174,7 @@ class ApplicantChecker:
         Returns:
             bool: パターンに一致するかどうか
         """
-        patterns = self.patterns.get(pattern_id, [])
-        for pattern in patterns:
-            matches = True
-            for key, expected in pattern.items():
-                if not expected:  # 空の条件はスキップ
-                    continue
-
-                actual = values.get(key, '')
-                
-                # 研修日の特殊条件チェック
-                if key == 'training_start_date' and expected.startswith('{'):
-                    if not self._check_training_date_condition(expected, actual):
-                        matches = False
-                        break
-                # 通常の値チェック
-                elif actual != expected:
-                    matches = False
-                    break
-
-            if matches:
-                return True
-        return False
+        return int(pattern_id) in self.judge_table.match(values)
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """日付文字列をdatetimeオブジェクトに変換"""
@@ -207,53 +190,204 @@ class ApplicantChecker:
                 continue
         return None
 
+    @metrics.timed('checker.check_pattern')
     def check_pattern(self, applicant_data: Dict) -> tuple[int, str]:
         """応募者データのパターンを判定する"""
+        if self.use_judge_list:
+            return self._check_pattern_by_judge_list(applicant_data)
+
         now = datetime.now()
-        self.logger.info(f"パターン判定開始: {applicant_data}")
-        
+        self.logger.debug("パターン判定開始: %s", applicant_data)
+        pattern, reason = self._classify(
+            applicant_data['status'],
+            applicant_data['training_start_date'],
+            applicant_data['zaiseki'],
+            now,
+            now - relativedelta(months=1)
+        )
+        self.logger.debug("パターン判定結果 -> パターン: %s, 理由: %s", pattern, reason)
+        return pattern, reason
+
+    def classify_many(self, records: List[Dict], now: Optional[datetime] = None) -> List[tuple[int, str]]:
+        """
+        複数の応募者データのパターンをまとめて判定する
+
+        基準時刻と1ヶ月前の時刻を1回だけ計算し、研修初日の解析結果と
+        (ステータス, 研修初日, 在籍確認) ごとの判定結果を使い回す。結果は check_pattern と同じ。
+
+        Args:
+            records (List[Dict]): 応募者データのリスト（status, training_start_date, zaiseki を含む）
+            now (Optional[datetime]): 基準時刻（未指定時は現在時刻）
+
+        Returns:
+            List[tuple[int, str]]: records と同じ順の (パターン, 判定理由) のリスト
+        """
+        if self.use_judge_list:
+            today = now.date() if now else None
+            return [self._check_pattern_by_judge_list(record, today) for record in records]
+
+        now = now or datetime.now()
+        one_month_ago = now - relativedelta(months=1)
+        parsed_dates = {}
+        decisions = {}
+        results = []
+        for record in records:
+            key = (record['status'], record['training_start_date'], record['zaiseki'])
+            decision = decisions.get(key)
+            if decision is None:
+                decision = self._classify(*key, now, one_month_ago, parsed_dates)
+                decisions[key] = decision
+            results.append(decision)
+
+        self.logger.debug("パターン判定: %s件（判定した組み合わせ: %s件）", len(records), len(decisions))
+        return results
+
+    def classify_frame(self, df: pd.DataFrame, now: Optional[datetime] = None) -> pd.DataFrame:
+        """
+        DataFrameの応募者データのパターンを列単位でまとめて判定する
+
+        研修初日の解析と各条件の判定をpandas/NumPyで一括して行う。結果は check_pattern と同じ
+        （pandasで扱えない範囲の日付は1件ずつ解析する）。
+
+        Args:
+            df (pd.DataFrame): status, training_start_date, zaiseki 列を含むDataFrame
+            now (Optional[datetime]): 基準時刻（未指定時は現在時刻）
+
+        Returns:
+            pd.DataFrame: pattern（int）列と pattern_reason 列を追加したDataFrameのコピー
+        """
+        result = df.copy()
+        if self.use_judge_list:
+            classifications = self.classify_many(df.to_dict('records'), now)
+            result['pattern'] = [pattern for pattern, _ in classifications]
+            result['pattern_reason'] = [reason for _, reason in classifications]
+            return result
+
+        now = now or datetime.now()
+        one_month_ago = now - relativedelta(months=1)
+        status = df['status']
+        training_start_date = df['training_start_date'].astype(object)
+        zaiseki = df['zaiseki']
+
+        # 研修初日の解析（_parse_date と同じ順にフォーマットを試す）
+        parsed = pd.to_datetime(training_start_date, format='%Y/%m/%d', errors='coerce')
+        parsed = parsed.fillna(pd.to_datetime(training_start_date, format='%Y-%m-%d', errors='coerce'))
+        # pandasで解析できなかった値のみ1件ずつ解析し直す（datetime64で表せない範囲の日付など）
+        retry = parsed.isna() & training_start_date.map(lambda value: isinstance(value, str) and value != '未定')
+        fallback = {
+            value: self._parse_date(value)
+            for value in training_start_date[retry].unique()
+        }
+        parsed_ok = parsed.notna()
+        is_future = parsed >= pd.Timestamp(now)
+        is_elapsed = parsed <= pd.Timestamp(one_month_ago)
+        for index, value in training_start_date[retry].items():
+            training_date = fallback[value]
+            if training_date is not None:
+                parsed_ok[index] = True
+                is_future[index] = training_date >= now
+                is_elapsed[index] = training_date <= one_month_ago
+
+        rejected = status.isin(['保留', '不合格', '連絡取れず', '辞退', '欠席'])
+        hired = status == '採用'
+        undecided = hired & (training_start_date == '未定')
+        hired_dated = hired & ~undecided
+        invalid = hired_dated & ~parsed_ok
+        future = hired_dated & parsed_ok & is_future
+        elapsed = hired_dated & parsed_ok & ~is_future & is_elapsed & (zaiseki == '〇')
+
+        conditions = [rejected, undecided, invalid, future, elapsed]
+        result['pattern'] = np.select(conditions, [1, 2, 99, 3, 4], default=99).astype(int)
+        result['pattern_reason'] = np.select(
+            conditions,
+            [
+                'ステータス: ' + status.astype(str),
+                '研修日未定・在籍確認未実施',
+                '研修日の形式が不正',
+                '研修日が実行月以降・在籍確認未実施',
+                '研修日から1ヶ月以上経過・在籍確認済み'
+            ],
+            default='該当するパターンなし'
+        )
+        self.logger.debug("パターン判定（列単位）: %s件", len(result))
+        return result
+
+    def _classify(self, status: str, training_start_date: str, zaiseki: str,
+                  now: datetime, one_month_ago: datetime, parsed_dates: Optional[Dict] = None) -> tuple[int, str]:
+        """
+        組み込みの判定条件でパターンを判定する（check_pattern / classify_many 共通）
+
+        Args:
+            status (str): 採用ステータス
+            training_start_date (str): 研修初日
+            zaiseki (str): 在籍確認
+            now (datetime): 基準時刻
+            one_month_ago (datetime): 基準時刻の1ヶ月前
+            parsed_dates (Optional[Dict]): 研修初日の解析結果のキャッシュ
+
+        Returns:
+            tuple[int, str]: (パターン, 判定理由)
+        """
         # パターン1の判定（保留/不合格/連絡取れず/辞退/欠席）
-        if applicant_data['status'] in ['保留', '不合格', '連絡取れず', '辞退', '欠席']:
-            reason = f"ステータス: {applicant_data['status']}"
-            self.logger.info(f"パターン1と判定: {reason}")
-            self.logger.info(f"DEBUG: checker.py - パターン判定結果 -> パターン: {1}, 理由: {reason}")
-            return 1, reason
-            
+        if status in ['保留', '不合格', '連絡取れず', '辞退', '欠席']:
+            return 1, f"ステータス: {status}"
+
         # 採用の場合のパターン判定
-        if applicant_data['status'] == '採用':
+        if status == '採用':
             # パターン2: 研修日未定
-            if applicant_data['training_start_date'] == '未定':
-                self.logger.info("パターン2と判定: 研修日未定")
-                reason = "研修日未定・在籍確認未実施"
-                self.logger.info(f"DEBUG: checker.py - パターン判定結果 -> パターン: {2}, 理由: {reason}")
-                return 2, reason
-                
-            training_date = self._parse_date(applicant_data['training_start_date'])
+            if training_start_date == '未定':
+                return 2, "研修日未定・在籍確認未実施"
+
+            if parsed_dates is None:
+                training_date = self._parse_date(training_start_date)
+            elif training_start_date in parsed_dates:
+                training_date = parsed_dates[training_start_date]
+            else:
+                training_date = parsed_dates[training_start_date] = self._parse_date(training_start_date)
             if not training_date:
-                self.logger.info("パターン99と判定: 研修日のパース失敗")
-                reason = "研修日の形式が不正"
-                self.logger.info(f"DEBUG: checker.py - パターン判定結果 -> パターン: {99}, 理由: {reason}")
-                return 99, reason
-                
+                return 99, "研修日の形式が不正"
+
             # パターン3: 実行月以降
             if training_date >= now:
-                self.logger.info("パターン3と判定: 研修日が実行月以降")
-                reason = "研修日が実行月以降・在籍確認未実施"
-                self.logger.info(f"DEBUG: checker.py - パターン判定結果 -> パターン: {3}, 理由: {reason}")
-                return 3, reason
-                
+                return 3, "研修日が実行月以降・在籍確認未実施"
+
             # パターン4: 1ヶ月以上経過
-            one_month_ago = now - relativedelta(months=1)
-            if training_date <= one_month_ago and applicant_data['zaiseki'] == '〇':
-                self.logger.info("パターン4と判定: 1ヶ月以上経過・在籍確認済み")
-                reason = "研修日から1ヶ月以上経過・在籍確認済み"
-                self.logger.info(f"DEBUG: checker.py - パターン判定結果 -> パターン: {4}, 理由: {reason}")
-                return 4, reason
-        
-        self.logger.info("パターン99と判定: 該当するパターンなし")
-        self.logger.info(f"DEBUG: checker.py - パターン判定結果 -> パターン: {99}, 理由: {'該当するパターンなし'}")
+            if training_date <= one_month_ago and zaiseki == '〇':
+                return 4, "研修日から1ヶ月以上経過・在籍確認済み"
+
         return 99, "該当するパターンなし"
 
+    def _check_pattern_by_judge_list(self, applicant_data: Dict, today: Optional[date] = None) -> tuple[int, str]:
+        """
+        judge_list.csv の判定表で応募者データのパターンを判定する
+
+        Args:
+            applicant_data (Dict): 応募者データ
+            today (Optional[date]): 基準日（未指定時は今日）
+
+        Returns:
+            tuple[int, str]: (パターン, 判定理由)。一致するパターンが無い場合は (99, "該当するパターンなし")
+        """
+        pattern = self.judge_table.evaluate({
+            'status': applicant_data['status'],
+            'training_start_date': applicant_data['training_start_date'],
+            'zaiseki': applicant_data['zaiseki'],
+            'oiwai': applicant_data.get('oiwai', ''),
+            'admin_memo': applicant_data.get('remark', '')
+        }, today)
+        if pattern is None:
+            reason = "該当するパターンなし"
+            pattern = 99
+        else:
+            reason = self.judge_table.get_reason(pattern) or {
+                1: f"ステータス: {applicant_data['status']}",
+                2: "研修日未定・在籍確認未実施",
+                3: "研修日が実行月以降・在籍確認未実施",
+                4: "研修日から1ヶ月以上経過・在籍確認済み"
+            }.get(pattern, f"パターン{pattern}")
+        self.logger.debug("パターン判定結果 -> パターン: %s, 理由: %s", pattern, reason)
+        return pattern, reason
+
     @staticmethod
     def format_check_result(reason: str) -> str:
         """
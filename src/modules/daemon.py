@@ -0,0 +1,115 @@
+import signal
+import socket
+import socketserver
+import threading
+import traceback
+from ..utils.environment import EnvironmentUtils as env
+from ..utils.logging_config import get_logger
+
+# 即時実行を要求するコマンド
+TRIGGER_COMMAND = b"run"
+
+
+class _TriggerHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        """1行のコマンドを受け取り、即時実行の要求であればイベントをセットする"""
+        command = self.rfile.readline().strip()
+        if command == TRIGGER_COMMAND:
+            self.server.trigger.set()
+            self.wfile.write(b"ok\n")
+        else:
+            self.wfile.write(b"unknown command\n")
+
+
+class Daemon:
+    def __init__(self, runtime, scheduler, trigger_port=None):
+        """
+        常駐して実行時刻ごとに処理を行うクラス
+
+        ブラウザ・スプレッドシート・Slack通知は Runtime が実行をまたいで保持し、実行前に確認する。
+        スケジュールとは別に、ローカルのソケット（または SIGUSR1）で即時実行を要求できる。
+
+        Args:
+            runtime: Runtimeクラスのインスタンス
+            scheduler: Schedulerクラスのインスタンス
+            trigger_port: 即時実行の要求を受け付けるポート（未指定時は [DAEMON] trigger_port、0の場合は受け付けない）
+        """
+        self.runtime = runtime
+        self.scheduler = scheduler
+        self.trigger_port = env.get_config_value('DAEMON', 'trigger_port', 8765) if trigger_port is None else trigger_port
+        self.trigger = threading.Event()
+        self._server = None
+        self.logger = get_logger(__name__)
+
+    @staticmethod
+    def send_trigger(port=None) -> bool:
+        """
+        常駐中のプロセスに即時実行を要求
+
+        Args:
+            port: 要求先のポート（未指定時は [DAEMON] trigger_port）
+
+        Returns:
+            bool: 要求が受け付けられた場合はTrue
+        """
+        port = port or env.get_config_value('DAEMON', 'trigger_port', 8765)
+        with socket.create_connection(('127.0.0.1', port), timeout=5) as connection:
+            connection.sendall(TRIGGER_COMMAND + b"\n")
+            return connection.makefile('rb').readline().strip() == b"ok"
+
+    def _start_trigger_listener(self):
+        """即時実行の要求の受け付けを開始"""
+        if self.trigger_port:
+            self._server = socketserver.ThreadingTCPServer(('127.0.0.1', self.trigger_port), _TriggerHandler)
+            self._server.daemon_threads = True
+            self._server.trigger = self.trigger
+            threading.Thread(target=self._server.serve_forever, name='daemon-trigger', daemon=True).start()
+            self.logger.info(f"即時実行の要求を 127.0.0.1:{self.trigger_port} で受け付けます")
+
+        if hasattr(signal, 'SIGUSR1'):
+            signal.signal(signal.SIGUSR1, lambda signum, frame: self.trigger.set())
+
+    def serve_forever(self):
+        """実行時刻（または即時実行の要求）ごとに処理を行う（Ctrl+Cで終了）"""
+        self._start_trigger_listener()
+        self.logger.info(f"常駐モードを開始しました: {self.scheduler.get_schedule_text()}")
+        try:
+            while True:
+                self.scheduler.wait_for_execution_time(
+                    wake_event=self.trigger,
+                    prewarm=self.runtime.ensure_ready,
+                    keepalive=self.runtime.keepalive
+                )
+                self.run_once()
+        except KeyboardInterrupt:
+            self.logger.info("常駐モードを終了します")
+        finally:
+            if self._server:
+                self._server.shutdown()
+                self._server.server_close()
+            self.runtime.close()
+
+    def run_once(self) -> bool:
+        """
+        1回分の処理を実行
+
+        Returns:
+            bool: 処理に成功した場合はTrue
+        """
+        # 前回の処理が終わっていない場合は重複して実行しない
+        if not self.scheduler.acquire_lock():
+            return False
+        self.scheduler.mark_started()
+        try:
+            self.runtime.ensure_ready()
+            self.runtime.run(self.scheduler)
+            return True
+        except Exception as e:
+            self.logger.error(f"❌ エラーが発生しました: {str(e)}")
+            traceback.print_exc()
+            self.runtime.notify_error(e, self.scheduler)
+            # 次回はブラウザを起動し直す
+            self.runtime.close_browser()
+            return False
+        finally:
+            self.scheduler.release_lock()
@@ -0,0 +1,116 @@
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+from datetime import datetime
+from pathlib import Path
+import json
+import os
+from ..utils.environment import EnvironmentUtils as env
+from ..utils.logging_config import get_logger
+
+class DriverResolver:
+    def __init__(self, cache_file=None):
+        """
+        ChromeDriverの実行ファイルを解決し、インストール済みChromeのバージョンと合わせてキャッシュするクラス
+
+        Args:
+            cache_file: キャッシュファイルのパス（未指定時は [BROWSER] driver_cache_file）
+        """
+        self.cache_file = env.get_project_root() / (
+            cache_file or env.get_config_value('BROWSER', 'driver_cache_file', 'cache/chromedriver.json')
+        )
+        self.driver_path = env.get_config_value('BROWSER', 'driver_path', '')
+        self.offline = env.get_config_value('BROWSER', 'offline', False)
+        self.logger = get_logger(__name__)
+
+    def resolve(self) -> str:
+        """
+        使用するChromeDriverのパスを取得
+
+        1. [BROWSER] driver_path が指定されていればそれを使用
+        2. キャッシュ済みのドライバーがあり、Chromeのバージョンが変わっていなければ再利用
+           （offline = true の場合はバージョンに関わらず再利用）
+        3. それ以外はwebdriver_managerで解決し、結果をキャッシュ
+
+        Returns:
+            str: ChromeDriverの実行ファイルのパス
+
+        Raises:
+            FileNotFoundError: 指定・キャッシュされたドライバーが無く、オフラインモードで解決できない場合
+        """
+        if self.driver_path:
+            path = Path(self.driver_path)
+            if not path.is_absolute():
+                path = env.get_project_root() / path
+            if not path.exists():
+                raise FileNotFoundError(f"driver_pathに指定されたChromeDriverが見つかりません: {path}")
+            self.logger.info(f"指定されたChromeDriverを使用します: {path}")
+            return str(path)
+
+        cache = self._load_cache()
+        cached_path = cache.get('driver_path')
+        if cached_path and not Path(cached_path).exists():
+            cached_path = None
+
+        if self.offline:
+            if not cached_path:
+                raise FileNotFoundError(
+                    "オフラインモードですが、キャッシュ済みのChromeDriverがありません。"
+                    "[BROWSER] driver_path を指定してください"
+                )
+            self.logger.info(f"オフラインモード: キャッシュ済みのChromeDriverを使用します: {cached_path}")
+            return cached_path
+
+        chrome_version = self._get_chrome_version()
+        if cached_path and chrome_version and cache.get('chrome_version') == chrome_version:
+            self.logger.info(f"キャッシュ済みのChromeDriverを使用します（Chrome {chrome_version}）: {cached_path}")
+            return cached_path
+
+        driver_path = self._install()
+        self._save_cache(chrome_version, driver_path)
+        return driver_path
+
+    def _get_chrome_version(self):
+        """
+        インストール済みChromeのバージョンを取得（ネットワークアクセスなし）
+
+        Returns:
+            str: Chromeのバージョン。取得できない場合はNone
+        """
+        try:
+            return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+        except Exception as e:
+            self.logger.warning(f"Chromeのバージョン取得に失敗: {str(e)}")
+            return None
+
+    def _install(self) -> str:
+        """webdriver_managerでChromeDriverを解決（必要に応じてダウンロード）"""
+        driver_path = ChromeDriverManager().install()
+        # THIRD_PARTY_NOTICES.chromedriverが返された場合、正しい実行ファイルパスに修正
+        if driver_path.endswith('THIRD_PARTY_NOTICES.chromedriver'):
+            executable = 'chromedriver.exe' if os.name == 'nt' else 'chromedriver'
+            driver_path = os.path.join(os.path.dirname(driver_path), executable)
+        self.logger.info(f"ChromeDriverを解決しました: {driver_path}")
+        return driver_path
+
+    def _load_cache(self) -> dict:
+        """キャッシュファイルを読み込む（無い・壊れている場合は空の辞書）"""
+        try:
+            if self.cache_file.exists():
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"ChromeDriverキャッシュの読み込みに失敗: {str(e)}")
+        return {}
+
+    def _save_cache(self, chrome_version, driver_path):
+        """解決結果をキャッシュファイルに保存"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'chrome_version': chrome_version,
+                    'driver_path': driver_path,
+                    'resolved_at': datetime.now().isoformat()
+                }, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            self.logger.warning(f"ChromeDriverキャッシュの保存に失敗: {str(e)}")
@@ -0,0 +1,203 @@
+from datetime import datetime, date
+from dateutil.relativedelta import relativedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+import csv
+import threading
+import time
+
+# 条件の指定なし（どの値にも一致）を表すキー
+ANY = '*'
+
+# 研修初日の区分
+BUCKET_UNDECIDED = 'undecided'    # 未定
+BUCKET_INVALID = 'invalid'        # 日付として解釈できない
+BUCKET_FROM_MONTH = 'from_month'  # 実行月以降
+BUCKET_ELAPSED = 'elapsed'        # 1ヶ月以上経過
+BUCKET_BETWEEN = 'between'        # 上記以外（実行月より前で1ヶ月未満）
+ALL_BUCKETS = (BUCKET_UNDECIDED, BUCKET_INVALID, BUCKET_FROM_MONTH, BUCKET_ELAPSED, BUCKET_BETWEEN)
+
+# judge_list.csv の研修初日の条件と、一致する区分
+DATE_CONDITIONS = {
+    '': ALL_BUCKETS,
+    '未定': (BUCKET_UNDECIDED,),
+    '{実行月以降}': (BUCKET_FROM_MONTH,),
+    '{1ヶ月以上経過}': (BUCKET_ELAPSED,),
+}
+
+# 対応する日付フォーマット
+DATE_FORMATS = ['%Y/%m/%d', '%Y-%m-%d']
+
+
+class JudgeTable:
+    def __init__(self, file_path: Path, check_interval: float = 1.0):
+        """
+        judge_list.csv を判定表にコンパイルし、応募者データに一致するパターンを求めるクラス
+
+        判定表は (ステータス, 研修初日の区分) ごとに、(在籍確認, お祝いフラグ, 管理者メモ) をキーとした
+        辞書を持つ。条件が空欄の項目は ANY として登録し、判定時は実際の値と ANY の組み合わせを
+        辞書で引くだけで、ルールの走査や条件文字列の解釈は行わない。
+        CSVが更新された場合（mtime・サイズの変化）は次の判定時にコンパイルし直す。
+
+        Args:
+            file_path (Path): 判定パターンファイルのパス
+            check_interval (float): ファイル更新を確認する間隔（秒）
+        """
+        self.file_path = Path(file_path)
+        self.check_interval = check_interval
+        self._table = {}
+        self._reasons = {}
+        self._signature = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+        # 研修初日の文字列 -> 日付（解釈できない場合はNone）
+        self._parsed_dates = {}
+        # 基準日 -> (実行月の初日, 1ヶ月前の日付)
+        self._thresholds = {}
+
+    def _refresh(self):
+        """CSVが更新されていればコンパイルし直す（確認は check_interval 秒に一度）"""
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self.check_interval:
+                return
+            stat = self.file_path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature != self._signature:
+                with open(self.file_path, 'r', encoding='utf-8') as f:
+                    self._table, self._reasons = self.compile(list(csv.DictReader(f)))
+                self._signature = signature
+            self._checked_at = now
+
+    @staticmethod
+    def compile(rows: List[Dict[str, str]]) -> tuple:
+        """
+        judge_list.csv の行を判定表に変換
+
+        Args:
+            rows (List[Dict[str, str]]): CSVの行（pattern, oiwai, remark, status, training_start_date, zaiseki）
+
+        Returns:
+            tuple: (判定表, {パターン: 説明})
+                判定表は {(ステータス, 区分): {(在籍確認, お祝いフラグ, 管理者メモ): [(行番号, パターン), ...]}}
+
+        Raises:
+            ValueError: 研修初日の条件が不明な場合
+        """
+        table = {}
+        reasons = {}
+        for order, row in enumerate(rows):
+            pattern = int(row['pattern'])
+            if row.get('description'):
+                reasons.setdefault(pattern, row['description'])
+
+            date_condition = (row.get('training_start_date') or '').strip()
+            if date_condition not in DATE_CONDITIONS:
+                raise ValueError(f"研修初日の条件が不明です（パターン{pattern}）: {date_condition}")
+
+            status = (row.get('status') or '').strip() or ANY
+            key = tuple(
+                (row.get(column) or '').strip() or ANY
+                for column in ('zaiseki', 'oiwai', 'remark')
+            )
+            for bucket in DATE_CONDITIONS[date_condition]:
+                table.setdefault((status, bucket), {}).setdefault(key, []).append((order, pattern))
+        return table, reasons
+
+    def _parse_date(self, date_str: str) -> Optional[date]:
+        """研修初日の文字列を日付に変換（結果はキャッシュする）"""
+        try:
+            return self._parsed_dates[date_str]
+        except KeyError:
+            pass
+        parsed = None
+        for fmt in DATE_FORMATS:
+            try:
+                parsed = datetime.strptime(date_str, fmt).date()
+                break
+            except ValueError:
+                continue
+        self._parsed_dates[date_str] = parsed
+        return parsed
+
+    def _get_thresholds(self, today: date) -> tuple:
+        """基準日に対する (実行月の初日, 1ヶ月前の日付) を取得（基準日ごとにキャッシュする）"""
+        thresholds = self._thresholds.get(today)
+        if thresholds is None:
+            thresholds = (today.replace(day=1), today - relativedelta(months=1))
+            self._thresholds = {today: thresholds}
+        return thresholds
+
+    def bucket(self, training_start_date: str, today: Optional[date] = None) -> str:
+        """
+        研修初日を区分に変換
+
+        Args:
+            training_start_date (str): 研修初日（例: 2024/04/01, 未定）
+            today (Optional[date]): 基準日（未指定時は今日）
+
+        Returns:
+            str: 研修初日の区分
+        """
+        if training_start_date == '未定':
+            return BUCKET_UNDECIDED
+        training_date = self._parse_date(training_start_date)
+        if training_date is None:
+            return BUCKET_INVALID
+        month_start, one_month_ago = self._get_thresholds(today or date.today())
+        if training_date >= month_start:
+            return BUCKET_FROM_MONTH
+        if training_date <= one_month_ago:
+            return BUCKET_ELAPSED
+        return BUCKET_BETWEEN
+
+    def match(self, values: Dict[str, str], today: Optional[date] = None) -> List[int]:
+        """
+        応募者データに一致するパターンを全て取得
+
+        Args:
+            values (Dict[str, str]): status, training_start_date, zaiseki, oiwai, admin_memo
+            today (Optional[date]): 基準日（未指定時は今日）
+
+        Returns:
+            List[int]: 一致したパターン（judge_list.csv の行順）
+        """
+        self._refresh()
+        bucket = self.bucket(values.get('training_start_date', ''), today)
+        actual = (values.get('zaiseki', ''), values.get('oiwai', ''), values.get('admin_memo', ''))
+        matches = []
+        for status in (values.get('status', ''), ANY):
+            rules = self._table.get((status, bucket))
+            if not rules:
+                continue
+            for zaiseki in (actual[0], ANY):
+                for oiwai in (actual[1], ANY):
+                    for memo in (actual[2], ANY):
+                        matches.extend(rules.get((zaiseki, oiwai, memo), ()))
+        return [pattern for _, pattern in sorted(matches)]
+
+    def evaluate(self, values: Dict[str, str], today: Optional[date] = None) -> Optional[int]:
+        """
+        応募者データに最初に一致するパターンを取得
+
+        Args:
+            values (Dict[str, str]): status, training_start_date, zaiseki, oiwai, admin_memo
+            today (Optional[date]): 基準日（未指定時は今日）
+
+        Returns:
+            Optional[int]: judge_list.csv で最初に一致したパターン。一致しない場合はNone
+        """
+        matches = self.match(values, today)
+        return matches[0] if matches else None
+
+    def get_reason(self, pattern: int) -> Optional[str]:
+        """
+        judge_list.csv の description 列に記載されたパターンの説明を取得
+
+        Returns:
+            Optional[str]: パターンの説明。記載が無い場合はNone
+        """
+        self._refresh()
+        return self._reasons.get(pattern)
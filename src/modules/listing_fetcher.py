@@ -0,0 +1,176 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+import os
+from lxml import etree, html as lxml_html
+from lxml.cssselect import CSSSelector
+import requests
+from requests.adapters import HTTPAdapter
+from .table_parser import TableParser
+from ..utils.environment import EnvironmentUtils as env
+from ..utils.logging_config import get_logger
+from ..utils.metrics import metrics
+
+
+def page_url(url: str, page_number: int) -> str:
+    """
+    検索結果のURLのpageパラメータを書き換えたURLを作成
+
+    Args:
+        url: 検索結果（/admin/adoptions）のURL
+        page_number: ページ番号（1始まり）
+
+    Returns:
+        str: 指定ページのURL（他の検索条件はそのまま）
+    """
+    parsed = urlparse(url)
+    query = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True) if k != 'page']
+    query.append(('page', str(page_number)))
+    return urlunparse(parsed._replace(query=urlencode(query)))
+
+
+class ListingFetcher:
+    def __init__(self, selectors, max_workers=None, timeout=None, basic_auth=None):
+        """
+        検索結果の一覧をブラウザを使わずにHTTPで取得するクラス
+
+        ログイン済みのブラウザからCookieを引き継いだ requests.Session で検索結果のページを
+        取得し（複数ページを同時に取得）、Adoption.snapshot_page と同じ形式のレコードに変換する。
+        読み取るだけのページはChromeの描画・chromedriverとの往復を行わずに済む。
+
+        Args:
+            selectors: セレクター情報（ApplicantChecker.get_selectors()）
+            max_workers: 同時に取得するページ数（未指定時は [BROWSER] http_listing_workers）
+            timeout: 応答を待つ最大秒数（未指定時は [BROWSER] http_timeout）
+            basic_auth: (ID, パスワード)。未指定時は環境変数 BASIC_AUTH_ID / BASIC_AUTH_PASSWORD
+        """
+        self.max_workers = max_workers or env.get_config_value('BROWSER', 'http_listing_workers', 4)
+        self.timeout = timeout or env.get_config_value('BROWSER', 'http_timeout', 30)
+        self.parser = TableParser(selectors)
+        self.list_selector = CSSSelector('#recruitment-list')
+        self.page_links = CSSSelector('.pagination a')
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if basic_auth is None and os.getenv('BASIC_AUTH_ID'):
+            basic_auth = (os.getenv('BASIC_AUTH_ID'), os.getenv('BASIC_AUTH_PASSWORD', ''))
+        if basic_auth:
+            self.session.auth = basic_auth
+        self.logger = get_logger(__name__)
+
+    def load_cookies(self, driver):
+        """
+        ログイン済みのブラウザのCookie・User-Agentを引き継ぐ
+
+        Args:
+            driver: Login.execute でログイン済みのWebDriverインスタンス
+        """
+        self.session.cookies.clear()
+        for cookie in driver.get_cookies():
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/'),
+                secure=cookie.get('secure', False)
+            )
+        user_agent = driver.execute_script("return navigator.userAgent")
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+
+    @staticmethod
+    def _strip_credentials(url: str) -> str:
+        """URLに含まれるBasic認証情報を除く（認証はsession.authで行う）"""
+        parsed = urlparse(url)
+        return urlunparse(parsed._replace(netloc=parsed.netloc.rpartition('@')[2]))
+
+    def _last_page(self, root) -> int:
+        """ページネーションのリンクから分かる最後のページ番号"""
+        numbers = [1]
+        for link in self.page_links(root):
+            text = link.text_content().strip()
+            if text.isdigit():
+                numbers.append(int(text))
+        return max(numbers)
+
+    @metrics.timed('listing.fetch_page')
+    def fetch_page(self, url: str, page_number: int) -> Optional[Dict]:
+        """
+        検索結果の1ページを取得
+
+        Args:
+            url: 検索結果のURL
+            page_number: ページ番号
+
+        Returns:
+            Optional[Dict]: {page, url, html（#recruitment-list部分）, records, last_page}。
+                            検索結果のテーブルが無い場合（セッション切れでログイン画面になった場合など）はNone
+        """
+        target = page_url(url, page_number)
+        response = self.session.get(target, timeout=self.timeout)
+        response.raise_for_status()
+
+        root = lxml_html.fromstring(response.text)
+        lists = self.list_selector(root)
+        records = self.parser.parse_element(root) if lists else None
+        if records is None:
+            self.logger.warning(f"ページ {page_number} の検索結果を取得できません: {response.url}")
+            return None
+        for record in records:
+            record['page'] = page_number
+        return {
+            'page': page_number,
+            'url': target,
+            'html': etree.tostring(lists[0], encoding='unicode', method='html'),
+            'records': records,
+            'last_page': self._last_page(root),
+        }
+
+    def fetch_all(self, url: str, process_next_page: bool = True) -> Optional[List[Dict]]:
+        """
+        検索結果の全ページを取得（2ページ目以降は max_workers ページずつ同時に取得）
+
+        ページネーションに表示されるページ番号が一部だけの場合は、取得したページの
+        ページネーションから次に取得するページを求め直す。
+
+        Args:
+            url: ブラウザで検索した後の検索結果のURL（driver.current_url）
+            process_next_page: 2ページ目以降も取得するかどうか
+
+        Returns:
+            Optional[List[Dict]]: ページ順の fetch_page の結果。取得できないページがあった場合はNone
+        """
+        url = self._strip_credentials(url)
+        try:
+            first = self.fetch_page(url, 1)
+            if first is None:
+                return None
+            pages = [first]
+            if not process_next_page:
+                return pages
+
+            fetched = 1
+            last_page = first['last_page']
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                while fetched < last_page:
+                    numbers = range(fetched + 1, last_page + 1)
+                    results = list(executor.map(lambda number: self.fetch_page(url, number), numbers))
+                    if any(result is None for result in results):
+                        return None
+                    pages.extend(results)
+                    fetched = last_page
+                    last_page = max(result['last_page'] for result in results)
+
+            self.logger.info(
+                f"✅ 検索結果をHTTPで取得: {len(pages)}ページ / {sum(len(page['records']) for page in pages)}件"
+            )
+            return pages
+
+        except Exception as e:
+            self.logger.error(f"❌ 検索結果のHTTPでの取得でエラー: {str(e)}")
+            return None
+
+    def close(self):
+        """コネクションプールを閉じる"""
+        self.session.close()
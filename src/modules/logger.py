@@ -1,5 +1,7 @@
 from datetime import datetime
 from typing import List, Dict
+import threading
+import time
 from ..utils.environment import EnvironmentUtils as env
 import traceback
 from ..utils.logging_config import get_logger
@@ -7,108 +9,86 @@ import gspread
 from google.oauth2 import service_account
 
 class Logger:
-    def __init__(self, spreadsheet):
+    def __init__(self, spreadsheet, buffer_size=None, flush_interval=None):
         """
         ログ記録機能を管理するクラス
         
+        記録する行はメモリ上に溜め、一定件数または一定時間ごとにまとめてスプレッドシートへ追加する。
+        処理の終了時（例外発生時を含む）には close() で残りを書き出すこと。
+        
         Args:
             spreadsheet: SpreadSheetクラスのインスタンス
+            buffer_size: まとめて書き込む件数（未指定時は [LOGGING] buffer_size）
+            flush_interval: 前回の書き込みからこの秒数を過ぎたら書き込む（未指定時は [LOGGING] flush_interval_sec）
         """
         self.spreadsheet = spreadsheet
         self.logger = get_logger(__name__)
+        self.buffer_size = buffer_size or env.get_config_value('LOGGING', 'buffer_size', 20)
+        self.flush_interval = flush_interval or env.get_config_value('LOGGING', 'flush_interval_sec', 30)
+        # 書き込み待ちの応募者データ
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        # 並列ワーカーからの記録で行番号の採番と追加が入れ替わらないようにするロック
+        self._lock = threading.Lock()
         
     def log_applicants(self, applicants_data: List[Dict]) -> bool:
         """
-        応募者データをスプレッドシートに記録（一括処理用）
+        応募者データを書き込み待ちに追加し、件数・経過時間に達していればスプレッドシートに記録
         
         Args:
             applicants_data: 記録する応募者データのリスト
             
         Returns:
-            bool: 記録成功時True、失敗時False
+            bool: 追加（および必要な書き込み）に成功した場合True、失敗時False
         """
-        try:
-            self.logger.info("\n=== ログ記録処理開始 ===")
-            if not applicants_data:
-                self.logger.info("記録対象のデータがありません")
-                return True
+        with self._lock:
+            try:
+                if not applicants_data:
+                    self.logger.info("記録対象のデータがありません")
+                    return True
 
-            # スプレッドシートの接続確認
-            if not self.spreadsheet or not self.spreadsheet.sheet:
-                self.logger.error("❌ スプレッドシートが初期化されていません")
-                return False
+                # スプレッドシートの接続確認
+                if not self.spreadsheet or getattr(self.spreadsheet, 'sheet', None) is None:
+                    self.logger.error("❌ スプレッドシートが初期化されていません")
+                    return False
 
-            # パターン99の制御設定を読み込み
-            include_pattern_99 = env.get_config_value('LOGGING', 'include_pattern_99', False)
-            
-            # パターン99のフィルタリング
-            filtered_data = [
-                data for data in applicants_data
-                if data.get('pattern') != '99' or include_pattern_99
-            ]
+                # パターン99の制御設定を読み込み
+                include_pattern_99 = env.get_config_value('LOGGING', 'include_pattern_99', False)
+                
+                # パターン99のフィルタリング
+                filtered_data = [
+                    data for data in applicants_data
+                    if data.get('pattern') != '99' or include_pattern_99
+                ]
 
-            if not filtered_data:
-                self.logger.info("記録対象のデータがありません（パターン99フィルター後）")
-                return True
+                if not filtered_data:
+                    self.logger.info("記録対象のデータがありません（パターン99フィルター後）")
+                    return True
 
-            # 現在の日時を取得
-            now = datetime.now()
-            current_date = now.strftime('%Y-%m-%d %H:%M:%S')
-            
-            # 現在の行数を取得
-            last_row = len(self.spreadsheet.sheet.col_values(1))
-            
-            # ログデータの作成
-            log_data = [
-                [
-                    last_row + i + 1,      # No
-                    current_date,           # 実行日
-                    applicant['id'],        # 応募ID
-                    applicant['status'],    # 採用ステータス
-                    applicant.get('pattern', ''),   # パターン
-                    applicant.get('pattern_reason', ''),    # パターン判定理由
-                    applicant.get('oiwai', ''),     # お祝いフラグ
-                    applicant.get('remark', ''),      # 備考
-                    applicant['training_start_date'],  # 研修初日
-                    applicant['zaiseki'],   # 在籍確認
-                    applicant.get('confirm_checkbox', ''),     # 確認完了チェックボックス
-                    applicant.get('confirm_onoff', '')        # 更新反映状態
-                ]
-                for i, applicant in enumerate(filtered_data)
-            ]
-            
-            # デバッグ情報
-            for i, applicant in enumerate(filtered_data):
-                self.logger.info(f"DEBUG: logger.py:log_applicants - 応募ID: {applicant['id']} のデータ:")
-                self.logger.info(f"  - パターン: {applicant.get('pattern', '未設定')}")
-                self.logger.info(f"  - パターン判定理由: {applicant.get('pattern_reason', '未設定')}")
-                self.logger.info(f"  - お祝いフラグ: {applicant.get('oiwai', '未設定')}")
-                self.logger.info(f"  - ステータス: {applicant.get('status', '未設定')}")
-            
-            # スプレッドシートに追加
-            try:
-                self.spreadsheet.sheet.append_rows(log_data)
-                self.logger.info(f"✅ {len(filtered_data)}件のデータを記録しました")
+                # 実行日は記録を受け付けた時刻とする
+                current_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                
+                for applicant in filtered_data:
+                    self.logger.debug(
+                        "記録待ちに追加: 応募ID: %s / パターン: %s / パターン判定理由: %s / お祝いフラグ: %s / ステータス: %s",
+                        applicant['id'], applicant.get('pattern', '未設定'), applicant.get('pattern_reason', '未設定'),
+                        applicant.get('oiwai', '未設定'), applicant.get('status', '未設定')
+                    )
+                    self._buffer.append((current_date, applicant))
+
+                if (len(self._buffer) >= self.buffer_size
+                        or time.monotonic() - self._last_flush >= self.flush_interval):
+                    return self._flush()
                 return True
-            except Exception as e:
-                self.logger.error(f"データの追加に失敗: {str(e)}")
-                # 1回だけリトライ
-                try:
-                    self.spreadsheet.sheet.append_rows(log_data)
-                    self.logger.info("✅ リトライ成功")
-                    return True
-                except Exception as e:
-                    self.logger.error(f"❌ リトライも失敗: {str(e)}")
-                    return False
 
-        except Exception as e:
-            self.logger.error(f"❌ ログ記録処理でエラー: {str(e)}")
-            traceback.print_exc()  # スタックトレースを出力
-            return False
+            except Exception as e:
+                self.logger.error(f"❌ ログ記録処理でエラー: {str(e)}")
+                traceback.print_exc()  # スタックトレースを出力
+                return False
             
     def log_single_applicant(self, applicant_data: Dict) -> bool:
         """
-        単一の応募者データをスプレッドシートに記録（応募IDごとの処理用）
+        単一の応募者データを記録（応募IDごとの処理用）
         
         Args:
             applicant_data: 記録する応募者データ
@@ -116,79 +96,105 @@ class Logger:
         Returns:
             bool: 記録成功時True、失敗時False
         """
-        try:
-            self.logger.info(f"\n=== 応募ID: {applicant_data.get('id', '不明')} のログ記録処理開始 ===")
-            
-            # スプレッドシートの接続確認
-            if not self.spreadsheet or not hasattr(self.spreadsheet, 'sheet') or self.spreadsheet.sheet is None:
-                self.logger.error("❌ スプレッドシートが初期化されていません")
-                return False
-            
-            # パターン99の制御設定を読み込み
-            include_pattern_99 = env.get_config_value('LOGGING', 'include_pattern_99', False)
-            
-            # パターン99の場合はスキップ
-            if applicant_data.get('pattern') == '99' and not include_pattern_99:
-                self.logger.info("パターン99のため記録をスキップします")
+        return self.log_applicants([applicant_data])
+
+    def flush(self) -> bool:
+        """
+        書き込み待ちのデータをスプレッドシートに記録
+        
+        Returns:
+            bool: 記録成功時（書き込み待ちが無い場合を含む）True、失敗時False
+        """
+        with self._lock:
+            return self._flush()
+
+    def close(self) -> bool:
+        """
+        処理終了時に書き込み待ちのデータを全て記録
+        
+        Returns:
+            bool: 記録成功時True、失敗時False（記録できなかった応募IDはログに出力）
+        """
+        with self._lock:
+            if self._flush():
                 return True
-                
-            # 現在の日時を取得
-            now = datetime.now()
-            current_date = now.strftime('%Y-%m-%d %H:%M:%S')
-            
-            try:
-                # 現在の行数を取得
-                last_row = len(self.spreadsheet.sheet.col_values(1))
-            except Exception as e:
-                self.logger.error(f"行数の取得に失敗: {str(e)}")
-                last_row = 1  # エラー時はデフォルト値を使用
-            
-            # ログデータの作成
+            ids = [applicant.get('id') for _, applicant in self._buffer]
+            self.logger.error(f"❌ 記録できなかった応募データがあります: {ids}")
+            return False
+
+    def _flush(self) -> bool:
+        """flushの本体（ロック取得済みで呼び出す）。失敗時は書き込み待ちのデータを残す"""
+        if not self._buffer:
+            return True
+        try:
+            self.logger.debug("=== ログ記録処理開始 ===")
+            # 現在の行数を取得（SpreadSheet側でキャッシュ済み）
+            last_row = self.spreadsheet.get_last_row()
+            if last_row is None:
+                raise Exception("最終行を取得できませんでした")
+
             log_data = [
-                [
-                    last_row + 1,      # No
-                    current_date,      # 実行日
-                    applicant_data['id'],        # 応募ID
-                    applicant_data['status'],    # 採用ステータス
-                    applicant_data.get('pattern', ''),   # パターン
-                    applicant_data.get('pattern_reason', ''),    # パターン判定理由
-                    applicant_data.get('oiwai', ''),     # お祝いフラグ
-                    applicant_data.get('remark', ''),      # 備考
-                    applicant_data['training_start_date'],  # 研修初日
-                    applicant_data['zaiseki'],   # 在籍確認
-                    applicant_data.get('confirm_checkbox', ''),     # 確認完了チェックボックス
-                    applicant_data.get('confirm_onoff', '')        # 更新反映状態
-                ]
+                self._build_row(last_row + i + 1, current_date, applicant)
+                for i, (current_date, applicant) in enumerate(self._buffer)
             ]
-            
-            # デバッグ情報
-            self.logger.info(f"DEBUG: logger.py:log_single_applicant - 応募ID: {applicant_data['id']} のデータ:")
-            self.logger.info(f"  - パターン: {applicant_data.get('pattern', '未設定')}")
-            self.logger.info(f"  - パターン判定理由: {applicant_data.get('pattern_reason', '未設定')}")
-            self.logger.info(f"  - お祝いフラグ: {applicant_data.get('oiwai', '未設定')}")
-            self.logger.info(f"  - ステータス: {applicant_data.get('status', '未設定')}")
-            
-            # スプレッドシートに追加
-            try:
-                self.spreadsheet.sheet.append_rows(log_data)
-                self.logger.info(f"✅ 応募ID: {applicant_data.get('id', '不明')} のデータを記録しました")
-                return True
-            except Exception as e:
-                self.logger.error(f"データの追加に失敗: {str(e)}")
-                # 1回だけリトライ
-                try:
-                    self.spreadsheet.sheet.append_rows(log_data)
-                    self.logger.info("✅ リトライ成功")
-                    return True
-                except Exception as e:
-                    self.logger.error(f"❌ リトライも失敗: {str(e)}")
-                    return False
-                    
         except Exception as e:
-            self.logger.error(f"❌ 単一応募者データのログ記録処理でエラー: {str(e)}")
+            self.logger.error(f"❌ ログ記録処理でエラー: {str(e)}")
             traceback.print_exc()  # スタックトレースを出力
             return False
 
+        # スプレッドシートに追加
+        try:
+            self.spreadsheet.append_rows(log_data)
+        except Exception as e:
+            self.logger.error(f"データの追加に失敗: {str(e)}")
+            # 1回だけリトライ
+            try:
+                # キャッシュした最終行がずれている可能性があるため、取り直してから追加する
+                last_row = self.spreadsheet.get_last_row(refresh=True)
+                if last_row is None:
+                    raise Exception("最終行を取得できませんでした")
+                log_data = [
+                    [last_row + i + 1] + row[1:] for i, row in enumerate(log_data)
+                ]
+                self.spreadsheet.append_rows(log_data)
+                self.logger.info("✅ リトライ成功")
+            except Exception as e:
+                self.logger.error(f"❌ リトライも失敗: {str(e)}")
+                return False
+
+        self.logger.info(f"✅ {len(log_data)}件のデータを記録しました")
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        return True
+
+    @staticmethod
+    def _build_row(no, current_date, applicant):
+        """
+        応募者データをスプレッドシートの1行に変換
+        
+        Args:
+            no: 行の「No」
+            current_date: 実行日
+            applicant: 応募者データ
+            
+        Returns:
+            list: 1行分のセルの値
+        """
+        return [
+            no,                     # No
+            current_date,           # 実行日
+            applicant['id'],        # 応募ID
+            applicant['status'],    # 採用ステータス
+            applicant.get('pattern', ''),   # パターン
+            applicant.get('pattern_reason', ''),    # パターン判定理由
+            applicant.get('oiwai', ''),     # お祝いフラグ
+            applicant.get('remark', ''),      # 備考
+            applicant['training_start_date'],  # 研修初日
+            applicant['zaiseki'],   # 在籍確認
+            applicant.get('confirm_checkbox', ''),     # 確認完了チェックボックス
+            applicant.get('confirm_onoff', '')        # 更新反映状態
+        ]
+
     def connect(self) -> bool:
         """
         スプレッドシートに接続します。
@@ -1,18 +1,21 @@
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-import time
 import os
+from ..utils.metrics import metrics
 
 class Login:
-    def __init__(self, browser):
+    def __init__(self, browser, session_cache=None):
         """
         ログイン機能を管理するクラス
         
         Args:
             browser: Browserクラスのインスタンス
+            session_cache: SessionCacheクラスのインスタンス（指定時は保存済みセッションを優先して使用）
         """
         self.browser = browser
+        self.session_cache = session_cache
         
+    @metrics.timed('login.execute')
     def execute(self):
         """
         ログイン処理を実行
@@ -41,13 +44,16 @@ class Login:
                 raise ValueError("ログイン認証情報が不完全です")
 
             # ログイン実行
-            base_url = url.replace('https://', '')
-            if base_url.endswith('/'):
-                base_url = base_url[:-1]
-            auth_url = f'https://{basic_auth["id"]}:{basic_auth["password"]}@{base_url}/login'
+            auth_url, top_url = self._build_urls(url, basic_auth)
+            
+            # 保存済みセッションが有効であればフォームログインを省略
+            if self.session_cache:
+                if self.session_cache.restore(self.browser, auth_url, top_url):
+                    print("✅ 保存済みセッションでログインしました")
+                    return True, url
             
             self.browser.driver.get(auth_url)
-            time.sleep(2)
+            self.browser.ready.document_ready('login.open')
 
             # ログインフォームの入力
             print("ユーザー名を入力中...")
@@ -59,7 +65,6 @@ class Login:
             )
             username_field.clear()  # 既存の入力をクリア
             username_field.send_keys(login_credentials['id'])
-            time.sleep(1)
 
             print("パスワードを入力中...")
             password_field = self.browser.wait.until(
@@ -70,7 +75,6 @@ class Login:
             )
             password_field.clear()  # 既存の入力をクリア
             password_field.send_keys(login_credentials['password'])
-            time.sleep(1)
 
             print("ログインボタンをクリック...")
             submit_button = self.browser.wait.until(
@@ -80,7 +84,9 @@ class Login:
                 ))
             )
             submit_button.click()
-            time.sleep(3)
+            # ログインフォームから遷移するまで待機
+            self.browser.ready.until('login.submit', EC.staleness_of(submit_button), required=False)
+            self.browser.ready.document_ready('login.loaded')
 
             # ログイン成功の確認
             try:
@@ -91,6 +97,8 @@ class Login:
                     ))
                 ).text
                 print(f"✅ ログイン成功 - ページ見出し: {heading}")
+                if self.session_cache:
+                    self.session_cache.save(self.browser.driver)
                 return True, url  # URLも返す
             except Exception as e:
                 print(f"⚠️ ページ見出しの取得に失敗: {str(e)}")
@@ -98,4 +106,53 @@ class Login:
 
         except Exception as e:
             print(f"❌ ログイン処理でエラー: {str(e)}")
-            return False, None 
\ No newline at end of file
+            return False, None
+
+    @staticmethod
+    def _build_urls(url, basic_auth):
+        """
+        Basic認証情報を含むログインページ・管理画面トップのURLを作成
+        
+        Args:
+            url: 管理画面のURL（ADMIN_URL）。http:// の場合（ローカルのスタブサーバー等）はそのまま使用し、
+                 それ以外は https として扱う
+            basic_auth: {'id': Basic認証ID, 'password': Basic認証パスワード}
+            
+        Returns:
+            tuple: (ログインページのURL, 管理画面トップのURL)
+        """
+        scheme = 'http' if url.startswith('http://') else 'https'
+        base_url = url.replace(f'{scheme}://', '')
+        if base_url.endswith('/'):
+            base_url = base_url[:-1]
+        top_url = f'{scheme}://{basic_auth["id"]}:{basic_auth["password"]}@{base_url}'
+        return f'{top_url}/login', top_url
+
+    def is_logged_in(self, timeout=5):
+        """
+        管理画面トップを開き、ログイン状態が続いているかを確認
+        
+        Args:
+            timeout: ログイン後の見出しを待つ秒数
+            
+        Returns:
+            bool: ログイン済みの場合はTrue
+        """
+        try:
+            _, top_url = self._build_urls(os.getenv('ADMIN_URL', ''), {
+                'id': os.getenv('BASIC_AUTH_ID'),
+                'password': os.getenv('BASIC_AUTH_PASSWORD')
+            })
+            self.browser.driver.get(top_url)
+            return bool(self.browser.ready.until(
+                'login.check',
+                EC.presence_of_element_located((
+                    getattr(By, self.browser.selectors['top']['page_heading']['type'].upper()),
+                    self.browser.selectors['top']['page_heading']['selector_value']
+                )),
+                timeout=timeout,
+                required=False
+            ))
+        except Exception as e:
+            print(f"⚠️ ログイン状態の確認に失敗: {str(e)}")
+            return False 
\ No newline at end of file
@@ -0,0 +1,229 @@
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
+from collections import defaultdict
+import itertools
+import time
+from ..utils.environment import EnvironmentUtils as env
+from ..utils.logging_config import get_logger
+
+# 検索結果テーブルのセレクター
+RESULT_TABLE_SELECTOR = "#recruitment-list table.table-sm"
+
+# MutationObserverを一度だけ設置し、最後にDOMが変化した時刻を返すスクリプト
+DOM_QUIET_SCRIPT = """
+if (!window.__readinessObserver) {
+    window.__readinessLastMutation = Date.now();
+    window.__readinessObserver = new MutationObserver(function() {
+        window.__readinessLastMutation = Date.now();
+    });
+    window.__readinessObserver.observe(document.documentElement, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+}
+return Date.now() - window.__readinessLastMutation;
+"""
+
+# ドキュメント・jQuery通信・リソース取得の状態を返すスクリプト
+NETWORK_STATE_SCRIPT = """
+return {
+    ready: document.readyState,
+    active: (window.jQuery && window.jQuery.active) || 0,
+    resources: (window.performance && performance.getEntriesByType)
+        ? performance.getEntriesByType('resource').length : 0
+};
+"""
+
+# テーブル・tbody・先頭行に目印を付けるスクリプト（再描画されると目印が消える）
+MARK_TABLE_SCRIPT = """
+var table = document.querySelector(arguments[0]);
+if (!table) { return false; }
+var targets = [table, table.querySelector('tbody'), table.querySelector('tbody > tr')];
+for (var i = 0; i < targets.length; i++) {
+    if (targets[i]) { targets[i].setAttribute('data-readiness-mark', arguments[1]); }
+}
+return true;
+"""
+
+# 目印の付いた要素が残っておらず、新しいテーブルが存在するかを返すスクリプト
+TABLE_REPLACED_SCRIPT = """
+if (document.readyState !== 'complete') { return false; }
+if (document.querySelector('[data-readiness-mark="' + arguments[1] + '"]')) { return false; }
+return !!document.querySelector(arguments[0]);
+"""
+
+
+class Readiness:
+    def __init__(self, driver, max_timeout=None, poll_interval=None):
+        """
+        固定時間のsleepの代わりに、画面の状態を条件にして待機するクラス
+
+        呼び出し箇所（site）ごとに実際に待機した時間を記録する。
+
+        Args:
+            driver: WebDriverインスタンス
+            max_timeout: 待機の上限秒数（未指定時は [BROWSER] max_wait_timeout）
+            poll_interval: 条件確認の間隔秒数（未指定時は [BROWSER] wait_poll_interval）
+        """
+        self.driver = driver
+        self.max_timeout = max_timeout or env.get_config_value('BROWSER', 'max_wait_timeout', 20)
+        self.poll_interval = poll_interval or env.get_config_value('BROWSER', 'wait_poll_interval', 0.1)
+        self.waited = defaultdict(list)
+        self.logger = get_logger(__name__)
+        self._mark_counter = itertools.count(1)
+
+    def until(self, site, condition, timeout=None, required=True):
+        """
+        条件が満たされるまで待機し、待機時間を記録
+
+        Args:
+            site: 呼び出し箇所の名前（待機時間の集計キー）
+            condition: WebDriverWait.untilに渡す条件
+            timeout: 待機の上限秒数（未指定時はmax_timeout）
+            required: Trueの場合はタイムアウト時に例外を送出、Falseの場合はFalseを返す
+
+        Returns:
+            条件の戻り値。required=Falseでタイムアウトした場合はFalse
+        """
+        timeout = self.max_timeout if timeout is None else min(timeout, self.max_timeout)
+        started = time.perf_counter()
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=self.poll_interval).until(condition)
+        except TimeoutException:
+            if required:
+                raise
+            self.logger.debug(f"待機タイムアウト: {site} ({timeout}秒)")
+            return False
+        finally:
+            elapsed = time.perf_counter() - started
+            self.waited[site].append(elapsed)
+            self.logger.debug(f"待機完了: {site} ({elapsed:.3f}秒)")
+
+    def document_ready(self, site, timeout=None):
+        """document.readyStateがcompleteになるまで待機"""
+        return self.until(
+            site,
+            lambda driver: driver.execute_script("return document.readyState") == 'complete',
+            timeout
+        )
+
+    def dom_quiet(self, site, quiet_ms=300, timeout=None, required=False):
+        """
+        DOMの変更が一定時間発生しなくなるまで待機（スクロールやアニメーション後の安定待ち）
+
+        Args:
+            site: 呼び出し箇所の名前
+            quiet_ms: 変更が発生していないとみなすミリ秒数
+        """
+        return self.until(
+            site,
+            lambda driver: driver.execute_script(DOM_QUIET_SCRIPT) >= quiet_ms,
+            timeout,
+            required
+        )
+
+    def network_idle(self, site, idle_ms=500, timeout=None, required=False):
+        """
+        ページの読み込みと通信（jQuery.active / リソース取得数の増加）が落ち着くまで待機
+
+        Args:
+            site: 呼び出し箇所の名前
+            idle_ms: 通信が発生していないとみなすミリ秒数
+        """
+        state = {'resources': None, 'since': time.perf_counter()}
+
+        def idle(driver):
+            current = driver.execute_script(NETWORK_STATE_SCRIPT)
+            now = time.perf_counter()
+            if current['ready'] != 'complete' or current['active']:
+                state['resources'] = None
+                return False
+            if current['resources'] != state['resources']:
+                state['resources'] = current['resources']
+                state['since'] = now
+                return False
+            return (now - state['since']) * 1000 >= idle_ms
+
+        return self.until(site, idle, timeout, required)
+
+    def visible(self, site, locator, timeout=None, required=True):
+        """要素（モーダルなど）が表示されるまで待機"""
+        return self.until(site, EC.visibility_of_element_located(locator), timeout, required)
+
+    def clickable(self, site, locator, timeout=None, required=True):
+        """要素がクリック可能になるまで待機"""
+        return self.until(site, EC.element_to_be_clickable(locator), timeout, required)
+
+    def invisible(self, site, locator, timeout=None, required=False):
+        """要素（モーダル、ローディング表示など）が非表示になるまで待機"""
+        return self.until(site, EC.invisibility_of_element_located(locator), timeout, required)
+
+    def modal_closed(self, site, timeout=None):
+        """表示中のモーダルとその背景が全て閉じるまで待機"""
+        return self.until(
+            site,
+            lambda driver: driver.execute_script(
+                "return !document.querySelector('.modal.show, .modal-backdrop');"
+            ),
+            timeout,
+            required=False
+        )
+
+    def mark_table(self, selector=RESULT_TABLE_SELECTOR):
+        """
+        再描画の検知用にテーブルへ目印を付ける
+
+        Returns:
+            str: 目印のトークン。テーブルが無い場合はNone
+        """
+        token = f"{id(self)}-{next(self._mark_counter)}"
+        if self.driver.execute_script(MARK_TABLE_SCRIPT, selector, token):
+            return token
+        return None
+
+    def table_replaced(self, token, selector=RESULT_TABLE_SELECTOR):
+        """mark_tableで目印を付けたテーブルが置き換わったかを待機せずに確認"""
+        if token is None:
+            return bool(self.driver.find_elements(By.CSS_SELECTOR, selector))
+        return self.driver.execute_script(TABLE_REPLACED_SCRIPT, selector, token)
+
+    def table_rerendered(self, site, token, selector=RESULT_TABLE_SELECTOR, timeout=None, required=False):
+        """
+        mark_tableで目印を付けたテーブルが新しい内容に置き換わるまで待機
+
+        Args:
+            site: 呼び出し箇所の名前
+            token: mark_tableが返したトークン（Noneの場合はテーブルの出現のみ待機）
+        """
+        return self.until(site, lambda driver: self.table_replaced(token, selector), timeout, required)
+
+    def scroll_into_view(self, element):
+        """スムーズスクロールを使わずに要素を画面中央へスクロール（待機不要）"""
+        self.driver.execute_script(
+            "arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});",
+            element
+        )
+
+    def stats(self):
+        """
+        呼び出し箇所ごとの待機時間の集計を取得
+
+        Returns:
+            dict: {site: {'count': 回数, 'total': 合計秒, 'max': 最大秒}}
+        """
+        return {
+            site: {
+                'count': len(durations),
+                'total': round(sum(durations), 3),
+                'max': round(max(durations), 3)
+            }
+            for site, durations in self.waited.items()
+        }
+
+    def log_summary(self):
+        """待機時間の集計をログに出力"""
+        for site, stat in sorted(self.stats().items(), key=lambda item: -item[1]['total']):
+            self.logger.info(
+                f"待機時間 {site}: {stat['count']}回 合計{stat['total']}秒 最大{stat['max']}秒"
+            )
@@ -0,0 +1,336 @@
+from collections import Counter
+from pathlib import Path
+import time
+from .browser import Browser
+from .checker import ApplicantChecker
+from .logger import Logger
+from .login import Login
+from .search import Search
+from .session import SessionCache
+from .spreadsheet import SpreadSheet
+from ..utils.environment import EnvironmentUtils as env
+from ..utils.notifications import Notifier
+from ..utils.logging_config import get_logger, log_event
+from ..utils.metrics import metrics
+
+class Runtime:
+    def __init__(self, test_mode: bool = False):
+        """
+        1回の実行に必要なリソース（スプレッドシート・Slack通知・セレクター・ブラウザ）を管理するクラス
+
+        常駐モードでは実行をまたいでリソースを保持し、実行前の確認で異常があったものだけを作り直す。
+
+        Args:
+            test_mode (bool): テストモードで実行するかどうか
+        """
+        self.test_mode = test_mode
+        self.spreadsheet_logger = None
+        self.notifier = None
+        self.checker = None
+        self.browser = None
+        self.login = None
+        self.url = None
+        # 最後にリソースを確認した時刻（time.monotonic）
+        self._ready_at = None
+        # 今回の実行の所要時間の集計を開始済みかどうか
+        self._cycle_started = False
+        self.logger = get_logger(__name__)
+
+    def ensure_ready(self):
+        """
+        全てのリソースを使用できる状態にする（未作成・異常なものだけを作り直す）
+
+        事前準備・セッション維持で [SCHEDULE] keepalive_interval_sec 秒以内に確認済みの場合は、
+        確認を省略してすぐに戻る。
+
+        Raises:
+            Exception: ブラウザの起動またはログインに失敗した場合
+        """
+        self._begin_cycle()
+        if self._is_fresh():
+            self.logger.info("✅ 事前準備済みのリソースを使用します")
+            return
+
+        self._ensure_spreadsheet()
+        self._ensure_notifier()
+        if self.checker is None:
+            # セレクター情報の読み込み
+            self.checker = ApplicantChecker(
+                Path("config/selectors.csv"),
+                Path("config/judge_list.csv")
+            )
+        self._ensure_browser()
+        self._ready_at = time.monotonic()
+
+    def keepalive(self):
+        """
+        実行時刻まで待機中にブラウザの応答とログイン状態を確認し、必要であればログインし直す
+
+        Raises:
+            Exception: ブラウザの起動またはログインに失敗した場合
+        """
+        if self.browser is None:
+            self.ensure_ready()
+            return
+        self._begin_cycle()
+        self._ensure_browser()
+        self._ready_at = time.monotonic()
+
+    def _begin_cycle(self):
+        """
+        今回の実行の所要時間の集計を開始する（前回の実行の集計を出力した後、最初の呼び出しでのみリセット）
+
+        事前準備（ブラウザの起動・ログイン）から完了通知までを1回の実行として集計する。
+        """
+        if not self._cycle_started:
+            metrics.reset()
+            self._cycle_started = True
+
+    def _is_fresh(self) -> bool:
+        """直近に確認済みで、確認を省略できるかどうか"""
+        if self._ready_at is None or self.checker is None or not (self.browser and self.browser.driver):
+            return False
+        max_age = env.get_config_value('SCHEDULE', 'keepalive_interval_sec', 120)
+        return time.monotonic() - self._ready_at < max_age
+
+    def _ensure_spreadsheet(self):
+        """スプレッドシートに接続する（接続できない場合は記録なしで続行）"""
+        if self.spreadsheet_logger:
+            # 最終行を取り直して接続を確認
+            if self.spreadsheet_logger.spreadsheet.get_last_row(refresh=True) is not None:
+                return
+            self.logger.warning("スプレッドシートの接続が切れているため、接続し直します")
+            self.spreadsheet_logger.close()
+            self.spreadsheet_logger = None
+
+        try:
+            spreadsheet_settings = env.get_spreadsheet_settings()
+            if not spreadsheet_settings or not spreadsheet_settings.get('credentials_path') or not spreadsheet_settings.get('spreadsheet_key'):
+                self.logger.warning("スプレッドシートの設定が不完全です。ロギングは無効化されます。")
+                return
+            spreadsheet = SpreadSheet(
+                credentials_path=spreadsheet_settings['credentials_path'],
+                spreadsheet_key=spreadsheet_settings['spreadsheet_key']
+            )
+            # 接続を確認
+            if spreadsheet.connect():
+                self.spreadsheet_logger = Logger(spreadsheet)
+                self.logger.info("✅ スプレッドシートへの接続に成功しました")
+            else:
+                self.logger.error("スプレッドシートへの接続に失敗しました")
+                self.logger.warning("スプレッドシートへの接続なしで処理を続行します")
+        except Exception as e:
+            self.logger.error(f"スプレッドシートへの接続に失敗: {str(e)}")
+            self.logger.warning("スプレッドシートへの接続なしで処理を続行します")
+            # 接続失敗時はエラーを発生させず、Noneのままにする
+
+    def _ensure_notifier(self):
+        """Slack通知を準備する（Webhook URLが未設定の場合は通知なし）"""
+        if self.notifier:
+            return
+        webhook_url = env.get_env_var('SLACK_WEBHOOK', '')
+        self.logger.debug(f"Slack webhook: {webhook_url if webhook_url else '未設定'}")
+        if not webhook_url:
+            self.logger.warning("Slack webhook URLが設定されていません。通知は無効化されます。")
+            return
+        self.notifier = Notifier(webhook_url)
+
+    def _browser_alive(self) -> bool:
+        """ブラウザ（ChromeDriver）が応答するかを確認"""
+        try:
+            return self.browser.driver.execute_script("return document.readyState") is not None
+        except Exception as e:
+            self.logger.warning(f"ブラウザが応答しません: {str(e)}")
+            return False
+
+    def _ensure_browser(self):
+        """
+        ブラウザを起動してログインする（起動済みの場合は応答とログイン状態を確認）
+
+        Raises:
+            Exception: ブラウザの起動またはログインに失敗した場合
+        """
+        if self.browser and self.browser.driver:
+            if not self._browser_alive():
+                self.close_browser()
+            elif self.login.is_logged_in():
+                self.logger.info("✅ 起動済みのブラウザを使用します")
+                return
+            else:
+                self.logger.info("ログイン状態が切れているため、ログインし直します")
+                success, self.url = self.login.execute()
+                if not success:
+                    raise Exception("ログイン処理に失敗しました")
+                return
+
+        # ブラウザ設定の読み込み
+        self.browser = Browser(
+            settings_path='config/settings.ini',
+            selectors_path='config/selectors.csv'
+        )
+
+        print("\n=== ブラウザテスト開始 ===")
+        print("1. ブラウザを起動中...")
+        self.browser.setup()
+
+        # ログイン処理
+        print("2. ログイン処理を開始...")
+        self.login = Login(self.browser, session_cache=SessionCache())
+        success, self.url = self.login.execute()
+        if not success:
+            raise Exception("ログイン処理に失敗しました")
+
+    def run(self, scheduler=None) -> list:
+        """
+        検索・応募者の処理・完了通知を行う（ensure_ready の後に呼び出す）
+
+        Args:
+            scheduler: Schedulerクラスのインスタンス（通知に実行時刻を表示）
+
+        Returns:
+            list: 処理した応募者データのリスト
+
+        Raises:
+            Exception: 検索処理に失敗した場合
+        """
+        # ロガーインスタンスをブラウザに設定（存在する場合のみ）
+        self.browser.logger_instance = self.spreadsheet_logger
+
+        # 処理段階ごとの所要時間は事前準備からこの実行の分だけを集計する
+        self._begin_cycle()
+        run_started = started = time.perf_counter()
+        print("\n=== 検索処理開始 ===")
+        print("\n3. 採用確認ページへ遷移中...")
+        adoptions_url = f"{self.url}/adoptions"
+        self.browser.driver.get(adoptions_url)
+        self.browser.ready.document_ready('main.adoptions')
+
+        # repeat_until_emptyの設定を読み込み
+        repeat_until_empty = env.get_config_value('BROWSER', 'repeat_until_empty', False)
+
+        # 検索条件を設定して検索を実行
+        search = Search(self.browser, self.checker.get_selectors())
+        if not search.execute():
+            raise Exception("検索処理に失敗しました")
+        started = self._log_phase('search', started)
+
+        # 全ページを処理するループ
+        applicants_to_log = self.browser.process_applicants(self.checker, env, process_next_page=repeat_until_empty)
+        started = self._log_phase('process', started, records=len(applicants_to_log))
+
+        # 処理結果のログ出力
+        self.logger.info(f"✅ 全{len(applicants_to_log)}件の処理が完了しました")
+        self.browser.ready.log_summary()
+
+        # 書き込み待ちのログをスプレッドシートに記録
+        if self.spreadsheet_logger:
+            self.spreadsheet_logger.flush()
+            started = self._log_phase('flush', started)
+
+        # 処理段階ごとの所要時間を出力
+        metrics.record('run', time.perf_counter() - run_started)
+        summary = self._export_metrics()
+
+        # 成功通知（schedulerの情報を含める）
+        if self.notifier:
+            # パターン99をフィルタリングした統計情報
+            include_pattern_99 = env.get_config_value('LOGGING', 'include_pattern_99', False)
+            pattern_counts = Counter(applicant['pattern'] for applicant in applicants_to_log if 'pattern' in applicant)
+            filtered_patterns = {
+                k: v for k, v in pattern_counts.items()
+                if k != '99' or include_pattern_99
+            }
+
+            stats = {
+                'total': len(applicants_to_log),
+                'patterns': filtered_patterns,
+                'timings': metrics.format_summary(
+                    limit=env.get_config_value('METRICS', 'slack_summary_count', 5),
+                    summary=summary
+                ) if summary else ''
+            }
+
+            self.notifier.send_slack_notification(
+                status="success",
+                stats=stats,
+                spreadsheet_key=env.get_spreadsheet_settings()['spreadsheet_key'],
+                test_mode=self.test_mode,
+                scheduler=scheduler  # schedulerを追加
+            )
+            self._log_phase('notify', started)
+
+        return applicants_to_log
+
+    def _export_metrics(self):
+        """
+        処理段階ごとの所要時間をファイルに出力（失敗しても処理は止めない）
+
+        Returns:
+            Optional[Dict[str, Dict]]: 出力した集計。出力しなかった場合はNone
+        """
+        # 出力後の事前準備からは次の実行として集計する
+        self._cycle_started = False
+        try:
+            summary = metrics.export()
+            if summary:
+                self.logger.info(f"✅ 処理時間の集計を出力しました（{len(summary)}項目）")
+            return summary
+        except Exception as e:
+            self.logger.warning(f"処理時間の集計の出力に失敗: {str(e)}")
+            return None
+
+    def _log_phase(self, phase: str, started: float, **fields) -> float:
+        """
+        処理段階ごとの所要時間をイベント（phase）として出力
+
+        Args:
+            phase: 処理段階の名前
+            started: 処理段階の開始時刻（time.perf_counter）
+            **fields: イベントに追加する項目
+
+        Returns:
+            float: 出力時の時刻（次の処理段階の開始時刻として使用）
+        """
+        now = time.perf_counter()
+        log_event(self.logger, 'phase', phase=phase, elapsed_ms=round((now - started) * 1000, 1), **fields)
+        return now
+
+    def notify_error(self, error, scheduler=None):
+        """
+        エラーをSlackに通知する
+
+        Args:
+            error: 発生した例外
+            scheduler: Schedulerクラスのインスタンス
+        """
+        # 失敗までに処理した応募者の記録を書き込む（常駐モードでは次の実行まで書き込み待ちのまま残さない）
+        if self.spreadsheet_logger:
+            self.spreadsheet_logger.flush()
+        # 失敗した実行の所要時間も残す
+        self._export_metrics()
+        if self.notifier:
+            self.notifier.send_slack_notification(
+                status="error",
+                error_message=str(error),
+                spreadsheet_key=env.get_spreadsheet_settings()['spreadsheet_key'],
+                test_mode=self.test_mode,
+                scheduler=scheduler  # schedulerを追加
+            )
+
+    def close_browser(self):
+        """ブラウザを終了する"""
+        if self.browser and self.browser.driver:
+            try:
+                self.browser.quit()
+                self.logger.info("✅ ブラウザを終了しました")
+            except Exception as e:
+                self.logger.warning(f"ブラウザの終了に失敗: {str(e)}")
+        self.browser = None
+        self.login = None
+        self._ready_at = None
+
+    def close(self):
+        """全てのリソースを解放する（書き込み待ちのログを記録してからブラウザを終了）"""
+        if self.spreadsheet_logger:
+            self.spreadsheet_logger.close()
+        self.close_browser()
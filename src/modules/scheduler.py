@@ -1,40 +1,412 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+import json
+import os
 import time
 from ..utils.environment import EnvironmentUtils as env
+from ..utils.logging_config import get_logger
+
+class CronExpression:
+    # フィールドごとの (最小値, 最大値)
+    FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression: str):
+        """
+        cron形式（分 時 日 月 曜日）の実行スケジュール
+
+        各フィールドは *, 数値, 範囲（1-5）, リスト（10,21）, 間隔（*/15, 0-30/10）に対応する。
+        曜日は 0 と 7 が日曜日。日と曜日の両方が指定された場合はどちらかに一致すれば実行する。
+
+        Args:
+            expression (str): cron形式の文字列（例: "0 10,21 * * 1-5"）
+
+        Raises:
+            ValueError: 形式が不正な場合
+        """
+        self.expression = ' '.join(expression.split())
+        # ログ・通知に表示する文字列
+        self.label = self.expression
+        fields = self.expression.split(' ')
+        if len(fields) != 5:
+            raise ValueError(f"cron形式はフィールドが5つ必要です: {expression}")
+
+        self.minutes, self.hours, self.days, self.months, weekdays = [
+            self._parse_field(field, low, high)
+            for field, (low, high) in zip(fields, self.FIELD_RANGES)
+        ]
+        # cronの曜日（0=日曜）をdatetime.weekday()（0=月曜）に変換
+        self.weekdays = {(day - 1) % 7 for day in weekdays}
+        self.day_restricted = fields[2] != '*'
+        self.weekday_restricted = fields[4] != '*'
+
+    @classmethod
+    def from_time(cls, text: str) -> 'CronExpression':
+        """
+        "HH:MM" 形式の時刻から毎日実行のcron式を作成
+
+        Args:
+            text (str): 実行時刻（例: "10:00"）
+
+        Returns:
+            CronExpression: 毎日その時刻に実行するスケジュール
+        """
+        hour, minute = (int(part) for part in text.strip().split(':'))
+        cron = cls(f"{minute} {hour} * * *")
+        cron.label = f"{hour:02d}:{minute:02d}"
+        return cron
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> set:
+        """cronの1フィールドを値の集合に変換"""
+        values = set()
+        for part in field.split(','):
+            step = 1
+            if '/' in part:
+                part, step_text = part.split('/', 1)
+                step = int(step_text)
+                if step <= 0:
+                    raise ValueError(f"cronの間隔が不正です: {field}")
+            if part == '*':
+                start, end = low, high
+            elif '-' in part:
+                start, end = (int(value) for value in part.split('-', 1))
+            else:
+                start = int(part)
+                end = high if step > 1 else start
+            if start < low or end > high or start > end:
+                raise ValueError(f"cronの値が範囲外です: {field}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        """日・曜日の条件に一致するか"""
+        day_ok = dt.day in self.days
+        weekday_ok = dt.weekday() in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        """
+        指定時刻より後の最初の実行時刻を取得
+
+        Args:
+            after (datetime): 基準時刻
+
+        Returns:
+            datetime: 次の実行時刻（秒以下は0）
+
+        Raises:
+            ValueError: 5年以内に実行時刻が無い場合（2月30日など）
+        """
+        dt = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt + timedelta(days=366 * 5)
+        while dt < limit:
+            if dt.month not in self.months:
+                # 翌月の1日0時へ
+                dt = (dt.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+            if not self._day_matches(dt):
+                dt = dt.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if dt.hour not in self.hours:
+                dt = dt.replace(minute=0) + timedelta(hours=1)
+                continue
+            if dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+                continue
+            return dt
+        raise ValueError(f"実行時刻が見つかりません: {self.expression}")
+
+    def __str__(self):
+        return self.label
+
 
 class Scheduler:
-    def __init__(self, time1, time2):
+    def __init__(self, time1=None, time2=None, schedules=None, state_file=None, lock_file=None, enabled=None):
         """
+        実行スケジュールを管理するクラス
+
+        次の実行時刻を計算してその時刻まで待機する。前回の実行時刻を状態ファイルに保存し、
+        実行されなかった時刻（起動の遅れ・前回の処理の長期化など）を検知する。
+
         Args:
-            time1 (list): 1回目の実行時間 [時, 分]
-            time2 (list): 2回目の実行時間 [時, 分]
+            time1 (list): 1回目の実行時間 [時, 分]（schedules未指定時に使用）
+            time2 (list): 2回目の実行時間 [時, 分]（schedules未指定時に使用）
+            schedules (list): CronExpressionのリスト
+            state_file: 前回の実行時刻の保存先（未指定時は [SCHEDULE] state_file）
+            lock_file: 多重実行防止用のロックファイル（未指定時は [SCHEDULE] lock_file）
+            enabled: スケジュール実行を行うかどうか（未指定時は [SCHEDULE] enabled）
         """
-        self.time1 = time1
-        self.time2 = time2
-        self.enabled = env.get_config_value('SCHEDULE', 'enabled', True)
+        if schedules is None:
+            schedules = [
+                CronExpression.from_time(f"{hour}:{minute}")
+                for hour, minute in (time1, time2) if time1 and time2
+            ]
+        self.schedules = schedules
+        self.enabled = env.get_config_value('SCHEDULE', 'enabled', True) if enabled is None else enabled
+        self.catch_up = env.get_config_value('SCHEDULE', 'catch_up', True)
+        self.catch_up_max_hours = env.get_config_value('SCHEDULE', 'catch_up_max_hours', 6)
+        self.max_sleep_sec = env.get_config_value('SCHEDULE', 'max_sleep_sec', 300)
+        self.prewarm_minutes = env.get_config_value('SCHEDULE', 'prewarm_minutes', 5)
+        self.keepalive_interval_sec = env.get_config_value('SCHEDULE', 'keepalive_interval_sec', 120)
+        self.state_file = env.get_project_root() / (
+            state_file or env.get_config_value('SCHEDULE', 'state_file', 'cache/scheduler_state.json')
+        )
+        self.lock_file = env.get_project_root() / (
+            lock_file or env.get_config_value('SCHEDULE', 'lock_file', 'cache/scheduler.lock')
+        )
+        # 今回実行する予定時刻（wait_for_execution_timeで設定）
+        self.current_slot = None
+        self._lock_handle = None
+        self.logger = get_logger(__name__)
 
-    def wait_for_execution_time(self):
-        """実行時間まで待機"""
-        if not self.enabled:
-            print("スケジューラーは無効化されています")
-            return
+    @classmethod
+    def from_config(cls) -> 'Scheduler':
+        """
+        [SCHEDULE] の設定からスケジューラーを作成
+
+        cron（セミコロン区切り）、exec_times（カンマ区切り）、exec_time1 / exec_time2 の順に使用する。
+
+        Returns:
+            Scheduler: スケジューラー
+        """
+        cron = str(env.get_config_value('SCHEDULE', 'cron', '') or '')
+        exec_times = str(env.get_config_value('SCHEDULE', 'exec_times', '') or '')
+        if cron.strip():
+            schedules = [CronExpression(text) for text in cron.split(';') if text.strip()]
+        elif exec_times.strip():
+            schedules = [CronExpression.from_time(text) for text in exec_times.split(',') if text.strip()]
+        else:
+            schedules = [
+                CronExpression.from_time(env.get_config_value('SCHEDULE', 'exec_time1', '12:00')),
+                CronExpression.from_time(env.get_config_value('SCHEDULE', 'exec_time2', '18:00'))
+            ]
+        return cls(schedules=schedules)
+
+    def next_run_time(self, after=None) -> datetime:
+        """
+        次の実行時刻を取得
+
+        Args:
+            after (datetime): 基準時刻（未指定時は現在時刻）
 
-        print("待機中")
-        while not self._check_execution_time():
-            time.sleep(1)
-        print("実行スタート")
+        Returns:
+            datetime: 次の実行時刻
+        """
+        after = after or datetime.now()
+        return min(schedule.next_after(after) for schedule in self.schedules)
+
+    def missed_runs(self, now=None, limit=100) -> list:
+        """
+        前回の実行以降、現在時刻までに実行されなかった時刻を取得
+
+        Args:
+            now (datetime): 現在時刻（未指定時は現在時刻）
+            limit (int): 取得する件数の上限
+
+        Returns:
+            list: 実行されなかった時刻のリスト（古い順）。前回の実行記録が無い場合は空リスト
+        """
+        now = now or datetime.now()
+        last_run = self._load_last_run()
+        missed = []
+        if last_run is None:
+            return missed
+        slot = last_run
+        while len(missed) < limit:
+            slot = self.next_run_time(slot)
+            if slot > now:
+                break
+            missed.append(slot)
+        return missed
+
+    def wait_for_execution_time(self, wake_event=None, prewarm=None, keepalive=None) -> bool:
+        """
+        次の実行時刻まで待機
+
+        実行されなかった時刻がある場合、catch_up が有効かつ catch_up_max_hours 以内であれば待機せずに実行する。
+        待機中は次の実行時刻まで（最大 max_sleep_sec 秒ずつ）sleepするだけで、CPUを使用しない。
+        prewarm を指定した場合は実行時刻の prewarm_minutes 分前に呼び出し、以降は実行時刻まで
+        keepalive_interval_sec 秒ごとに keepalive を呼び出す（例外は記録して待機を続ける）。
+        事前準備の前に多重実行防止のロックを取得し、他のプロセスが実行中の場合は事前準備・
+        セッション維持を行わない（実行中のプロセスが使用するブラウザのセッションに触れない）。
 
-    def _check_execution_time(self):
-        """実行時間のチェック"""
+        Args:
+            wake_event (threading.Event): 指定時はこのイベントがセットされた時点で待機を終了する（即時実行の要求）
+            prewarm (callable): 実行前の準備（ブラウザの起動・ログインなど）
+            keepalive (callable): 準備後、実行時刻までセッションを維持する処理
+
+        Returns:
+            bool: 実行時刻になった場合はTrue、wake_eventで待機を終了した場合はFalse
+        """
         if not self.enabled:
+            if wake_event is None:
+                self.logger.info("スケジューラーは無効化されています")
+                return True
+            self.logger.info("スケジューラーは無効化されています（実行要求を待機します）")
+            wake_event.wait()
+            return self._woken(wake_event)
+
+        now = datetime.now()
+        missed = self.missed_runs(now)
+        if missed:
+            missed_text = ', '.join(slot.strftime('%Y-%m-%d %H:%M') for slot in missed)
+            latest = missed[-1]
+            if self.catch_up and now - latest <= timedelta(hours=self.catch_up_max_hours):
+                self.logger.warning(f"実行されなかった時刻があります: {missed_text}（{latest:%Y-%m-%d %H:%M} 分を今すぐ実行します）")
+                self._start(latest)
+                return True
+            self.logger.warning(f"実行されなかった時刻があります: {missed_text}（追いつき実行の対象外のためスキップします）")
+
+        next_run = self.next_run_time(now)
+        self.logger.info(f"待機中: 次回の実行時刻は {next_run:%Y-%m-%d %H:%M} です")
+        prewarm_at = next_run - timedelta(minutes=self.prewarm_minutes) if prewarm and self.prewarm_minutes else None
+        next_keepalive = None
+        while True:
+            now = datetime.now()
+            remaining = (next_run - now).total_seconds()
+            if remaining <= 0:
+                break
+            if prewarm_at and now >= prewarm_at:
+                prewarm_at = None
+                if not self._try_lock():
+                    self.logger.info("他のプロセスが実行中のため、事前準備を行いません（実行時刻にロックを取得し直します）")
+                    continue
+                self.logger.info(f"実行時刻の{self.prewarm_minutes}分前のため、事前準備を開始します")
+                self._call_hook('事前準備', prewarm)
+                next_keepalive = datetime.now() + timedelta(seconds=self.keepalive_interval_sec) if keepalive else None
+                continue
+            if next_keepalive and now >= next_keepalive:
+                self._call_hook('セッション維持', keepalive)
+                next_keepalive = datetime.now() + timedelta(seconds=self.keepalive_interval_sec)
+                continue
+
+            # 次の実行時刻・事前準備・セッション維持のうち最も早い時刻まで待機
+            # （スリープ中の時刻変更やPCのスリープ復帰に備えて、一定時間ごとに残り時間を計算し直す）
+            wake_at = min(at for at in (next_run, prewarm_at, next_keepalive) if at)
+            sleep_sec = min(max((wake_at - now).total_seconds(), 0), self.max_sleep_sec)
+            if wake_event is None:
+                time.sleep(sleep_sec)
+            elif wake_event.wait(sleep_sec):
+                return self._woken(wake_event)
+        self._start(next_run)
+        return True
+
+    def _call_hook(self, name, hook):
+        """待機中の処理（事前準備・セッション維持）を呼び出す（失敗しても待機は続ける）"""
+        try:
+            hook()
+        except Exception as e:
+            self.logger.warning(f"{name}に失敗しました（実行時に再試行します）: {str(e)}")
+
+    def _woken(self, wake_event) -> bool:
+        """即時実行の要求で待機を終了"""
+        wake_event.clear()
+        self.current_slot = None
+        self.logger.info("実行要求を受け付けました: 今すぐ実行します")
+        return False
+
+    def _start(self, slot):
+        """実行する予定時刻を設定（実行済みとしての保存は mark_started で行う）"""
+        self.current_slot = slot
+        self.logger.info("実行スタート")
+
+    def mark_started(self):
+        """
+        今回実行する予定時刻を実行済みとして保存（acquire_lock に成功した後に呼び出す）
+
+        ロックを取得できずに実行しなかった予定時刻は保存しないため、次回の追いつき実行の対象になる。
+        即時実行の要求で開始した場合（予定時刻なし）は何もしない。
+        """
+        if self.current_slot is not None:
+            self._save_last_run(self.current_slot)
+
+    def _load_last_run(self):
+        """
+        前回実行した予定時刻を読み込む
+
+        Returns:
+            datetime: 前回の予定時刻。記録が無い場合はNone
+        """
+        try:
+            if self.state_file.exists():
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    return datetime.fromisoformat(json.load(f)['last_run'])
+        except Exception as e:
+            self.logger.warning(f"スケジューラーの状態の読み込みに失敗: {str(e)}")
+        return None
+
+    def _save_last_run(self, slot):
+        """実行する予定時刻を保存"""
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.state_file.with_name(f"{self.state_file.name}.tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'last_run': slot.isoformat(), 'started_at': datetime.now().isoformat()}, f)
+            os.replace(temp_file, self.state_file)
+        except Exception as e:
+            self.logger.warning(f"スケジューラーの状態の保存に失敗: {str(e)}")
+
+    def acquire_lock(self) -> bool:
+        """
+        多重実行防止のロックを取得
+
+        OSのファイルロックを使用するため、プロセスが異常終了した場合も自動的に解放される。
+        事前準備（wait_for_execution_time）で取得済みの場合はそのまま使用する。
+
+        Returns:
+            bool: 取得できた場合はTrue。他のプロセスが実行中の場合はFalse
+        """
+        if self._try_lock():
             return True
-            
-        current = datetime.now()
-        return (str(current.hour) == str(self.time1[0]) and str(current.minute) == str(self.time1[1])) or \
-               (str(current.hour) == str(self.time2[0]) and str(current.minute) == str(self.time2[1]))
+        self.logger.warning(f"他のプロセスが実行中のため、今回の実行をスキップします（ロック: {self.lock_file}）")
+        return False
+
+    def _try_lock(self) -> bool:
+        """ロックの取得を試みる（取得済みの場合はTrue）"""
+        if self._lock_handle:
+            return True
+        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(self.lock_file, 'a+')
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+
+        handle.seek(0)
+        handle.truncate()
+        handle.write(str(os.getpid()))
+        handle.flush()
+        self._lock_handle = handle
+        return True
+
+    def release_lock(self):
+        """多重実行防止のロックを解放"""
+        if not self._lock_handle:
+            return
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                self._lock_handle.seek(0)
+                msvcrt.locking(self._lock_handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self._lock_handle.fileno(), fcntl.LOCK_UN)
+        except OSError as e:
+            self.logger.warning(f"ロックの解放に失敗: {str(e)}")
+        finally:
+            self._lock_handle.close()
+            self._lock_handle = None
 
     def get_schedule_text(self) -> str:
         """スケジュール設定の文字列を取得"""
         if not self.enabled:
             return "無効"
-        return f"{self.time1[0]:02d}:{self.time1[1]:02d}, {self.time2[0]:02d}:{self.time2[1]:02d}" 
\ No newline at end of file
+        return ", ".join(str(schedule) for schedule in self.schedules)
@@ -1,7 +1,7 @@
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from ..utils.environment import EnvironmentUtils as env
-import time
+from ..utils.metrics import metrics
 
 class Search:
     def __init__(self, browser, selectors):
@@ -15,6 +15,7 @@ class Search:
         self.browser = browser
         self.selectors = selectors
 
+    @metrics.timed('search.execute')
     def execute(self):
         """
         検索処理を実行
@@ -33,7 +34,7 @@ class Search:
                     "#form_search"
                 ))
             )
-            time.sleep(1)
+            self.browser.ready.document_ready('search.form')
 
             # 提出ステータスの設定
             if not self._set_submit_status():
@@ -66,7 +67,6 @@ class Search:
                     "input[name='submission_status']"
                 ))
             )
-            time.sleep(1)
 
             # 値が0の場合は空文字列に変換（指定なし）
             status_selector_value = "" if int(status_value) == 0 else str(status_value)
@@ -101,7 +101,6 @@ class Search:
                     "input[name='submission_due']"
                 ))
             )
-            time.sleep(2)
 
             # JavaScriptを使用して要素をクリック
             selector = f"input[name='submission_due'][value='{deadline_selector_value}']"
@@ -136,23 +135,14 @@ class Search:
                     selector_value
                 ))
             )
+            table_mark = self.browser.ready.mark_table()
             search_button.click()
             
             # ローディング表示の消失を待機
-            self.browser.wait.until(
-                EC.invisibility_of_element_located((
-                    getattr(By, selector_type),
-                    ".loading"
-                ))
-            )
+            self.browser.ready.invisible('search.loading', (By.CSS_SELECTOR, ".loading"))
             
-            # テーブルの再読み込みを待機
-            self.browser.wait.until(
-                EC.presence_of_element_located((
-                    getattr(By, selector_type),
-                    "#recruitment-list table.table-sm"
-                ))
-            )
+            # テーブルの再描画を待機
+            self.browser.ready.table_rerendered('search.results', table_mark, required=True)
             print("✅ 検索ボタンをクリックし、結果を読み込み完了")
             return True
 
@@ -0,0 +1,160 @@
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.common.by import By
+from datetime import datetime, timedelta
+from pathlib import Path
+import json
+import os
+import threading
+import time
+from ..utils.environment import EnvironmentUtils as env
+from ..utils.logging_config import get_logger
+
+class SessionCache:
+    def __init__(self, cookie_file=None):
+        """
+        ログイン済みセッションのCookieを実行間で保存・再利用するクラス
+
+        Args:
+            cookie_file: Cookieの保存先（未指定時は [SESSION] cookie_file）
+        """
+        self.enabled = env.get_config_value('SESSION', 'enabled', False)
+        self.cookie_file = env.get_project_root() / (
+            cookie_file or env.get_config_value('SESSION', 'cookie_file', 'cache/session_cookies.json')
+        )
+        self.max_age_hours = env.get_config_value('SESSION', 'max_age_hours', 12)
+        self.validate_timeout = env.get_config_value('SESSION', 'validate_timeout', 5)
+        self.logger = get_logger(__name__)
+
+    @staticmethod
+    def get_user_data_dir():
+        """
+        ChromeのプロファイルディレクトリをSESSION設定から取得
+
+        Returns:
+            Path: プロファイルディレクトリ。未設定またはセッション再利用が無効の場合はNone
+        """
+        if not env.get_config_value('SESSION', 'enabled', False):
+            return None
+        user_data_dir = env.get_config_value('SESSION', 'user_data_dir', '')
+        if not user_data_dir:
+            return None
+        path = Path(user_data_dir)
+        if not path.is_absolute():
+            path = env.get_project_root() / path
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def save(self, driver):
+        """
+        現在のCookieを保存
+
+        Args:
+            driver: ログイン済みのWebDriverインスタンス
+        """
+        if not self.enabled:
+            return
+        try:
+            self.cookie_file.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                'saved_at': datetime.now().isoformat(),
+                'cookies': driver.get_cookies()
+            }
+            # 並列ワーカーが同時に保存しても壊れないよう、一時ファイルに書いてから置き換える
+            temp_file = self.cookie_file.with_name(f"{self.cookie_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_file, self.cookie_file)
+            self.logger.info(f"✅ セッションを保存しました（Cookie {len(data['cookies'])}件）")
+        except Exception as e:
+            self.logger.warning(f"セッションの保存に失敗: {str(e)}")
+
+    def clear(self):
+        """保存済みのCookieを削除"""
+        try:
+            if self.cookie_file.exists():
+                self.cookie_file.unlink()
+        except Exception as e:
+            self.logger.warning(f"セッションの削除に失敗: {str(e)}")
+
+    def _load_cookies(self):
+        """
+        有効期限内のCookieを読み込む
+
+        Returns:
+            list: Cookieのリスト。保存が無い、または保存から max_age_hours を超えている場合は空リスト
+        """
+        if not self.cookie_file.exists():
+            return []
+        with open(self.cookie_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        saved_at = datetime.fromisoformat(data['saved_at'])
+        if datetime.now() - saved_at > timedelta(hours=self.max_age_hours):
+            self.logger.info("保存済みセッションの有効期間を過ぎています")
+            return []
+
+        now = time.time()
+        return [
+            cookie for cookie in data.get('cookies', [])
+            if not cookie.get('expiry') or cookie['expiry'] > now
+        ]
+
+    def is_logged_in(self, browser, url):
+        """
+        管理画面トップを開き、ログイン後の見出しが表示されるかでセッションを確認
+
+        Args:
+            browser: Browserクラスのインスタンス
+            url: Basic認証情報を含む管理画面トップのURL
+
+        Returns:
+            bool: ログイン済みの場合はTrue
+        """
+        heading = browser.selectors['top']['page_heading']
+        browser.driver.get(url)
+        return bool(browser.ready.until(
+            'session.validate',
+            EC.presence_of_element_located((getattr(By, heading['type'].upper()), heading['selector_value'])),
+            timeout=self.validate_timeout,
+            required=False
+        ))
+
+    def restore(self, browser, login_url, top_url):
+        """
+        保存済みのCookie（またはChromeプロファイル）でログイン状態を復元
+
+        Args:
+            browser: Browserクラスのインスタンス
+            login_url: Basic認証情報を含むログインページのURL（Cookie設定前のドメイン確立に使用）
+            top_url: Basic認証情報を含む管理画面トップのURL（セッション確認に使用）
+
+        Returns:
+            bool: 復元できた場合はTrue。失敗時はCookieを消去してFalseを返す
+        """
+        if not self.enabled:
+            return False
+        try:
+            cookies = self._load_cookies()
+            if cookies:
+                # Cookieを設定するために対象ドメインのページを開く
+                browser.driver.get(login_url)
+                for cookie in cookies:
+                    try:
+                        browser.driver.add_cookie(cookie)
+                    except Exception as e:
+                        self.logger.debug(f"Cookieの設定をスキップ: {cookie.get('name')} ({str(e)})")
+            elif not self.get_user_data_dir():
+                return False
+
+            if self.is_logged_in(browser, top_url):
+                self.logger.info("✅ 保存済みセッションでログイン状態を復元しました")
+                return True
+
+            self.logger.info("保存済みセッションが無効のため、ログインを実行します")
+            browser.driver.delete_all_cookies()
+            self.clear()
+            return False
+
+        except Exception as e:
+            self.logger.warning(f"セッションの復元に失敗: {str(e)}")
+            return False
@@ -0,0 +1,122 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+import gzip
+import hashlib
+import json
+import os
+import threading
+from ..utils.environment import EnvironmentUtils as env
+from ..utils.logging_config import get_logger
+
+# スナップショットのファイル名（snapshot_YYYYMMDD_HHMMSS_ffffff_<pid>_<連番>.json.gz）
+FILE_PATTERN = 'snapshot_*.json.gz'
+
+
+class SnapshotArchive:
+    def __init__(self, directory=None, max_files=None, enabled=None):
+        """
+        検索結果ページ（#recruitment-list）のHTMLを圧縮して保存するクラス
+
+        1ページ1ファイル（gzip圧縮したJSON: 取得日時・URL・HTML・取得時の判定結果）として保存し、
+        max_files を超えた分は古いものから削除する。直前に保存したHTMLと同じ内容
+        （同じページの再確認など）は保存しない。
+        保存したスナップショットは src/reclassify.py でオフラインに判定し直せる。
+
+        Args:
+            directory: 保存先（未指定時は [ARCHIVE] directory）
+            max_files: 保存するスナップショットの最大数（未指定時は [ARCHIVE] max_files）
+            enabled: 保存するかどうか（未指定時は [ARCHIVE] enabled）
+        """
+        self.enabled = env.get_config_value('ARCHIVE', 'enabled', False) if enabled is None else enabled
+        directory = Path(directory or env.get_config_value('ARCHIVE', 'directory', 'logs/snapshots'))
+        self.directory = directory if directory.is_absolute() else env.get_project_root() / directory
+        self.max_files = max_files or env.get_config_value('ARCHIVE', 'max_files', 2000)
+        self._last_digest = None
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self.logger = get_logger(__name__)
+
+    def save(self, html: str, url: str = '', decisions: Optional[List[Dict]] = None) -> Optional[Path]:
+        """
+        スナップショットを保存
+
+        Args:
+            html: #recruitment-list のHTML
+            url: 取得したページのURL
+            decisions: 取得時の判定結果（レコード順の {id, application_id, pattern, pattern_reason}）
+
+        Returns:
+            Optional[Path]: 保存したファイル。無効・直前と同じ内容・保存に失敗した場合はNone
+        """
+        if not self.enabled or not html:
+            return None
+        digest = hashlib.sha1(html.encode('utf-8')).hexdigest()
+        with self._lock:
+            if digest == self._last_digest:
+                return None
+            self._last_digest = digest
+            self._sequence += 1
+            sequence = self._sequence
+
+        captured_at = datetime.now()
+        path = self.directory / (
+            f"snapshot_{captured_at.strftime('%Y%m%d_%H%M%S_%f')}_{os.getpid()}_{sequence:04d}.json.gz"
+        )
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            data = {
+                'captured_at': captured_at.isoformat(),
+                'url': url,
+                'sha1': digest,
+                'decisions': decisions or [],
+                'html': html,
+            }
+            with gzip.open(path, 'wt', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            self._rotate()
+            self.logger.debug("スナップショットを保存しました: %s", path.name)
+            return path
+        except Exception as e:
+            self.logger.warning(f"スナップショットの保存に失敗: {str(e)}")
+            return None
+
+    def _rotate(self):
+        """max_files を超えた古いスナップショットを削除"""
+        files = self.files()
+        for path in files[:max(0, len(files) - self.max_files)]:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                # 並列ワーカーが先に削除した場合
+                pass
+
+    def files(self) -> List[Path]:
+        """
+        保存済みのスナップショット（古い順）
+
+        Returns:
+            List[Path]: スナップショットのファイルのリスト
+        """
+        if not self.directory.exists():
+            return []
+        return sorted(self.directory.glob(FILE_PATTERN))
+
+    @staticmethod
+    def load(path: Path) -> Dict:
+        """
+        スナップショットを読み込む
+
+        Args:
+            path: スナップショットのファイル
+
+        Returns:
+            Dict: captured_at, url, sha1, decisions, html を持つ辞書
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+
+    def __iter__(self) -> Iterator[Dict]:
+        """保存済みのスナップショットを古い順に読み込む"""
+        for path in self.files():
+            yield self.load(path)
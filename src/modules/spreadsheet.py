@@ -3,7 +3,9 @@ import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 from datetime import datetime
 from typing import List, Dict, Optional
+import re
 from ..utils.environment import EnvironmentUtils as env
+from ..utils.metrics import metrics
 
 class SpreadSheet:
     def __init__(self, credentials_path: Path, spreadsheet_key: str):
@@ -16,6 +18,8 @@ class SpreadSheet:
         self.spreadsheet_key = spreadsheet_key
         self.client = None
         self.sheet = None
+        # 最終行の番号のキャッシュ（Noneの場合は未取得）
+        self._last_row = None
 
     def connect(self) -> bool:
         """
@@ -75,6 +79,7 @@ class SpreadSheet:
                     "更新反映"
                 ]
                 self.sheet.append_row(headers)
+                self._last_row = 1
             
             return True
             
@@ -82,15 +87,76 @@ class SpreadSheet:
             print(f"スプレッドシートへの接続に失敗: {str(e)}")
             return False
 
-    def get_last_row(self) -> Optional[int]:
+    def get_last_row(self, refresh: bool = False) -> Optional[int]:
         """
         スプレッドシートの最終行を取得します。
 
+        最初の呼び出し時のみシートに問い合わせ、以降は append_rows で更新したキャッシュを返します。
+
+        Args:
+            refresh (bool): キャッシュを使わずにシートから取得し直すかどうか
+
         Returns:
             Optional[int]: 最終行の番号。エラー時はNone
         """
+        if self._last_row is not None and not refresh:
+            return self._last_row
         try:
-            return len(self.sheet.col_values(1))
+            self._last_row = self._fetch_last_row()
+            return self._last_row
         except Exception as e:
             print(f"最終行の取得に失敗: {str(e)}")
-            return None 
\ No newline at end of file
+            return None
+
+    @metrics.timed('sheets.append_rows')
+    def append_rows(self, rows: List[List]) -> bool:
+        """
+        シートの末尾に行を追加し、最終行のキャッシュを更新します。
+
+        Args:
+            rows (List[List]): 追加する行のリスト
+
+        Returns:
+            bool: 追加に成功したかどうか（失敗時は例外を送出）
+        """
+        response = self.sheet.append_rows(rows)
+        end_row = self._range_end_row(response.get('updates', {}).get('updatedRange', ''))
+        if end_row is not None:
+            self._last_row = end_row
+        elif self._last_row is not None:
+            self._last_row += len(rows)
+        return True
+
+    def _fetch_last_row(self) -> int:
+        """
+        シートの最終行をシートから取得します。
+
+        値を書き込まない追加リクエストの tableRange（データのある範囲）から求め、
+        列全体のダウンロードを避けます。tableRange が返されない場合のみA列を取得します。
+
+        Returns:
+            int: 最終行の番号
+        """
+        response = self.sheet.spreadsheet.values_append(
+            f"'{self.sheet.title}'!A1",
+            {'valueInputOption': 'RAW', 'insertDataOption': 'OVERWRITE'},
+            {'values': []}
+        )
+        end_row = self._range_end_row(response.get('tableRange', ''))
+        if end_row is not None:
+            return end_row
+        return len(self.sheet.col_values(1))
+
+    @staticmethod
+    def _range_end_row(a1_range: str) -> Optional[int]:
+        """
+        A1形式の範囲（例: "exe_logsheet!A101:L105"）から終了行の番号を取得します。
+
+        Args:
+            a1_range (str): A1形式の範囲
+
+        Returns:
+            Optional[int]: 終了行の番号。取得できない場合はNone
+        """
+        match = re.search(r'(\d+)$', a1_range or '')
+        return int(match.group(1)) if match else None
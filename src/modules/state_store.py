@@ -0,0 +1,248 @@
+from datetime import date, datetime
+from dateutil.relativedelta import relativedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+import hashlib
+import sqlite3
+import threading
+from .judge_table import DATE_FORMATS
+from ..utils.environment import EnvironmentUtils as env
+from ..utils.logging_config import get_logger
+
+# フィンガープリントに含める項目（判定・スキップ条件に使う値）
+FINGERPRINT_FIELDS = ('status', 'training_start_date', 'zaiseki', 'oiwai', 'remark')
+
+# 項目が変わらない限り、判定し直しても結果が変わらない操作
+STABLE_ACTIONS = ('スキップ',)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applicant_state (
+    application_id TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    rules TEXT NOT NULL,
+    pattern INTEGER NOT NULL,
+    pattern_reason TEXT,
+    stable_until TEXT,
+    action TEXT,
+    changed_at TEXT NOT NULL,
+    seen_at TEXT NOT NULL
+)
+"""
+
+UPSERT = """
+INSERT INTO applicant_state
+    (application_id, fingerprint, rules, pattern, pattern_reason, stable_until, action, changed_at, seen_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(application_id) DO UPDATE SET
+    action = CASE
+        WHEN excluded.action IS NOT NULL THEN excluded.action
+        WHEN applicant_state.fingerprint = excluded.fingerprint THEN applicant_state.action
+    END,
+    changed_at = CASE
+        WHEN applicant_state.fingerprint = excluded.fingerprint THEN applicant_state.changed_at
+        ELSE excluded.changed_at
+    END,
+    fingerprint = excluded.fingerprint,
+    rules = excluded.rules,
+    pattern = excluded.pattern,
+    pattern_reason = excluded.pattern_reason,
+    stable_until = excluded.stable_until,
+    seen_at = excluded.seen_at
+"""
+
+
+def record_key(record: Dict) -> Optional[str]:
+    """レコードのキー（応募ID。取得できない場合は応募者ID）"""
+    return record.get('application_id') or record.get('id') or None
+
+
+def fingerprint(record: Dict) -> str:
+    """
+    判定に使う項目のハッシュ
+
+    Args:
+        record: 応募者データ
+
+    Returns:
+        str: status, training_start_date, zaiseki, oiwai, remark から求めたハッシュ
+    """
+    values = '\x1f'.join((record.get(field) or '').strip() for field in FINGERPRINT_FIELDS)
+    return hashlib.sha1(values.encode('utf-8')).hexdigest()
+
+
+def stable_until(training_start_date: str, today: date) -> Optional[date]:
+    """
+    項目が変わらなければ判定結果が変わらない期限
+
+    判定が時間で変わるのは研修初日が日付の場合のみで、研修初日の当日（実行時刻との比較）・
+    研修初日の翌月の初日（実行月以降の判定）・研修初日の1ヶ月後（1ヶ月以上経過の判定）に変わりうる。
+    この中で today より後の最も早い日を期限とする。
+
+    Args:
+        training_start_date: 研修初日
+        today: 基準日
+
+    Returns:
+        Optional[date]: 期限（この日より前であれば判定は変わらない）。期限が無い場合はNone
+    """
+    for fmt in DATE_FORMATS:
+        try:
+            training_date = datetime.strptime(training_start_date, fmt).date()
+            break
+        except (TypeError, ValueError):
+            continue
+    else:
+        # 未定・日付として解釈できない値は時間で判定が変わらない
+        return None
+
+    thresholds = [
+        training_date,
+        training_date.replace(day=1) + relativedelta(months=1),
+        training_date + relativedelta(months=1),
+    ]
+    upcoming = [threshold for threshold in thresholds if threshold > today]
+    return min(upcoming) if upcoming else None
+
+
+class StateStore:
+    def __init__(self, path=None, enabled=None):
+        """
+        応募IDごとに、前回の実行で見た項目のフィンガープリント・判定結果・操作を保存するクラス（SQLite）
+
+        次の実行で項目が変わっておらず、判定条件も同じで、判定結果が時間で変わる期限（stable_until）
+        より前のチェック対象外のレコード（パターン99、またはスキップ条件に該当したもの）は、
+        保存した判定結果を使って判定・チェックの処理を省略できる（記録・通知には保存した判定結果で出力する）。
+        期限を過ぎたレコードは判定し直す。
+
+        Args:
+            path: データベースファイル（未指定時は [STATE] file）
+            enabled: 使用するかどうか（未指定時は [STATE] enabled）
+        """
+        self.enabled = env.get_config_value('STATE', 'enabled', False) if enabled is None else enabled
+        path = Path(path or env.get_config_value('STATE', 'file', 'cache/applicant_state.sqlite3'))
+        self.path = path if path.is_absolute() else env.get_project_root() / path
+        self._connection = None
+        self._lock = threading.Lock()
+        self.logger = get_logger(__name__)
+
+    def _connect(self) -> sqlite3.Connection:
+        """データベースに接続（初回のみテーブルを作成）"""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # 並列ワーカーのブラウザごとの接続が同じファイルを使うため、ロック待ちの時間を設ける
+            self._connection = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+            self._connection.execute(SCHEMA)
+            self._connection.commit()
+        return self._connection
+
+    def unchanged(self, records: List[Dict], rules: str, today: Optional[date] = None) -> Dict[int, Dict]:
+        """
+        前回から変化が無く、判定・チェックを省略できるレコードを求める
+
+        Args:
+            records: 応募者データのリスト
+            rules: 判定条件の識別子（ApplicantChecker.rules_signature()）
+            today: 基準日（未指定時は今日）
+
+        Returns:
+            Dict[int, Dict]: 省略できるレコードの records でのインデックスと、保存した
+                             {pattern, pattern_reason, action}
+        """
+        if not self.enabled or not records:
+            return {}
+        today = today or date.today()
+        keys = [record_key(record) for record in records]
+        try:
+            with self._lock:
+                connection = self._connect()
+                stored = {}
+                targets = [key for key in keys if key]
+                # SQLiteの変数の上限を超えないよう分けて取得する
+                for offset in range(0, len(targets), 500):
+                    chunk = targets[offset:offset + 500]
+                    rows = connection.execute(
+                        "SELECT application_id, fingerprint, rules, pattern, pattern_reason, stable_until, action "
+                        f"FROM applicant_state WHERE application_id IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    )
+                    stored.update((row[0], row[1:]) for row in rows)
+        except sqlite3.Error as e:
+            self.logger.warning(f"状態ストアの読み込みに失敗: {str(e)}")
+            return {}
+
+        skipped = {}
+        counts = {'new': 0, 'changed': 0, 'expired': 0, 'target': 0}
+        for index, (record, key) in enumerate(zip(records, keys)):
+            state = stored.get(key)
+            if state is None:
+                counts['new'] += 1
+                continue
+            stored_fingerprint, stored_rules, pattern, reason, until, action = state
+            if stored_fingerprint != fingerprint(record) or stored_rules != rules:
+                counts['changed'] += 1
+                continue
+            decision = {'pattern': pattern, 'pattern_reason': reason or '', 'action': action}
+            if action in STABLE_ACTIONS:
+                skipped[index] = decision
+                continue
+            if 1 <= pattern <= 4:
+                counts['target'] += 1
+                continue
+            if until is not None and today >= date.fromisoformat(until):
+                # 期限を過ぎたため判定が変わりうる（新たにチェック対象になりうる）
+                counts['expired'] += 1
+                continue
+            skipped[index] = decision
+
+        self.logger.info(
+            f"状態ストア: {len(records)}件中 変化なし {len(skipped)}件は保存した判定結果を使用 "
+            f"（新規 {counts['new']}件・変更 {counts['changed']}件・期限到来 {counts['expired']}件・"
+            f"チェック対象 {counts['target']}件）"
+        )
+        return skipped
+
+    def record(self, records: List[Dict], rules: str, today: Optional[date] = None):
+        """
+        判定結果・操作を保存
+
+        Args:
+            records: pattern, pattern_reason を設定した応募者データのリスト
+                     （confirm_checkbox が設定されていれば操作として保存し、無ければ前回の操作を引き継ぐ）
+            rules: 判定条件の識別子
+            today: 基準日（未指定時は今日）
+        """
+        if not self.enabled or not records:
+            return
+        today = today or date.today()
+        now = datetime.now().isoformat(timespec='seconds')
+        rows = []
+        for record in records:
+            key = record_key(record)
+            if not key or record.get('pattern') in (None, ''):
+                continue
+            until = stable_until(record.get('training_start_date', ''), today)
+            rows.append((
+                key,
+                fingerprint(record),
+                rules,
+                int(record['pattern']),
+                record.get('pattern_reason', ''),
+                until.isoformat() if until else None,
+                record.get('confirm_checkbox') or None,
+                now,
+                now,
+            ))
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.executemany(UPSERT, rows)
+                connection.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"状態ストアの保存に失敗: {str(e)}")
+
+    def close(self):
+        """データベースの接続を閉じる"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,201 @@
+from typing import Dict, List, Optional
+from lxml import etree, html as lxml_html
+from lxml.cssselect import CSSSelector
+
+# 検索結果テーブル
+TABLE_SELECTOR = "#recruitment-list table.table-sm"
+
+# スナップショットで取得する要素（selectors.csv の要素名）
+SNAPSHOT_ELEMENTS = [
+    'applicant_id', 'status', 'training_start_date', 'zaiseki_ok',
+    'pattern_reason', 'remark', 'confirm_checkbox'
+]
+
+
+def snapshot_locator(selectors: Dict[str, Dict], element: str) -> Optional[List[str]]:
+    """
+    selectors.csvの定義をスナップショット用のロケーターに変換
+
+    Args:
+        selectors: セレクター情報（ApplicantChecker.get_selectors()）
+        element: セレクター定義の要素名
+
+    Returns:
+        list: ['css' または 'xpath', セレクター値]。定義が無い場合はNone
+    """
+    if element not in selectors:
+        return None
+
+    selector_type = selectors[element]['selector_type'].upper()
+    selector_value = selectors[element]['selector_value']
+
+    if selector_type == 'XPATH':
+        return ['xpath', selector_value]
+    if selector_type == 'ID':
+        return ['css', f'[id="{selector_value}"]']
+    if selector_type == 'NAME':
+        return ['css', f'[name="{selector_value}"]']
+    if selector_type == 'CLASS_NAME':
+        return ['css', f'.{selector_value}']
+    if selector_type == 'LINK_TEXT':
+        return ['xpath', f'.//a[normalize-space()="{selector_value}"]']
+    # CSS_SELECTOR / TAG_NAME はそのままquerySelectorで扱える
+    return ['css', selector_value]
+
+
+def snapshot_spec(selectors: Dict[str, Dict]) -> Dict[str, Optional[List[str]]]:
+    """
+    スナップショットで取得する要素ごとのロケーター定義を作成
+
+    Args:
+        selectors: セレクター情報
+
+    Returns:
+        Dict[str, Optional[List[str]]]: {要素名: [方式('css'|'xpath'), 値]}
+    """
+    spec = {element: snapshot_locator(selectors, element) for element in SNAPSHOT_ELEMENTS}
+    # お祝いはaction_typeがget_textの場合のみテキストを取得（process_recordと同じ扱い）
+    celebration = selectors.get('celebration')
+    if celebration and celebration['action_type'] == 'get_text':
+        spec['celebration'] = snapshot_locator(selectors, 'celebration')
+    else:
+        spec['celebration'] = None
+    return spec
+
+
+def normalize_record(record: Dict) -> Dict:
+    """
+    スナップショットの1レコードを応募者データの形式に揃える
+
+    Args:
+        record: レコードごとの取得値（要素が無い項目はNone）
+
+    Returns:
+        Dict: id, application_id, applicant_name, status, training_start_date,
+              zaiseki, oiwai, pattern_reason, remark, checked を持つ辞書
+    """
+    training_date = record.get('training_start_date')
+    return {
+        'index': int(record['index']),
+        'id': record.get('id'),
+        'application_id': record.get('application_id') or '',
+        'applicant_name': record.get('applicant_name') or '',
+        'status': record.get('status') or '',
+        # data-valueが空、または要素が無い場合は「未定」とする
+        'training_start_date': training_date if training_date else '未定',
+        'zaiseki': record.get('zaiseki') or '',
+        'oiwai': record.get('oiwai') or '',
+        'pattern_reason': record.get('pattern_reason') or '',
+        'remark': record.get('remark') or '',
+        'checked': record.get('checked')
+    }
+
+
+class TableParser:
+    def __init__(self, selectors: Dict[str, Dict]):
+        """
+        検索結果テーブルのHTMLを、ブラウザを使わずにlxmlで解析するクラス
+
+        Adoption.snapshot_page（SNAPSHOT_SCRIPT）と同じセレクター・同じ規則で
+        1レコード3行のテーブルを読み取り、同じ形式のレコードを返す。
+        ロケーターはインスタンスの作成時に1回だけコンパイルする。
+
+        Args:
+            selectors: セレクター情報（ApplicantChecker.get_selectors()）
+        """
+        self.table = CSSSelector(TABLE_SELECTOR)
+        self.locators = {
+            element: self._compile(locator)
+            for element, locator in snapshot_spec(selectors).items()
+        }
+        self.application_id = CSSSelector('td:nth-child(2)')
+        self.applicant_name = CSSSelector('td:nth-child(3)')
+
+    @staticmethod
+    def _compile(locator: Optional[List[str]]):
+        """ロケーターをlxmlで評価できる形式にコンパイル"""
+        if locator is None:
+            return None
+        if locator[0] == 'xpath':
+            return etree.XPath(locator[1])
+        return CSSSelector(locator[1])
+
+    @staticmethod
+    def _find(row, locator):
+        """行の中で最初に一致する要素（querySelector / document.evaluate と同じ）"""
+        if row is None or locator is None:
+            return None
+        found = locator(row)
+        return found[0] if found else None
+
+    @staticmethod
+    def _text(element) -> Optional[str]:
+        """要素のテキスト（前後の空白を除く）"""
+        if element is None:
+            return None
+        return element.text_content().strip()
+
+    @classmethod
+    def _selected_text(cls, element) -> Optional[str]:
+        """
+        select要素の選択中の項目のテキスト（select以外は要素のテキスト）
+
+        HTMLの selected 属性で判定するため、画面上で選択を変更した後の値は反映されない。
+        """
+        if element is None:
+            return None
+        if element.tag == 'select':
+            options = element.xpath('.//option')
+            selected = next((option for option in options if option.get('selected') is not None), None)
+            if selected is None and options:
+                selected = options[0]
+            return selected.text_content().strip() if selected is not None else ''
+        return cls._text(element)
+
+    def parse(self, html: str) -> Optional[List[Dict]]:
+        """
+        HTMLから検索結果テーブルの全レコードを取得
+
+        Args:
+            html: ページ全体、または #recruitment-list 部分のHTML
+
+        Returns:
+            list: normalize_record 形式のレコードのリスト。テーブルが無い場合はNone
+        """
+        return self.parse_element(lxml_html.fromstring(html))
+
+    def parse_element(self, root) -> Optional[List[Dict]]:
+        """
+        解析済みのHTML（lxmlの要素）から検索結果テーブルの全レコードを取得
+
+        Args:
+            root: lxml.html で解析した要素
+
+        Returns:
+            list: normalize_record 形式のレコードのリスト。テーブルが無い場合はNone
+        """
+        tables = self.table(root)
+        if not tables:
+            return None
+
+        # ブラウザが補うtbodyが無いHTML（サーバーの応答そのまま）にも対応する
+        rows = tables[0].xpath('./tbody/tr | ./tr')
+        records = []
+        for i in range(0, len(rows) - 2, 3):
+            row1, row2, row3 = rows[i], rows[i + 1], rows[i + 2]
+            training = self._find(row1, self.locators['training_start_date'])
+            checkbox = self._find(row3, self.locators['confirm_checkbox'])
+            records.append(normalize_record({
+                'index': i // 3,
+                'id': self._text(self._find(row1, self.locators['applicant_id'])),
+                'application_id': self._text(self._find(row1, self.application_id)),
+                'applicant_name': self._text(self._find(row1, self.applicant_name)),
+                'status': self._selected_text(self._find(row1, self.locators['status'])),
+                'training_start_date': (training.get('data-value') or '') if training is not None else None,
+                'zaiseki': self._selected_text(self._find(row2, self.locators['zaiseki_ok'])),
+                'oiwai': self._text(self._find(row3, self.locators['celebration'])),
+                'pattern_reason': self._text(self._find(row3, self.locators['pattern_reason'])),
+                'remark': self._text(self._find(row3, self.locators['remark'])),
+                'checked': checkbox.get('checked') is not None if checkbox is not None else None
+            }))
+        return records
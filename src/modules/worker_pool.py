@@ -0,0 +1,130 @@
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue, Empty
+import traceback
+from .adoption import Adoption
+from .login import Login
+from .search import Search
+from .session import SessionCache
+from ..utils.logging_config import get_logger
+
+class ApplicantWorkerPool:
+    def __init__(self, checker, env, workers, settings_path='config/settings.ini',
+                 selectors_path='config/selectors.csv', logger_instance=None):
+        """
+        複数のブラウザで応募IDを並列に処理するクラス
+
+        ワーカーごとに独立したBrowserを起動・ログイン・検索し、共有キューから応募IDを取り出して
+        Browser._process_single_application_id と同じ処理を行う。
+
+        Args:
+            checker: ApplicantCheckerクラスのインスタンス
+            env: EnvironmentUtilsクラス
+            workers: ワーカー（ブラウザ）の数
+            settings_path: 設定ファイルのパス
+            selectors_path: セレクターファイルのパス
+            logger_instance: スプレッドシート記録用のLoggerクラスのインスタンス
+        """
+        self.checker = checker
+        self.env = env
+        self.workers = workers
+        self.settings_path = settings_path
+        self.selectors_path = selectors_path
+        self.logger_instance = logger_instance
+        self.logger = get_logger(__name__)
+
+    def run(self, application_ids):
+        """
+        応募IDを並列に処理
+
+        Args:
+            application_ids: 処理する応募IDのリスト
+
+        Returns:
+            list: 全ワーカーが処理した応募者データを応募IDの順に並べたリスト
+        """
+        queue = Queue()
+        for app_id in application_ids:
+            queue.put(app_id)
+
+        workers = max(1, min(self.workers, len(application_ids)))
+        self.logger.info(f"=== {workers}ワーカーで{len(application_ids)}件の応募IDを処理します ===")
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='applicant-worker') as executor:
+            futures = [executor.submit(self._work, worker_no, queue) for worker_no in range(1, workers + 1)]
+            for future in futures:
+                results.update(future.result())
+
+        # ワーカーが異常終了して取り残された応募IDを記録
+        remaining = []
+        while True:
+            try:
+                remaining.append(queue.get_nowait())
+            except Empty:
+                break
+        if remaining:
+            self.logger.warning(f"未処理の応募IDがあります: {remaining}")
+
+        processed = [results[app_id] for app_id in application_ids if app_id in results]
+        self.logger.info(f"✅ 並列処理が完了しました（処理件数: {len(processed)}/{len(application_ids)}）")
+        return processed
+
+    def _work(self, worker_no, queue):
+        """
+        1ワーカー分の処理（ブラウザの起動から終了まで）
+
+        Args:
+            worker_no: ワーカー番号（ログの識別に使用）
+            queue: 応募IDの共有キュー
+
+        Returns:
+            dict: {応募ID: 応募者データ}
+        """
+        # 循環importを避けるためここでimport
+        from .browser import Browser
+
+        worker_logger = get_logger(f"src.modules.browser.worker{worker_no}")
+        results = {}
+        browser = None
+        try:
+            browser = Browser(settings_path=self.settings_path, selectors_path=self.selectors_path)
+            browser.logger = worker_logger
+            browser.logger_instance = self.logger_instance
+            # Chromeのプロファイルは複数のブラウザで共有できないため使用しない
+            browser.setup(use_profile=False)
+
+            success, url = Login(browser, session_cache=SessionCache()).execute()
+            if not success:
+                raise Exception("ログイン処理に失敗しました")
+
+            browser.driver.get(f"{url}/adoptions")
+            browser.ready.document_ready(f'worker{worker_no}.adoptions')
+
+            selectors = self.checker.get_selectors()
+            if not Search(browser, selectors).execute():
+                raise Exception("検索処理に失敗しました")
+
+            adoption = Adoption(browser, selectors, checker=self.checker, env=self.env)
+            worker_logger.info(f"ワーカー{worker_no}: 処理を開始します")
+
+            while True:
+                try:
+                    app_id = queue.get_nowait()
+                except Empty:
+                    break
+                result, applicant_data = browser._process_single_application_id(
+                    app_id, self.checker, self.env, adoption
+                )
+                if result and applicant_data:
+                    results[app_id] = applicant_data
+
+            worker_logger.info(f"ワーカー{worker_no}: 処理が完了しました（{len(results)}件）")
+
+        except Exception as e:
+            worker_logger.error(f"❌ ワーカー{worker_no}でエラー: {str(e)}")
+            traceback.print_exc()  # スタックトレースを出力
+        finally:
+            if browser and browser.driver:
+                browser.quit()
+
+        return results
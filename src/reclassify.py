@@ -0,0 +1,187 @@
+"""
+保存したスナップショット（[ARCHIVE]）を、現在の判定条件でオフラインに判定し直す
+
+ブラウザ・実サイトには接続しない。スナップショットのHTMLを Adoption.snapshot_page と同じ
+セレクターでlxmlにより解析し、ApplicantChecker で判定し直して、取得時の判定結果から
+変わるレコードを一覧にする。判定の基準時刻は既定ではスナップショットの取得日時
+（--now 指定時は現在時刻）。スナップショットが多い場合はプロセスプールで並列に処理する。
+
+使用例:
+    python -m src.reclassify
+    python -m src.reclassify --judge-list config/judge_list_new.csv --use-judge-list --workers 4 --output logs/reclassify.json
+"""
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional
+import argparse
+import json
+import os
+from src.modules.checker import ApplicantChecker
+from src.modules.snapshot_archive import SnapshotArchive
+from src.modules.table_parser import TableParser
+from src.utils.environment import EnvironmentUtils as env
+
+# プロセスごとに1回だけ作成する判定・解析のインスタンス
+_context = {}
+
+
+def init_context(project_root: Path, selectors_file: Path, judge_list_file: Path,
+                 use_judge_list: Optional[bool] = None) -> None:
+    """
+    判定・解析のインスタンスを作成（プロセスプールの各プロセスの初期化でも使用）
+
+    Args:
+        project_root: プロジェクトのルートディレクトリ
+        selectors_file: セレクターファイル
+        judge_list_file: 判定パターンファイル
+        use_judge_list: judge_list.csv の判定表を使用するかどうか（未指定時は [JUDGE] use_judge_list）
+    """
+    env.set_project_root(project_root)
+    checker = ApplicantChecker(selectors_file, judge_list_file)
+    if use_judge_list is not None:
+        checker.use_judge_list = use_judge_list
+    _context['checker'] = checker
+    _context['parser'] = TableParser(checker.get_selectors())
+
+
+def reclassify_file(path: Path, use_captured_at: bool = True) -> Dict:
+    """
+    スナップショット1件を判定し直す
+
+    Args:
+        path: スナップショットのファイル
+        use_captured_at: 取得日時を基準時刻にするかどうか（Falseの場合は現在時刻）
+
+    Returns:
+        Dict: file, captured_at, records, compared, patterns, changes を持つ辞書
+    """
+    data = SnapshotArchive.load(path)
+    records = _context['parser'].parse(data['html']) or []
+    now = datetime.fromisoformat(data['captured_at']) if use_captured_at else None
+    classifications = _context['checker'].classify_many(records, now)
+    # 状態ストアで判定を省略したレコードは取得時の判定結果が無いため、応募者IDで対応付ける
+    decisions = {decision.get('id'): decision for decision in data.get('decisions') or []}
+
+    changes = []
+    compared = 0
+    for record, (pattern, reason) in zip(records, classifications):
+        decision = decisions.get(record['id'])
+        if decision is None:
+            continue
+        compared += 1
+        if decision['pattern'] != pattern:
+            changes.append({
+                'id': record['id'],
+                'application_id': record['application_id'],
+                'status': record['status'],
+                'training_start_date': record['training_start_date'],
+                'zaiseki': record['zaiseki'],
+                'before': decision['pattern'],
+                'after': pattern,
+                'before_reason': decision.get('pattern_reason', ''),
+                'after_reason': reason,
+            })
+
+    return {
+        'file': Path(path).name,
+        'captured_at': data['captured_at'],
+        'records': len(records),
+        'compared': compared,
+        'patterns': dict(Counter(str(pattern) for pattern, _ in classifications)),
+        'changes': changes,
+    }
+
+
+def reclassify(files: List[Path], workers: int = 1, use_captured_at: bool = True,
+               project_root: Optional[Path] = None, selectors_file: Optional[Path] = None,
+               judge_list_file: Optional[Path] = None, use_judge_list: Optional[bool] = None) -> List[Dict]:
+    """
+    スナップショットをまとめて判定し直す（workers が2以上の場合はプロセスプールで並列に処理）
+
+    Args:
+        files: スナップショットのファイルのリスト
+        workers: プロセス数
+        use_captured_at: 取得日時を基準時刻にするかどうか
+        project_root: プロジェクトのルートディレクトリ（未指定時は現在の設定）
+        selectors_file: セレクターファイル（未指定時は config/selectors.csv）
+        judge_list_file: 判定パターンファイル（未指定時は config/judge_list.csv）
+        use_judge_list: judge_list.csv の判定表を使用するかどうか
+
+    Returns:
+        List[Dict]: files と同じ順の reclassify_file の結果
+    """
+    project_root = project_root or env.get_project_root()
+    initargs = (
+        project_root,
+        selectors_file or project_root / 'config' / 'selectors.csv',
+        judge_list_file or project_root / 'config' / 'judge_list.csv',
+        use_judge_list,
+    )
+    task = partial(reclassify_file, use_captured_at=use_captured_at)
+
+    if workers <= 1 or len(files) <= 1:
+        base_dir = env.get_project_root()
+        try:
+            init_context(*initargs)
+            return [task(path) for path in files]
+        finally:
+            env.set_project_root(base_dir)
+
+    chunksize = max(1, len(files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_context, initargs=initargs) as executor:
+        return list(executor.map(task, files, chunksize=chunksize))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='保存したスナップショットを現在の判定条件で判定し直す')
+    parser.add_argument('--archive', type=Path, default=None, help='スナップショットの保存先（未指定時は [ARCHIVE] directory）')
+    parser.add_argument('--selectors', type=Path, default=None, help='セレクターファイル')
+    parser.add_argument('--judge-list', type=Path, default=None, help='判定パターンファイル')
+    judge = parser.add_mutually_exclusive_group()
+    judge.add_argument('--use-judge-list', dest='use_judge_list', action='store_true', default=None,
+                       help='judge_list.csv の判定表で判定する')
+    judge.add_argument('--builtin', dest='use_judge_list', action='store_false',
+                       help='組み込みの判定条件で判定する')
+    parser.add_argument('--now', action='store_true', help='取得日時ではなく現在時刻を基準に判定する')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='並列に処理するプロセス数')
+    parser.add_argument('--output', type=Path, default=None, help='結果のJSONの出力先')
+    args = parser.parse_args()
+
+    files = SnapshotArchive(directory=args.archive, enabled=True).files()
+    results = reclassify(
+        files,
+        workers=args.workers,
+        use_captured_at=not args.now,
+        selectors_file=args.selectors,
+        judge_list_file=args.judge_list,
+        use_judge_list=args.use_judge_list,
+    )
+
+    patterns = Counter()
+    for result in results:
+        patterns.update(result['patterns'])
+        for change in result['changes']:
+            print(
+                f"{result['file']} 応募ID: {change['application_id']} ({change['status']} / "
+                f"{change['training_start_date']} / {change['zaiseki'] or '-'}) "
+                f"パターン {change['before']} -> {change['after']}（{change['after_reason']}）"
+            )
+    changed = sum(len(result['changes']) for result in results)
+    print(
+        f"\nスナップショット: {len(results)}件 / レコード: {sum(result['records'] for result in results)}件 / "
+        f"比較: {sum(result['compared'] for result in results)}件 / 判定が変わるレコード: {changed}件"
+    )
+    print("パターン別: " + ", ".join(f"{pattern}: {count}件" for pattern, count in sorted(patterns.items())))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'created_at': datetime.now().isoformat(), 'results': results}, f, ensure_ascii=False, indent=2)
+        print(f"結果を出力しました: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
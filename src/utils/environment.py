@@ -3,7 +3,103 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 from typing import Optional, Any
+from types import MappingProxyType
 import configparser
+import threading
+import time
+
+
+class ConfigSnapshot:
+    """
+    設定ファイルを一度だけ読み込み、型変換済みの値を保持するクラス
+
+    ファイルの更新（mtime・サイズの変化）を検知した場合のみ読み込み直す。
+    更新の確認（stat）は check_interval 秒に一度に間引く。
+    """
+
+    def __init__(self, path: Path, check_interval: float = 1.0):
+        """
+        Args:
+            path (Path): 設定ファイルのパス
+            check_interval (float): ファイル更新を確認する間隔（秒）
+        """
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._values = MappingProxyType({})
+        self._signature = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def coerce(value: str) -> Any:
+        """
+        設定値の文字列を int / float / bool に変換します（該当しない場合は文字列のまま）。
+
+        Args:
+            value (str): 設定値の文字列
+
+        Returns:
+            Any: 変換後の値
+        """
+        if value.isdigit():
+            return int(value)
+        if value.replace('.', '', 1).isdigit():
+            return float(value)
+        if value.lower() in ['true', 'false']:
+            return value.lower() == 'true'
+        return value
+
+    def view(self) -> MappingProxyType:
+        """
+        読み取り専用の設定値を取得します（必要に応じて読み込み直します）。
+
+        Returns:
+            MappingProxyType: {セクション名: {キー名: 型変換済みの値}}
+        """
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.check_interval:
+            return self._values
+        with self._lock:
+            if self._checked_at is None or now - self._checked_at >= self.check_interval:
+                stat = self.path.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if signature != self._signature:
+                    self._values = self._load()
+                    self._signature = signature
+                self._checked_at = now
+        return self._values
+
+    def get(self, section: str, key: str, default: Optional[Any] = None) -> Any:
+        """
+        指定のセクションとキーの値を取得します。
+
+        Args:
+            section (str): セクション名
+            key (str): キー名
+            default (Optional[Any]): セクションまたはキーが無い場合に返す値
+
+        Returns:
+            Any: 型変換済みの設定値
+        """
+        values = self.view().get(section)
+        if values is None:
+            return default
+        return values.get(key.lower(), default)
+
+    def _load(self) -> MappingProxyType:
+        """設定ファイルを読み込み、型変換済みの読み取り専用ビューを作成します。"""
+        config = configparser.ConfigParser()
+
+        # utf-8 エンコーディングで読み込む
+        config.read(self.path, encoding='utf-8')
+
+        return MappingProxyType({
+            section: MappingProxyType({
+                key: self.coerce(value) for key, value in config.items(section)
+            })
+            for section in config.sections()
+        })
+
 
 class EnvironmentUtils:
     """プロジェクト全体で使用する環境関連のユーティリティクラス"""
@@ -11,6 +107,9 @@ class EnvironmentUtils:
     # プロジェクトルートのデフォルト値
     BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
+    # (プロジェクトルート, 設定ファイル名) ごとのConfigSnapshot
+    _config_snapshots = {}
+
     @staticmethod
     def set_project_root(path: Path) -> None:
         """
@@ -96,6 +195,7 @@ class EnvironmentUtils:
     def get_config_value(section: str, key: str, default: Optional[Any] = None) -> Any:
         """
         設定ファイルから指定のセクションとキーの値を取得します。
+        読み込み済みのスナップショットから返すため、呼び出しごとのファイル読み込みは発生しません。
 
         Args:
             section (str): セクション名
@@ -105,27 +205,38 @@ class EnvironmentUtils:
         Returns:
             Any: 設定値
         """
-        config_path = EnvironmentUtils.get_config_file()
-        config = configparser.ConfigParser()
+        return EnvironmentUtils.get_config_snapshot().get(section, key, default)
 
-        # utf-8 エンコーディングで読み込む
-        config.read(config_path, encoding='utf-8')
+    @staticmethod
+    def get_config_snapshot(file_name: str = "settings.ini") -> ConfigSnapshot:
+        """
+        設定ファイルのConfigSnapshotを取得します（ファイルごとに1つを共有します）。
 
-        if not config.has_section(section):
-            return default
-        if not config.has_option(section, key):
-            return default
+        Args:
+            file_name (str): 設定ファイル名
 
-        value = config.get(section, key, fallback=default)
+        Returns:
+            ConfigSnapshot: 設定ファイルのスナップショット
+        """
+        cache_key = (EnvironmentUtils.BASE_DIR, file_name)
+        snapshot = EnvironmentUtils._config_snapshots.get(cache_key)
+        if snapshot is None:
+            config_path = EnvironmentUtils.get_config_file(file_name)
+            snapshot = EnvironmentUtils._config_snapshots.setdefault(cache_key, ConfigSnapshot(config_path))
+        return snapshot
 
-        # 型変換
-        if value.isdigit():
-            return int(value)
-        if value.replace('.', '', 1).isdigit():
-            return float(value)
-        if value.lower() in ['true', 'false']:
-            return value.lower() == 'true'
-        return value
+    @staticmethod
+    def get_config(file_name: str = "settings.ini") -> MappingProxyType:
+        """
+        設定ファイル全体の読み取り専用ビューを取得します。
+
+        Args:
+            file_name (str): 設定ファイル名
+
+        Returns:
+            MappingProxyType: {セクション名: {キー名: 型変換済みの値}}
+        """
+        return EnvironmentUtils.get_config_snapshot(file_name).view()
 
     @staticmethod
     def resolve_path(path: str) -> Path:
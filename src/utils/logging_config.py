@@ -1,6 +1,11 @@
 # utils\logging_config.py
+import atexit
+import json
 import logging
 import logging.handlers
+import queue
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict
@@ -17,43 +22,211 @@ class PatternFilter(logging.Filter):
             return self.include_pattern_99
         return True
 
-def get_logger(name: str) -> logging.Logger:
-    """ロガーの設定"""
-    logger = logging.getLogger(name)
-    
-    if not logger.handlers:  # ハンドラーが未設定の場合のみ追加
-        # ログディレクトリの作成
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        
-        # ログファイルの設定
-        log_file = log_dir / f"app_{datetime.now().strftime('%Y%m%d')}.log"
-        
+class _EventFields(dict):
+    """イベントの項目（テキスト形式ではJSONとして出力し、整形は出力時まで行わない）"""
+
+    def __str__(self):
+        return json.dumps(self, ensure_ascii=False, default=str)
+
+
+class JsonFormatter(logging.Formatter):
+    """1件のログを1行のJSONとして出力するフォーマッター（log_eventのイベントは項目を展開する）"""
+
+    def format(self, record):
+        data = {
+            'ts': self.formatTime(record, self.datefmt),
+            'level': record.levelname,
+            'logger': record.name,
+        }
+        event = getattr(record, 'event', None)
+        if event:
+            data['event'] = event
+            data.update(record.fields)
+        else:
+            data['msg'] = record.getMessage()
+        if record.exc_info:
+            data['exc'] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """同一プロセス内のキューに積むだけのハンドラー（メッセージの整形はリスナーのスレッドで行う）"""
+
+    def prepare(self, record):
+        return record
+
+
+class TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """
+    件数（capacity）に加えて、前回の書き出しから一定時間が経過した場合にも書き出すMemoryHandler
+
+    新しいログが来ない間（常駐モードで次の実行時刻まで待機中など）も、バッファに残ったログを
+    flush_interval 秒ごとにバックグラウンドのスレッドで書き出す。
+    """
+
+    def __init__(self, capacity, flush_interval, flushLevel=logging.WARNING, target=None):
+        super().__init__(capacity, flushLevel=flushLevel, target=target)
+        self.flush_interval = flush_interval
+        self._flushed_at = time.monotonic()
+        self._stop_flushing = threading.Event()
+        if flush_interval > 0:
+            threading.Thread(target=self._flush_periodically, name='log-flush', daemon=True).start()
+
+    def _flush_periodically(self):
+        """flush_interval 秒ごとに、書き出されずに残っているログを書き出す"""
+        while not self._stop_flushing.wait(self.flush_interval):
+            if self.buffer and time.monotonic() - self._flushed_at >= self.flush_interval:
+                self.flush()
+
+    def shouldFlush(self, record):
+        return (
+            super().shouldFlush(record)
+            or time.monotonic() - self._flushed_at >= self.flush_interval
+        )
+
+    def flush(self):
+        super().flush()
+        self._flushed_at = time.monotonic()
+
+    def close(self):
+        self._stop_flushing.set()
+        super().close()
+
+
+class _LazyRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """最初の書き出し時にログディレクトリ・ログファイルを作成するRotatingFileHandler"""
+
+    def __init__(self, filename, **kwargs):
+        super().__init__(filename, delay=True, **kwargs)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
+# 全ロガーで共有するキューハンドラーと、ファイル・コンソールへの書き出しを担当するリスナー
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+_setup_lock = threading.Lock()
+# ログファイルの出力先（set_log_directoryで変更）
+_log_dir = Path("logs")
+
+def _create_file_handler(formatter: logging.Formatter) -> logging.Handler:
+    """ログファイルのハンドラーを作成（ファイルは最初の書き出し時に作成）"""
+    file_handler = _LazyRotatingFileHandler(
+        _log_dir / f"app_{datetime.now().strftime('%Y%m%d')}.log",
+        maxBytes=10 * 1024 * 1024,  # 10MB
+        backupCount=30,
+        encoding='utf-8'
+    )
+    file_handler.setFormatter(formatter)
+    file_handler.setLevel(logging.DEBUG)
+    return file_handler
+
+def set_log_directory(directory) -> None:
+    """
+    ログファイルの出力先を変更（テストで作業ディレクトリにログを残さないために使用）
+
+    出力を開始済みの場合は、書き出し待ちのログを元の出力先に書き出してから切り替える。
+
+    Args:
+        directory: ログファイルの出力先ディレクトリ
+    """
+    global _log_dir
+    with _setup_lock:
+        _log_dir = Path(directory)
+        if _listener is None:
+            return
+        buffered_file_handler = _listener.handlers[0]
+        buffered_file_handler.acquire()
+        try:
+            buffered_file_handler.flush()
+            old_handler = buffered_file_handler.target
+            buffered_file_handler.setTarget(_create_file_handler(old_handler.formatter))
+        finally:
+            buffered_file_handler.release()
+        old_handler.close()
+
+def _get_queue_handler() -> logging.handlers.QueueHandler:
+    """
+    共有のキューハンドラーを取得（初回のみリスナーを起動）
+
+    ロガーはキューに積むだけで、ファイル・コンソールへの書き出しはリスナーのスレッドが1か所で行う。
+    ファイルへの書き出しは [LOGGING] file_buffer_records 件、または file_flush_interval_sec 秒ごと
+    （WARNING以上は即時）にまとめて行う。
+    """
+    global _queue_handler, _listener
+    with _setup_lock:
+        if _queue_handler is not None:
+            return _queue_handler
+
         # フォーマッターの作成
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - [%(levelname)s] - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
+        # ログファイルの形式（json: 1行1イベントのJSON）
+        if str(env.get_config_value('LOGGING', 'format', 'text')).lower() == 'json':
+            file_formatter = JsonFormatter(datefmt='%Y-%m-%d %H:%M:%S')
+        else:
+            file_formatter = formatter
         
-        # ファイルハンドラーの設定
-        file_handler = logging.handlers.RotatingFileHandler(
-            filename=log_file,
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=30,
-            encoding='utf-8'
+        # ファイルハンドラーの設定（logs/app_YYYYMMDD.log）
+        file_handler = _create_file_handler(file_formatter)
+        buffered_file_handler = TimedMemoryHandler(
+            capacity=env.get_config_value('LOGGING', 'file_buffer_records', 200),
+            flush_interval=env.get_config_value('LOGGING', 'file_flush_interval_sec', 2),
+            target=file_handler
         )
-        file_handler.setFormatter(formatter)
-        file_handler.setLevel(logging.DEBUG)
+        buffered_file_handler.setLevel(logging.DEBUG)
         
         # コンソールハンドラーの設定
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
         console_handler.setLevel(logging.INFO)
-        
-        # ロガーの設定
-        logger.setLevel(logging.DEBUG)
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+
+        _queue_handler = _LocalQueueHandler(queue.SimpleQueue())
+        _listener = logging.handlers.QueueListener(
+            _queue_handler.queue,
+            buffered_file_handler,
+            console_handler,
+            respect_handler_level=True
+        )
+        _listener.start()
+        # 終了時にキューに残ったログを書き出す
+        atexit.register(shutdown_logging)
+        return _queue_handler
+
+def shutdown_logging() -> None:
+    """キューに残ったログを全て書き出し、リスナーを停止"""
+    global _queue_handler, _listener
+    with _setup_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            try:
+                # MemoryHandler.close() は target を None にするため、閉じる前に取得しておく
+                target = getattr(handler, 'target', None)
+                handler.flush()
+                handler.close()
+                if target:
+                    target.close()
+            except (OSError, ValueError):
+                # 終了処理中に出力先（標準エラー等）が閉じられている場合
+                pass
+        _listener = None
+        _queue_handler = None
+
+def get_logger(name: str) -> logging.Logger:
+    """ロガーの設定"""
+    logger = logging.getLogger(name)
+    
+    if not logger.handlers:  # ハンドラーが未設定の場合のみ追加
+        # ロガーの設定（出力先は全ロガーで共有のキュー）
+        level = str(env.get_config_value('LOGGING', 'level', 'INFO')).upper()
+        logger.setLevel(getattr(logging, level, logging.INFO))
+        logger.addHandler(_get_queue_handler())
         
         # パターンフィルターを追加
         pattern_filter = PatternFilter()
@@ -64,6 +237,23 @@ def get_logger(name: str) -> logging.Logger:
     
     return logger
 
+def log_event(logger: logging.Logger, event: str, level: int = logging.INFO, **fields) -> None:
+    """
+    構造化イベントを出力
+
+    [LOGGING] format = json の場合は、イベント名と項目を1行のJSONとしてログファイルに出力する。
+    出力レベルに満たない場合は何もしない。
+
+    Args:
+        logger: 出力先のロガー
+        event: イベント名（例: record, phase）
+        level: ログレベル
+        **fields: イベントの項目
+    """
+    if logger.isEnabledFor(level):
+        fields = _EventFields(fields)
+        logger.log(level, '%s %s', event, fields, extra={'event': event, 'fields': fields})
+
 def cleanup_old_logs() -> None:
     """古いログファイルをクリーンアップ"""
     logger = get_logger(__name__)
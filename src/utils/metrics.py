@@ -0,0 +1,204 @@
+# utils\metrics.py
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Dict, Optional
+import json
+import math
+import os
+import threading
+import time
+from .environment import EnvironmentUtils as env
+
+# Prometheus textfile のメトリクス名の接頭辞
+PROMETHEUS_PREFIX = 'adoption_autocheck'
+
+
+class Metrics:
+    def __init__(self):
+        """
+        処理段階（span）ごとの所要時間を集計するクラス
+
+        span() / timed() で計測した時間を名前ごとに保持し、実行の終了時に
+        回数・合計・p50/p95/最大をJSONとPrometheusのtextfile形式で出力する。
+        並列ワーカーのスレッドからも同じインスタンスに記録できる。
+        """
+        self._durations = defaultdict(list)
+        self._errors = Counter()
+        self._lock = threading.Lock()
+        self.started_at = datetime.now()
+
+    def reset(self):
+        """集計をクリア（実行の開始時に呼び出す）"""
+        with self._lock:
+            self._durations = defaultdict(list)
+            self._errors = Counter()
+            self.started_at = datetime.now()
+
+    def record(self, name: str, seconds: float, error: bool = False):
+        """
+        所要時間を記録
+
+        Args:
+            name: 処理段階の名前
+            seconds: 所要時間（秒）
+            error: 例外で終了した場合はTrue
+        """
+        with self._lock:
+            self._durations[name].append(seconds)
+            if error:
+                self._errors[name] += 1
+
+    @contextmanager
+    def span(self, name: str):
+        """
+        with ブロックの所要時間を記録（例外で終了した場合はエラーとしても数える）
+
+        Args:
+            name: 処理段階の名前
+        """
+        started = time.perf_counter()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.record(name, time.perf_counter() - started, error)
+
+    def timed(self, name: str) -> Callable:
+        """
+        関数の所要時間を記録するデコレータ
+
+        Args:
+            name: 処理段階の名前
+        """
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @staticmethod
+    def _percentile(sorted_values, q: float) -> float:
+        """昇順の値から最近傍順位法でパーセンタイルを求める"""
+        rank = max(1, math.ceil(q * len(sorted_values)))
+        return sorted_values[rank - 1]
+
+    def summary(self) -> Dict[str, Dict]:
+        """
+        処理段階ごとの集計を取得
+
+        Returns:
+            Dict[str, Dict]: {名前: {count, errors, total, p50, p95, max}}（時間は秒）
+        """
+        with self._lock:
+            durations = {name: sorted(values) for name, values in self._durations.items()}
+            errors = dict(self._errors)
+        return {
+            name: {
+                'count': len(values),
+                'errors': errors.get(name, 0),
+                'total': round(sum(values), 3),
+                'p50': round(self._percentile(values, 0.5), 3),
+                'p95': round(self._percentile(values, 0.95), 3),
+                'max': round(values[-1], 3),
+            }
+            for name, values in sorted(durations.items())
+        }
+
+    def to_prometheus(self, summary: Optional[Dict[str, Dict]] = None) -> str:
+        """
+        集計をPrometheusのtextfile形式に変換
+
+        Args:
+            summary: summary()の結果（未指定時は現在の集計）
+
+        Returns:
+            str: node_exporter の textfile collector で読み込める文字列
+        """
+        summary = self.summary() if summary is None else summary
+        name = f"{PROMETHEUS_PREFIX}_span_seconds"
+        lines = [
+            f"# HELP {name} Duration of each processing span in seconds.",
+            f"# TYPE {name} summary",
+        ]
+        for span, stat in summary.items():
+            for quantile, key in (('0.5', 'p50'), ('0.95', 'p95'), ('1', 'max')):
+                lines.append(f'{name}{{span="{span}",quantile="{quantile}"}} {stat[key]}')
+            lines.append(f'{name}_sum{{span="{span}"}} {stat["total"]}')
+            lines.append(f'{name}_count{{span="{span}"}} {stat["count"]}')
+        lines.extend([
+            f"# HELP {PROMETHEUS_PREFIX}_span_errors_total Spans that ended with an exception.",
+            f"# TYPE {PROMETHEUS_PREFIX}_span_errors_total counter",
+        ])
+        for span, stat in summary.items():
+            lines.append(f'{PROMETHEUS_PREFIX}_span_errors_total{{span="{span}"}} {stat["errors"]}')
+        lines.extend([
+            f"# HELP {PROMETHEUS_PREFIX}_last_run_timestamp_seconds Start time of the last run.",
+            f"# TYPE {PROMETHEUS_PREFIX}_last_run_timestamp_seconds gauge",
+            f"{PROMETHEUS_PREFIX}_last_run_timestamp_seconds {self.started_at.timestamp():.0f}",
+        ])
+        return "\n".join(lines) + "\n"
+
+    def format_summary(self, limit: int = 5, summary: Optional[Dict[str, Dict]] = None) -> str:
+        """
+        合計時間の長い処理段階をSlack通知用の短い文字列に変換
+
+        Args:
+            limit: 表示する処理段階の数
+            summary: summary()の結果（未指定時は現在の集計）
+
+        Returns:
+            str: 1行1処理段階の文字列（集計が無い場合は空文字）
+        """
+        summary = self.summary() if summary is None else summary
+        top = sorted(summary.items(), key=lambda item: -item[1]['total'])[:limit]
+        return "\n".join(
+            f"• {span}: {stat['count']}回 合計{stat['total']:.1f}秒（p95 {stat['p95']:.2f}秒・最大{stat['max']:.2f}秒）"
+            for span, stat in top
+        )
+
+    def export(self, output_dir: Optional[Path] = None) -> Optional[Dict[str, Dict]]:
+        """
+        集計をJSONとPrometheusのtextfile形式で出力
+
+        JSONは実行ごとに metrics_YYYYMMDD_HHMMSS.json、textfileは collector が読めるよう
+        同じ名前（adoption_autocheck.prom）に一時ファイルから置き換えて出力する。
+
+        Args:
+            output_dir: 出力先（未指定時は [METRICS] output_dir）
+
+        Returns:
+            Optional[Dict[str, Dict]]: 出力した集計。[METRICS] enabled = false の場合はNone
+        """
+        if not env.get_config_value('METRICS', 'enabled', True):
+            return None
+        output_dir = Path(output_dir or env.get_config_value('METRICS', 'output_dir', 'logs/metrics'))
+        if not output_dir.is_absolute():
+            output_dir = env.get_project_root() / output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        summary = self.summary()
+        json_file = output_dir / f"metrics_{self.started_at.strftime('%Y%m%d_%H%M%S')}.json"
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'started_at': self.started_at.isoformat(),
+                'finished_at': datetime.now().isoformat(),
+                'spans': summary,
+            }, f, ensure_ascii=False, indent=2)
+
+        prom_file = output_dir / f"{PROMETHEUS_PREFIX}.prom"
+        temp_file = prom_file.with_name(f"{prom_file.name}.{os.getpid()}.tmp")
+        temp_file.write_text(self.to_prometheus(summary), encoding='utf-8')
+        os.replace(temp_file, prom_file)
+        return summary
+
+
+# プロセス全体で共有する集計
+metrics = Metrics()
@@ -2,6 +2,14 @@ import os
 import sys
 from pathlib import Path
 
+import pytest
+
 # プロジェクトルートディレクトリをPythonパスに追加
 project_root = str(Path(__file__).parent.parent)
-sys.path.insert(0, project_root) 
\ No newline at end of file
+sys.path.insert(0, project_root) 
+
+@pytest.fixture(scope='session', autouse=True)
+def log_directory(tmp_path_factory):
+    """テスト中のログファイルは一時ディレクトリに出力する（リポジトリの logs/ に残さない）"""
+    from src.utils.logging_config import set_log_directory
+    set_log_directory(tmp_path_factory.mktemp('logs'))
@@ -0,0 +1,505 @@
+"""
+採用確認管理画面のローカル代替（スタブ）サーバー
+
+標準ライブラリのみで、実サイトの代わりにブラウザ操作の流れを再現する。
+- /admin/login のログインフォーム（Cookieでセッションを管理）
+- /admin の管理画面トップ（ログイン後の見出し）
+- /admin/adoptions の検索フォーム（#form_search）と、1レコード3行の検索結果テーブル
+  （#recruitment-list table.table-sm）、ページネーション、更新・ページ移動の確認モーダル
+
+レコード数・1ページの件数・応答の遅延は StubAdminSite の引数で指定する。
+セレクターは SELECTORS_CSV（config/selectors.csv と同じ形式）を使用すること。
+
+使用例:
+    site = StubAdminSite(records=generate_records(200), latency=0.05)
+    with StubAdminServer(site) as server:
+        print(server.admin_url)  # ADMIN_URL に設定する
+"""
+from datetime import date, timedelta
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlencode, urlparse
+import base64
+import json
+import random
+import secrets
+import threading
+import time
+
+# スタブの画面に合わせたセレクター定義（config/selectors.csv と同じ列）
+SELECTORS_CSV = """page,element,description,action_type,selector_type,selector_value
+login,username,ログインID,input,css_selector,#login_id
+login,password,パスワード,input,css_selector,#login_password
+login,submit_button,ログインボタン,click,css_selector,#login_submit
+top,page_title,ページタイトル,get_text,css_selector,.navbar-brand
+top,page_heading,ページ見出し,get_text,css_selector,h1.page-heading
+adoption,search_button,検索ボタン,click,css_selector,#search_button
+adoption,next_page_button,次ページボタン,click,css_selector,.pagination li.next a
+adoption,update_button,更新ボタン,click,css_selector,#update_button
+adoption,update_confirm_button,更新確定ボタン,click,css_selector,#modal-update .btn-primary
+adoption,update_cancel_button,更新キャンセルボタン,click,css_selector,#modal-update .btn-secondary
+adoption,close_button,閉じるボタン,click,css_selector,#modal-complete .btn-primary
+adoption,applicant_id,応募者ID,get_text,css_selector,td.applicant-id
+adoption,status,ステータス,select,css_selector,select.status
+adoption,training_start_date,研修初日,get_attribute,css_selector,span.training-start-date
+adoption,zaiseki_ok,在籍確認,select,css_selector,select.zaiseki
+adoption,celebration,お祝い,get_text,css_selector,span.celebration
+adoption,pattern_reason,パターン判定理由,get_text,css_selector,button.pattern-reason
+adoption,remark,備考,get_text,css_selector,button.remark
+adoption,confirm_checkbox,確認完了,click,css_selector,input.confirm-checkbox
+"""
+
+# judge_list.csv と同じ形式の判定条件（組み込みの判定と同じ結果になる）
+JUDGE_LIST_CSV = """pattern,oiwai,remark,status,training_start_date,zaiseki
+2,,,採用,未定,
+3,,,採用,{実行月以降},
+4,,,採用,{1ヶ月以上経過},〇
+1,,,保留,,
+1,,,不合格,,
+1,,,連絡取れず,,
+1,,,辞退,,
+1,,,欠席,,
+"""
+
+STATUSES = ['採用', '保留', '不合格', '連絡取れず', '辞退', '欠席', '選考中']
+ZAISEKI_OPTIONS = ['', '〇', '×']
+
+NO_DATA_MESSAGE = "該当する採用確認が見つかりませんでした"
+
+
+def generate_records(count: int, seed: int = 0, today: Optional[date] = None) -> List[Dict]:
+    """
+    スタブに表示する応募者レコードを生成
+
+    ステータス・研修初日（未定・実行月以降・1ヶ月以上経過・その間）・在籍確認・お祝い・備考を
+    乱数（seed固定）で組み合わせる。
+
+    Args:
+        count: レコード数
+        seed: 乱数のシード
+        today: 研修初日の基準日（未指定時は今日）
+
+    Returns:
+        List[Dict]: レコードのリスト
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    training_dates = [
+        '',                                              # 未定
+        today.replace(day=1).strftime('%Y/%m/%d'),       # 実行月以降
+        (today - timedelta(days=60)).strftime('%Y/%m/%d'),  # 1ヶ月以上経過
+        (today - timedelta(days=10)).strftime('%Y-%m-%d'),  # その間
+    ]
+    records = []
+    for i in range(count):
+        records.append({
+            'applicant_id': str(100000 + i),
+            'application_number': str(500000 + i),
+            'name': f"応募者{i + 1}",
+            'status': rng.choice(STATUSES),
+            'training_start_date': rng.choice(training_dates),
+            'zaiseki': rng.choice(ZAISEKI_OPTIONS),
+            'oiwai': rng.choice(['', '', '', '済']),
+            'remark': rng.choice([''] * 9 + ['研修日調整中']),
+            'pattern_reason': '',
+            'confirmed': False,
+        })
+    return records
+
+
+class StubAdminSite:
+    def __init__(self, records: List[Dict], per_page: int = 20, latency: float = 0.0,
+                 update_latency: Optional[float] = None, jitter: float = 0.0,
+                 login_id: str = 'admin', password: str = 'password',
+                 basic_auth: Optional[tuple] = None, seed: int = 0):
+        """
+        スタブサーバーの状態（レコード・セッション）と画面の生成を管理するクラス
+
+        Args:
+            records: generate_records で生成したレコード
+            per_page: 1ページのレコード数
+            latency: 各リクエストの応答を遅らせる秒数
+            update_latency: 更新リクエストの応答を遅らせる秒数（未指定時は latency）
+            jitter: 遅延に加えるばらつきの最大秒数
+            login_id: ログインID
+            password: ログインパスワード
+            basic_auth: (ID, パスワード)。指定時はBasic認証を要求する
+            seed: 遅延のばらつきに使う乱数のシード
+        """
+        self.records = records
+        self.per_page = per_page
+        self.latency = latency
+        self.update_latency = latency if update_latency is None else update_latency
+        self.jitter = jitter
+        self.login_id = login_id
+        self.password = password
+        self.basic_auth = basic_auth
+        self.sessions = set()
+        self.requests = 0
+        self.updates = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self, seconds: float):
+        """指定秒数（＋ばらつき）だけ応答を遅らせる"""
+        with self._lock:
+            self.requests += 1
+            extra = self._rng.uniform(0, self.jitter) if self.jitter else 0.0
+        if seconds + extra > 0:
+            time.sleep(seconds + extra)
+
+    def create_session(self) -> str:
+        """ログイン済みセッションのトークンを発行"""
+        token = secrets.token_hex(16)
+        with self._lock:
+            self.sessions.add(token)
+        return token
+
+    def search(self, query: Dict[str, str]) -> List[Dict]:
+        """
+        検索条件に一致するレコードを取得（確認完了済みは c[admin_check_flag]=false の場合に除外）
+
+        Args:
+            query: クエリ文字列の値
+
+        Returns:
+            List[Dict]: 一致したレコード
+        """
+        application_number = query.get('application_number', '').strip()
+        unchecked_only = query.get('c[admin_check_flag]', 'false') == 'false'
+        with self._lock:
+            return [
+                record for record in self.records
+                if not (unchecked_only and record['confirmed'])
+                and (not application_number or record['application_number'] == application_number)
+            ]
+
+    def confirm(self, applicant_ids: List[str]) -> int:
+        """
+        レコードを確認完了にする
+
+        Args:
+            applicant_ids: 確認完了にする応募者ID
+
+        Returns:
+            int: 確認完了にした件数
+        """
+        targets = set(applicant_ids)
+        with self._lock:
+            self.updates += 1
+            count = 0
+            for record in self.records:
+                if record['applicant_id'] in targets and not record['confirmed']:
+                    record['confirmed'] = True
+                    count += 1
+            return count
+
+    def confirmed_count(self) -> int:
+        """確認完了済みのレコード数"""
+        with self._lock:
+            return sum(1 for record in self.records if record['confirmed'])
+
+    # --- 画面 ---
+
+    @staticmethod
+    def _layout(title: str, body: str) -> str:
+        """共通のHTML"""
+        return f"""<!DOCTYPE html>
+<html lang="ja"><head><meta charset="utf-8"><title>{escape(title)}</title>
+<style>
+.modal {{ display: none; position: fixed; top: 20%; left: 30%; background: #fff; border: 1px solid #999; padding: 1em; z-index: 10; }}
+.modal.show {{ display: block; }}
+.modal-backdrop {{ position: fixed; inset: 0; background: rgba(0,0,0,.3); z-index: 5; }}
+.pagination li {{ display: inline; margin: 0 .3em; }}
+</style></head>
+<body><nav><span class="navbar-brand">採用確認管理（スタブ）</span></nav>
+{body}
+</body></html>"""
+
+    def login_page(self, error: str = '') -> str:
+        """ログインページ"""
+        message = f'<p class="error">{escape(error)}</p>' if error else ''
+        return self._layout('ログイン', f"""
+<h1>ログイン</h1>{message}
+<form method="post" action="/admin/login">
+<input type="text" id="login_id" name="login_id">
+<input type="password" id="login_password" name="password">
+<button type="submit" id="login_submit">ログイン</button>
+</form>""")
+
+    def top_page(self) -> str:
+        """管理画面トップ"""
+        return self._layout('管理画面', """
+<h1 class="page-heading">管理画面トップ</h1>
+<a href="/admin/adoptions">採用確認</a>""")
+
+    @staticmethod
+    def _select(css_class: str, options: List[str], selected: str) -> str:
+        """選択中の値を持つselect要素"""
+        items = ''.join(
+            f'<option{" selected" if option == selected else ""}>{escape(option)}</option>'
+            for option in options
+        )
+        return f'<select class="{css_class}">{items}</select>'
+
+    def _record_rows(self, record: Dict) -> str:
+        """1レコード分（3行）のtr"""
+        status_options = STATUSES if record['status'] in STATUSES else STATUSES + [record['status']]
+        return f"""<tr>
+<td class="applicant-id">{escape(record['applicant_id'])}</td>
+<td>{escape(record['application_number'])}</td>
+<td>{escape(record['name'])}</td>
+<td>{self._select('status', status_options, record['status'])}</td>
+<td><span class="training-start-date" data-value="{escape(record['training_start_date'])}">{escape(record['training_start_date'] or '未定')}</span></td>
+</tr>
+<tr><td colspan="5">在籍確認 {self._select('zaiseki', ZAISEKI_OPTIONS, record['zaiseki'])}</td></tr>
+<tr><td colspan="5">
+<span class="celebration">{escape(record['oiwai'])}</span>
+<button type="button" class="pattern-reason">{escape(record['pattern_reason'])}</button>
+<button type="button" class="remark">{escape(record['remark'])}</button>
+<label><input type="checkbox" class="confirm-checkbox" value="{escape(record['applicant_id'])}"> 確認完了</label>
+</td></tr>"""
+
+    def _pagination(self, query: Dict[str, str], page: int, pages: int) -> str:
+        """ページネーション（最終ページでは次ページの項目が disabled）"""
+        def link(number):
+            return '/admin/adoptions?' + urlencode(dict(query, page=str(number)))
+        items = [
+            f'<li class="page-item{" active" if number == page else ""}"><a class="page-link" href="{escape(link(number))}">{number}</a></li>'
+            for number in range(1, pages + 1)
+        ]
+        if page < pages:
+            items.append(f'<li class="page-item next"><a class="page-link" href="{escape(link(page + 1))}">次へ</a></li>')
+        else:
+            items.append('<li class="page-item next disabled"><a class="page-link" href="#">次へ</a></li>')
+        return f'<ul class="pagination">{"".join(items)}</ul>'
+
+    def adoptions_page(self, query: Dict[str, str]) -> str:
+        """採用確認ページ（検索フォーム・検索結果・ページネーション・モーダル）"""
+        records = self.search(query)
+        pages = max(1, -(-len(records) // self.per_page))
+        page = min(max(int(query.get('page', '1') or 1), 1), pages)
+        page_records = records[(page - 1) * self.per_page:page * self.per_page]
+
+        if page_records:
+            tbody = ''.join(self._record_rows(record) for record in page_records)
+        else:
+            tbody = f'<tr><td colspan="10">{NO_DATA_MESSAGE}</td></tr>'
+
+        def radios(name, values):
+            current = query.get(name, '')
+            return ''.join(
+                f'<label><input type="radio" name="{name}" value="{value}"{" checked" if value == current else ""}> {value or "指定なし"}</label>'
+                for value in values
+            )
+
+        return self._layout('採用確認', f"""
+<h1 class="page-heading">採用確認</h1>
+<form id="form_search" method="get" action="/admin/adoptions">
+<input type="hidden" name="s[order]" value="1">
+<input type="hidden" name="c[admin_check_flag]" value="{escape(query.get('c[admin_check_flag]', 'false'))}">
+<div>提出ステータス {radios('submission_status', ['', '1', '2', '3', '4'])}</div>
+<div>提出期限 {radios('submission_due', ['', '1', '2', '3'])}</div>
+<input type="text" id="application_number" name="application_number" value="{escape(query.get('application_number', ''))}">
+<button type="submit" id="search_button">検索</button>
+</form>
+<div id="recruitment-list">
+<table class="table table-sm"><tbody>
+{tbody}
+</tbody></table>
+</div>
+{self._pagination({k: v for k, v in query.items() if k != 'page'}, page, pages)}
+<button type="button" id="update_button" class="btn btn-primary">更新</button>
+
+<div class="modal" id="modal-update"><div class="modal-footer">
+<p>チェックした応募者を確認完了に更新しますか？</p>
+<button type="button" class="btn btn-secondary">キャンセル</button>
+<button type="button" class="btn btn-primary">更新する</button>
+</div></div>
+<div class="modal" id="modal-complete"><div class="modal-footer">
+<p>更新しました</p>
+<button type="button" class="btn btn-primary">閉じる</button>
+</div></div>
+<div class="modal" id="modal-confirm_change_page"><div class="modal-footer">
+<p>チェックした内容は保存されていません。ページを移動しますか？</p>
+<button type="button" class="btn btn-secondary">キャンセル</button>
+<button type="button" class="btn btn-primary">移動する</button>
+</div></div>
+<script>
+function showModal(id) {{
+    var backdrop = document.createElement('div');
+    backdrop.className = 'modal-backdrop';
+    document.body.appendChild(backdrop);
+    document.getElementById(id).classList.add('show');
+}}
+function hideModal(id) {{
+    document.getElementById(id).classList.remove('show');
+    var backdrop = document.querySelector('.modal-backdrop');
+    if (backdrop) {{ backdrop.remove(); }}
+}}
+function checkedIds() {{
+    return Array.prototype.map.call(
+        document.querySelectorAll('input.confirm-checkbox:checked'), function(el) {{ return el.value; }});
+}}
+document.getElementById('update_button').addEventListener('click', function() {{ showModal('modal-update'); }});
+document.querySelector('#modal-update .btn-secondary').addEventListener('click', function() {{ hideModal('modal-update'); }});
+document.querySelector('#modal-update .btn-primary').addEventListener('click', function() {{
+    var ids = checkedIds();
+    fetch('/admin/adoptions/update', {{
+        method: 'POST', headers: {{'Content-Type': 'application/json'}}, body: JSON.stringify({{ids: ids}})
+    }}).then(function() {{
+        hideModal('modal-update');
+        showModal('modal-complete');
+    }});
+}});
+document.querySelector('#modal-complete .btn-primary').addEventListener('click', function() {{ hideModal('modal-complete'); }});
+var pendingHref = null;
+Array.prototype.forEach.call(document.querySelectorAll('.pagination a'), function(link) {{
+    link.addEventListener('click', function(event) {{
+        if (link.parentNode.classList.contains('disabled')) {{ event.preventDefault(); return; }}
+        if (checkedIds().length > 0) {{
+            event.preventDefault();
+            pendingHref = link.href;
+            showModal('modal-confirm_change_page');
+        }}
+    }});
+}});
+document.querySelector('#modal-confirm_change_page .btn-secondary').addEventListener('click', function() {{
+    hideModal('modal-confirm_change_page');
+}});
+document.querySelector('#modal-confirm_change_page .btn-primary').addEventListener('click', function() {{
+    hideModal('modal-confirm_change_page');
+    window.location.href = pendingHref;
+}});
+</script>""")
+
+
+class _StubAdminHandler(BaseHTTPRequestHandler):
+    # StubAdminServer.start で設定する
+    site: StubAdminSite = None
+
+    def log_message(self, format, *args):
+        # アクセスログは出力しない
+        pass
+
+    def _query(self) -> Dict[str, str]:
+        """クエリ文字列（同じキーは最後の値）"""
+        return {key: values[-1] for key, values in parse_qs(urlparse(self.path).query, keep_blank_values=True).items()}
+
+    def _session(self) -> Optional[str]:
+        """Cookieのセッショントークン（未ログインの場合はNone）"""
+        for part in self.headers.get('Cookie', '').split(';'):
+            name, _, value = part.strip().partition('=')
+            if name == 'stub_session' and value in self.site.sessions:
+                return value
+        return None
+
+    def _authorized(self) -> bool:
+        """Basic認証を確認（要求しない設定の場合は常にTrue）"""
+        if not self.site.basic_auth:
+            return True
+        expected = base64.b64encode(':'.join(self.site.basic_auth).encode()).decode()
+        if self.headers.get('Authorization') == f'Basic {expected}':
+            return True
+        self.send_response(401)
+        self.send_header('WWW-Authenticate', 'Basic realm="stub"')
+        self.end_headers()
+        return False
+
+    def _send_html(self, html: str, status: int = 200, headers: Optional[Dict[str, str]] = None):
+        body = html.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _redirect(self, location: str, headers: Optional[Dict[str, str]] = None):
+        self.send_response(302)
+        self.send_header('Location', location)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def do_GET(self):
+        self.site.delay(self.site.latency)
+        if not self._authorized():
+            return
+        path = urlparse(self.path).path.rstrip('/')
+        if path == '/admin/login':
+            self._send_html(self.site.login_page())
+        elif not self._session():
+            self._redirect('/admin/login')
+        elif path == '/admin':
+            self._send_html(self.site.top_page())
+        elif path == '/admin/adoptions':
+            self._send_html(self.site.adoptions_page(self._query()))
+        else:
+            self._send_html('<h1>Not Found</h1>', status=404)
+
+    def do_POST(self):
+        path = urlparse(self.path).path.rstrip('/')
+        self.site.delay(self.site.update_latency if path == '/admin/adoptions/update' else self.site.latency)
+        if not self._authorized():
+            return
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0) or 0)).decode('utf-8')
+        if path == '/admin/login':
+            form = {key: values[-1] for key, values in parse_qs(body).items()}
+            if form.get('login_id') == self.site.login_id and form.get('password') == self.site.password:
+                token = self.site.create_session()
+                self._redirect('/admin', {'Set-Cookie': f'stub_session={token}; Path=/'})
+            else:
+                self._send_html(self.site.login_page('ログインIDまたはパスワードが違います'), status=401)
+        elif path == '/admin/adoptions/update' and self._session():
+            count = self.site.confirm(json.loads(body or '{}').get('ids', []))
+            data = json.dumps({'updated': count}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        else:
+            self._send_html('<h1>Forbidden</h1>', status=403)
+
+
+class StubAdminServer:
+    def __init__(self, site: StubAdminSite, host: str = '127.0.0.1', port: int = 0):
+        """
+        StubAdminSite を別スレッドのHTTPサーバーで公開するクラス
+
+        Args:
+            site: スタブサーバーの状態
+            host: 待ち受けるアドレス
+            port: 待ち受けるポート（0の場合は空いているポート）
+        """
+        self.site = site
+        handler = type('StubAdminHandler', (_StubAdminHandler,), {'site': site})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def admin_url(self) -> str:
+        """管理画面のURL（ADMIN_URL に設定する値）"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/admin"
+
+    def start(self) -> 'StubAdminServer':
+        """サーバーを起動"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='stub-admin', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """サーバーを停止"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,130 @@
+import os
+import sys
+from datetime import date, datetime
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pandas as pd
+import pytest
+from src.modules.checker import ApplicantChecker
+from src.modules.judge_table import JudgeTable
+from tests.stub_admin import JUDGE_LIST_CSV
+
+SELECTORS_CSV = """page,element,description,action_type,selector_type,selector_value
+adoption,status,ステータス,get,css,td.status
+"""
+
+@pytest.fixture
+def checker(tmp_path):
+    """一時ディレクトリのCSVを使用するApplicantChecker"""
+    selectors = tmp_path / "selectors.csv"
+    selectors.write_text(SELECTORS_CSV, encoding='utf-8')
+    judge_list = tmp_path / "judge_list.csv"
+    judge_list.write_text(JUDGE_LIST_CSV, encoding='utf-8')
+    return ApplicantChecker(selectors, judge_list)
+
+def applicant(status, training_start_date='未定', zaiseki='', oiwai='', remark=''):
+    """判定用の応募者データ"""
+    return {
+        'status': status,
+        'training_start_date': training_start_date,
+        'zaiseki': zaiseki,
+        'oiwai': oiwai,
+        'remark': remark
+    }
+
+def test_judge_table_buckets(checker):
+    """研修初日が基準日に対する区分に変換されることのテスト"""
+    table = checker.judge_table
+    today = date(2024, 6, 15)
+    assert table.bucket('未定', today) == 'undecided'
+    assert table.bucket('2024/13/01', today) == 'invalid'
+    assert table.bucket('2024/06/01', today) == 'from_month'
+    assert table.bucket('2024-07-10', today) == 'from_month'
+    assert table.bucket('2024/05/15', today) == 'elapsed'
+    assert table.bucket('2024/05/16', today) == 'between'
+
+def test_judge_table_evaluate(checker):
+    """judge_list.csv の判定表で一致するパターンを取得できることのテスト"""
+    table = checker.judge_table
+    today = date(2024, 6, 15)
+
+    def evaluate(status, training_start_date='未定', zaiseki=''):
+        return table.evaluate({
+            'status': status,
+            'training_start_date': training_start_date,
+            'zaiseki': zaiseki,
+            'oiwai': '',
+            'admin_memo': ''
+        }, today)
+
+    assert evaluate('採用') == 2
+    assert evaluate('採用', '2024/06/20') == 3
+    assert evaluate('採用', '2024/04/01', '〇') == 4
+    assert evaluate('採用', '2024/04/01') is None
+    assert evaluate('採用', '2024/06/01x') is None
+    assert evaluate('辞退', '2024/04/01') == 1
+    assert evaluate('入社') is None
+
+def test_matches_pattern(checker):
+    """_matches_pattern が判定表を使って一致を判定することのテスト"""
+    values = {'status': '採用', 'training_start_date': '未定', 'zaiseki': '', 'oiwai': '', 'admin_memo': ''}
+    assert checker._matches_pattern("2", values) is True
+    assert checker._matches_pattern("3", values) is False
+    assert checker.should_check_applicant({
+        'status': '欠席',
+        'celebration_sent': '',
+        'admin_memo': '',
+        'training_date': '未定',
+        'attendance_check': ''
+    }) == "不採用等確定"
+
+def test_judge_table_hot_reload(tmp_path):
+    """judge_list.csv が更新されると判定表がコンパイルし直されることのテスト"""
+    judge_list = tmp_path / "judge_list.csv"
+    judge_list.write_text(JUDGE_LIST_CSV, encoding='utf-8')
+    os.utime(judge_list, (1000, 1000))
+    table = JudgeTable(judge_list, check_interval=0)
+    values = {'status': '入社', 'training_start_date': '未定', 'zaiseki': '', 'oiwai': '', 'admin_memo': ''}
+    assert table.evaluate(values) is None
+
+    judge_list.write_text(JUDGE_LIST_CSV + "5,,,入社,,\n", encoding='utf-8')
+    os.utime(judge_list, (2000, 2000))
+    assert table.evaluate(values) == 5
+
+def test_check_pattern_by_judge_list(checker):
+    """use_judge_list 有効時は判定表でパターンと理由を返すことのテスト"""
+    checker.use_judge_list = True
+    assert checker.check_pattern(applicant('採用')) == (2, "研修日未定・在籍確認未実施")
+    assert checker.check_pattern(applicant('保留')) == (1, "ステータス: 保留")
+    assert checker.check_pattern(applicant('入社')) == (99, "該当するパターンなし")
+
+def test_classify_many_matches_check_pattern(checker):
+    """classify_many の結果が check_pattern と一致することのテスト"""
+    records = [
+        applicant('採用'),
+        applicant('採用', '2099/01/01'),
+        applicant('採用', '2000-01-01', '〇'),
+        applicant('採用', '2000/01/01'),
+        applicant('採用', '2000/01/01', '〇'),
+        applicant('採用', '不正な日付'),
+        applicant('不合格', '2000/01/01'),
+        applicant('連絡取れず'),
+        applicant('入社'),
+    ]
+    assert checker.classify_many(records) == [checker.check_pattern(record) for record in records]
+    assert checker.classify_many([]) == []
+
+def test_classify_frame_matches_check_pattern(checker):
+    """classify_frame の結果が1件ずつの判定と一致することのテスト"""
+    dates = ['未定', '2024/1/5', '2024-06-15', '2024/05/15', '2024/05/16', '2024/06/16',
+             '2300/01/01', '2024/02/30', '', '2024/01/05x']
+    records = [
+        applicant(status, training_start_date, zaiseki)
+        for status in ['採用', '欠席', '入社']
+        for training_start_date in dates
+        for zaiseki in ['〇', '']
+    ]
+    now = datetime(2024, 6, 15, 12, 0)
+    result = checker.classify_frame(pd.DataFrame(records), now)
+    assert list(zip(result['pattern'], result['pattern_reason'])) == checker.classify_many(records, now)
@@ -0,0 +1,41 @@
+import os
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+from src.utils.environment import ConfigSnapshot
+
+def write_settings(path, text, mtime):
+    """設定ファイルを書き込み、mtimeを指定値にそろえる"""
+    path.write_text(text, encoding='utf-8')
+    os.utime(path, (mtime, mtime))
+
+def test_config_snapshot_coerce(tmp_path):
+    """設定値の型変換がget_config_valueの従来の変換と一致することのテスト"""
+    settings = tmp_path / "settings.ini"
+    write_settings(settings, "[BROWSER]\nworkers = 3\nwait_poll_interval = 0.1\nheadless = True\nurl = https://example.com\n", 1000)
+
+    snapshot = ConfigSnapshot(settings, check_interval=0)
+    assert snapshot.get('BROWSER', 'workers') == 3
+    assert snapshot.get('BROWSER', 'wait_poll_interval') == 0.1
+    assert snapshot.get('BROWSER', 'headless') is True
+    assert snapshot.get('BROWSER', 'url') == "https://example.com"
+    assert snapshot.get('BROWSER', 'missing', 'default') == 'default'
+    assert snapshot.get('MISSING', 'workers', 1) == 1
+
+def test_config_snapshot_reload_and_read_only(tmp_path):
+    """ファイル更新時のみ読み込み直し、ビューが読み取り専用であることのテスト"""
+    settings = tmp_path / "settings.ini"
+    write_settings(settings, "[LOGGING]\ninclude_pattern_99 = true\n", 1000)
+
+    snapshot = ConfigSnapshot(settings, check_interval=0)
+    view = snapshot.view()
+    assert view['LOGGING']['include_pattern_99'] is True
+    assert snapshot.view() is view
+
+    write_settings(settings, "[LOGGING]\ninclude_pattern_99 = false\n", 2000)
+    assert snapshot.get('LOGGING', 'include_pattern_99') is False
+
+    with pytest.raises(TypeError):
+        snapshot.view()['LOGGING']['include_pattern_99'] = True
@@ -0,0 +1,78 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+import requests
+from src.modules.listing_fetcher import ListingFetcher, page_url
+from src.modules.table_parser import TableParser
+from tests.stub_admin import StubAdminServer, StubAdminSite, generate_records
+from tests.test_reclassify import make_checker
+
+BASIC_AUTH = ('stub', 'secret')
+
+
+class FakeDriver:
+    """ログイン済みのWebDriverの代わり（Selenium形式のCookieを返す）"""
+    def __init__(self, cookies):
+        self.cookies = cookies
+
+    def get_cookies(self):
+        return self.cookies
+
+    def execute_script(self, script):
+        return 'FakeDriver/1.0'
+
+
+@pytest.fixture
+def server():
+    """10レコード・1ページ4件・Basic認証ありのスタブサーバー"""
+    site = StubAdminSite(generate_records(10, seed=7), per_page=4, basic_auth=BASIC_AUTH)
+    with StubAdminServer(site) as server:
+        yield server
+
+
+def browser_cookies(server):
+    """ログインしてSelenium形式のCookieを作成"""
+    with requests.Session() as session:
+        session.auth = BASIC_AUTH
+        session.post(f"{server.admin_url}/login", data={'login_id': 'admin', 'password': 'password'})
+        return [
+            {'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain, 'path': cookie.path, 'secure': False}
+            for cookie in session.cookies
+        ]
+
+
+def test_page_url_replaces_page_parameter():
+    """pageパラメータだけを書き換え、他の検索条件はそのまま"""
+    url = page_url('http://localhost/admin/adoptions?c%5Badmin_check_flag%5D=false&page=2', 5)
+    assert url == 'http://localhost/admin/adoptions?c%5Badmin_check_flag%5D=false&page=5'
+
+
+def test_fetch_all_with_browser_cookies(server, tmp_path):
+    """ブラウザのCookieを引き継いで全ページを取得し、snapshot_pageと同じ形式のレコードを返す"""
+    selectors = make_checker(tmp_path).get_selectors()
+    fetcher = ListingFetcher(selectors, max_workers=2, timeout=5, basic_auth=BASIC_AUTH)
+    fetcher.load_cookies(FakeDriver(browser_cookies(server)))
+    url = f"{server.admin_url}/adoptions?c[admin_check_flag]=false".replace('http://', f'http://{BASIC_AUTH[0]}:{BASIC_AUTH[1]}@')
+    pages = fetcher.fetch_all(url)
+    fetcher.close()
+
+    assert [page['page'] for page in pages] == [1, 2, 3]
+    records = [record for page in pages for record in page['records']]
+    assert [record['application_id'] for record in records] == [
+        record['application_number'] for record in server.site.records
+    ]
+    assert [record['page'] for record in records] == [1] * 4 + [2] * 4 + [3] * 2
+    # 保存用のHTMLからも同じレコードが読み取れる
+    assert TableParser(selectors).parse(pages[2]['html']) == [
+        {key: value for key, value in record.items() if key != 'page'} for record in pages[2]['records']
+    ]
+
+
+def test_fetch_all_without_session_returns_none(server, tmp_path):
+    """ログインしていない場合（ログイン画面に転送される）はNone"""
+    fetcher = ListingFetcher(make_checker(tmp_path).get_selectors(), timeout=5, basic_auth=BASIC_AUTH)
+    fetcher.load_cookies(FakeDriver([]))
+    assert fetcher.fetch_all(f"{server.admin_url}/adoptions") is None
+    fetcher.close()
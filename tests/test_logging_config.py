@@ -0,0 +1,48 @@
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.utils.logging_config import JsonFormatter, TimedMemoryHandler, log_event
+
+class _Capture(logging.Handler):
+    """出力されたログを保持するハンドラー"""
+    def __init__(self):
+        super().__init__(level=logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+def test_log_event_json():
+    """イベントが項目を展開した1行のJSONとして出力され、出力レベル未満では出力されないことのテスト"""
+    logger = logging.getLogger('tests.logging_config')
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    capture = _Capture()
+    logger.addHandler(capture)
+
+    log_event(logger, 'record', id='123', pattern='1', elapsed_ms=1.5)
+    log_event(logger, 'record', level=logging.DEBUG, id='456')
+
+    assert len(capture.records) == 1
+    data = json.loads(JsonFormatter().format(capture.records[0]))
+    assert data['event'] == 'record'
+    assert data['id'] == '123' and data['pattern'] == '1' and data['elapsed_ms'] == 1.5
+    # テキスト形式ではイベント名と項目のJSONを出力
+    assert capture.records[0].getMessage() == 'record {"id": "123", "pattern": "1", "elapsed_ms": 1.5}'
+
+def test_timed_memory_handler_flushes_while_idle():
+    """新しいログが来なくても、flush_interval 秒が経過したらバッファのログが書き出されることのテスト"""
+    capture = _Capture()
+    handler = TimedMemoryHandler(capacity=100, flush_interval=0.05, target=capture)
+    handler.handle(logging.LogRecord('tests', logging.INFO, __file__, 0, '実行完了', None, None))
+    assert capture.records == []
+
+    deadline = time.monotonic() + 2
+    while not capture.records and time.monotonic() < deadline:
+        time.sleep(0.01)
+    handler.close()
+    assert [record.getMessage() for record in capture.records] == ['実行完了']
@@ -0,0 +1,32 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+from src.utils.metrics import Metrics
+
+def test_metrics_summary():
+    """回数・合計・p50/p95/最大の集計と、例外で終了したspanのエラー件数のテスト"""
+    metrics = Metrics()
+    for seconds in [0.1 * i for i in range(1, 21)]:
+        metrics.record('browser.click_checkbox', seconds)
+    with pytest.raises(ValueError):
+        with metrics.span('sheets.append_rows'):
+            raise ValueError("書き込み失敗")
+
+    summary = metrics.summary()
+    stat = summary['browser.click_checkbox']
+    assert stat['count'] == 20
+    assert stat['total'] == pytest.approx(21.0)
+    assert stat['p50'] == pytest.approx(1.0)
+    assert stat['p95'] == pytest.approx(1.9)
+    assert stat['max'] == pytest.approx(2.0)
+    assert summary['sheets.append_rows']['count'] == 1
+    assert summary['sheets.append_rows']['errors'] == 1
+
+    text = metrics.to_prometheus(summary)
+    assert 'adoption_autocheck_span_seconds{span="browser.click_checkbox",quantile="0.95"} 1.9' in text
+    assert 'adoption_autocheck_span_seconds_count{span="browser.click_checkbox"} 20' in text
+    assert 'adoption_autocheck_span_errors_total{span="sheets.append_rows"} 1' in text
+    # Slack通知用の要約は合計時間の長い順
+    assert metrics.format_summary(limit=1, summary=summary).startswith("• browser.click_checkbox: 20回")
@@ -0,0 +1,29 @@
+import sys
+from datetime import date
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / 'benchmarks'))
+
+from workload import generate_applicants
+from microbench import compare
+
+
+def test_generate_applicants_is_deterministic():
+    """同じシードからは同じデータが生成され、全てのステータスを含む"""
+    first = generate_applicants(2000, seed=1, today=date(2024, 5, 15))
+    second = generate_applicants(2000, seed=1, today=date(2024, 5, 15))
+    assert first == second
+    assert len(first) == 2000
+    assert {'採用', '保留', '不合格', '連絡取れず', '辞退', '欠席'} <= {a['status'] for a in first}
+    assert any(a['training_start_date'] == '未定' for a in first)
+
+
+def test_compare_reports_regressions_over_threshold():
+    """1件あたりの時間が許容割合を超えて悪化した処理だけを返す"""
+    baseline = {'a': {'1000': {'per_op_us': 1.0}}, 'b': {'1000': {'per_op_us': 1.0}}}
+    results = {
+        'a': {'1000': {'per_op_us': 1.1}},
+        'b': {'1000': {'per_op_us': 1.5}},
+        'c': {'1000': {'per_op_us': 9.9}},
+    }
+    assert compare(results, baseline, 0.2) == [('b', '1000', 1.0, 1.5, 1.5)]
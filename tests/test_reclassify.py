@@ -0,0 +1,96 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.modules.checker import ApplicantChecker
+from src.modules.snapshot_archive import SnapshotArchive
+from src.modules.table_parser import TableParser
+from src.reclassify import reclassify
+from tests.stub_admin import JUDGE_LIST_CSV, SELECTORS_CSV, StubAdminSite, generate_records
+
+
+def make_checker(tmp_path, judge_list_csv=JUDGE_LIST_CSV):
+    """スタブと同じセレクターのApplicantChecker"""
+    selectors = tmp_path / 'selectors.csv'
+    judge_list = tmp_path / 'judge_list.csv'
+    selectors.write_text(SELECTORS_CSV, encoding='utf-8')
+    judge_list.write_text(judge_list_csv, encoding='utf-8')
+    return ApplicantChecker(selectors, judge_list)
+
+
+def test_table_parser_reads_stub_page(tmp_path):
+    """スタブの検索結果ページをsnapshot_pageと同じ形式のレコードとして読み取る"""
+    records = generate_records(6, seed=3)
+    site = StubAdminSite(records, per_page=20)
+    parser = TableParser(make_checker(tmp_path).get_selectors())
+
+    parsed = parser.parse(site.adoptions_page({}))
+    assert len(parsed) == 6
+    for record, expected in zip(parsed, records):
+        assert record['id'] == expected['applicant_id']
+        assert record['application_id'] == expected['application_number']
+        assert record['applicant_name'] == expected['name']
+        assert record['status'] == expected['status']
+        assert record['training_start_date'] == (expected['training_start_date'] or '未定')
+        assert record['zaiseki'] == expected['zaiseki']
+        assert record['oiwai'] == expected['oiwai']
+        assert record['remark'] == expected['remark']
+        assert record['checked'] is False
+
+    # 0件のページはレコード無し、テーブルが無いページはNone
+    assert parser.parse(StubAdminSite([]).adoptions_page({})) == []
+    assert parser.parse(site.top_page()) is None
+
+
+def test_snapshot_archive_skips_duplicates_and_rotates(tmp_path):
+    """同じHTMLは続けて保存せず、max_files を超えた古いスナップショットを削除する"""
+    archive = SnapshotArchive(directory=tmp_path / 'snapshots', max_files=2, enabled=True)
+    first = archive.save('<div id="recruitment-list">1</div>', url='http://localhost/admin/adoptions')
+    assert first is not None
+    assert archive.save('<div id="recruitment-list">1</div>') is None
+    archive.save('<div id="recruitment-list">2</div>')
+    archive.save('<div id="recruitment-list">3</div>')
+
+    files = archive.files()
+    assert len(files) == 2
+    assert first not in files
+    assert [snapshot['html'] for snapshot in archive] == [
+        '<div id="recruitment-list">2</div>', '<div id="recruitment-list">3</div>'
+    ]
+    assert SnapshotArchive.load(files[0])['url'] == ''
+
+
+def test_reclassify_reports_changed_decisions(tmp_path):
+    """判定条件を変更した場合に、取得時から判定が変わるレコードだけを報告する"""
+    records = generate_records(40, seed=5)
+    site = StubAdminSite(records, per_page=20)
+    checker = make_checker(tmp_path)
+    checker.use_judge_list = True
+    parser = TableParser(checker.get_selectors())
+    archive = SnapshotArchive(directory=tmp_path / 'snapshots', enabled=True)
+    for page in ('1', '2'):
+        html = site.adoptions_page({'page': page})
+        snapshot = parser.parse(html)
+        archive.save(html, decisions=[
+            {'id': record['id'], 'application_id': record['application_id'], 'pattern': pattern, 'pattern_reason': reason}
+            for record, (pattern, reason) in zip(snapshot, checker.classify_many(snapshot))
+        ])
+
+    # 「保留」をパターン1から外した判定条件
+    judge_list = tmp_path / 'judge_list_new.csv'
+    judge_list.write_text(JUDGE_LIST_CSV.replace('1,,,保留,,\n', ''), encoding='utf-8')
+    kwargs = dict(
+        selectors_file=tmp_path / 'selectors.csv',
+        judge_list_file=judge_list,
+        use_judge_list=True,
+    )
+    results = reclassify(archive.files(), workers=1, **kwargs)
+
+    assert sum(result['compared'] for result in results) == 40
+    changes = [change for result in results for change in result['changes']]
+    assert changes
+    assert all(change['status'] == '保留' and change['before'] == 1 and change['after'] == 99 for change in changes)
+    assert len(changes) == sum(1 for record in records if record['status'] == '保留')
+
+    # プロセスプールでも同じ結果になる
+    assert reclassify(archive.files(), workers=2, **kwargs) == results
@@ -0,0 +1,165 @@
+import sys
+import json
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+import src.modules.scheduler as scheduler_module
+from src.modules.scheduler import CronExpression, Scheduler
+
+def make_scheduler(tmp_path, schedules, enabled=None):
+    """状態ファイルとロックファイルを一時ディレクトリに置いたスケジューラーを作成"""
+    return Scheduler(
+        schedules=schedules,
+        state_file=tmp_path / "scheduler_state.json",
+        lock_file=tmp_path / "scheduler.lock",
+        enabled=enabled
+    )
+
+def use_fake_clock(monkeypatch, start):
+    """仮想の時計を使用する（sleepで時刻を進める）"""
+    clock = {'now': start}
+
+    class FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock['now']
+
+    def fake_sleep(seconds):
+        clock['now'] += timedelta(seconds=seconds)
+
+    monkeypatch.setattr(scheduler_module, 'datetime', FakeDatetime)
+    monkeypatch.setattr(scheduler_module.time, 'sleep', fake_sleep)
+    return clock
+
+def test_cron_next_after():
+    """cron式から次の実行時刻を計算できることのテスト"""
+    cron = CronExpression("0 10,21 * * 1-5")
+    # 2024-06-07は金曜日
+    assert cron.next_after(datetime(2024, 6, 7, 9, 59, 30)) == datetime(2024, 6, 7, 10, 0)
+    assert cron.next_after(datetime(2024, 6, 7, 10, 0)) == datetime(2024, 6, 7, 21, 0)
+    # 土日を飛ばして月曜日
+    assert cron.next_after(datetime(2024, 6, 7, 21, 0)) == datetime(2024, 6, 10, 10, 0)
+
+    assert CronExpression("*/15 * * * *").next_after(datetime(2024, 1, 1, 0, 14)) == datetime(2024, 1, 1, 0, 15)
+    assert CronExpression("30 9 1 * *").next_after(datetime(2024, 1, 31, 12, 0)) == datetime(2024, 2, 1, 9, 30)
+    # 日曜日は0と7のどちらでも指定できる
+    assert CronExpression("0 0 * * 7").next_after(datetime(2024, 6, 7)) == datetime(2024, 6, 9, 0, 0)
+
+def test_cron_invalid():
+    """不正なcron式はエラーになることのテスト"""
+    with pytest.raises(ValueError):
+        CronExpression("0 10 * *")
+    with pytest.raises(ValueError):
+        CronExpression("60 10 * * *")
+
+def test_next_run_time_from_times(tmp_path):
+    """複数の実行時刻のうち最も近い時刻を返すことのテスト"""
+    schedules = [CronExpression.from_time(t) for t in ["10:00", "15:30", "21:00"]]
+    scheduler = make_scheduler(tmp_path, schedules, enabled=True)
+    assert scheduler.next_run_time(datetime(2024, 6, 7, 12, 0)) == datetime(2024, 6, 7, 15, 30)
+    assert scheduler.next_run_time(datetime(2024, 6, 7, 21, 0)) == datetime(2024, 6, 8, 10, 0)
+    assert scheduler.get_schedule_text() == "10:00, 15:30, 21:00"
+    assert make_scheduler(tmp_path, schedules, enabled=False).get_schedule_text() == "無効"
+
+def test_missed_runs(tmp_path):
+    """前回の実行以降に実行されなかった時刻を検知できることのテスト"""
+    scheduler = make_scheduler(tmp_path, [CronExpression.from_time("10:00"), CronExpression.from_time("21:00")])
+    # 実行記録が無い場合は検知しない
+    assert scheduler.missed_runs(datetime(2024, 6, 7, 10, 1)) == []
+
+    scheduler.state_file.write_text(json.dumps({'last_run': datetime(2024, 6, 6, 21, 0).isoformat()}))
+    assert scheduler.missed_runs(datetime(2024, 6, 7, 9, 0)) == []
+    assert scheduler.missed_runs(datetime(2024, 6, 7, 10, 1)) == [datetime(2024, 6, 7, 10, 0)]
+    assert scheduler.missed_runs(datetime(2024, 6, 8, 9, 0)) == [
+        datetime(2024, 6, 7, 10, 0),
+        datetime(2024, 6, 7, 21, 0)
+    ]
+
+def test_lock_prevents_overlap(tmp_path):
+    """ロックの取得中は別のスケジューラーがロックを取得できないことのテスト"""
+    first = make_scheduler(tmp_path, [CronExpression.from_time("10:00")])
+    second = make_scheduler(tmp_path, [CronExpression.from_time("10:00")])
+    assert first.acquire_lock() is True
+    assert second.acquire_lock() is False
+    first.release_lock()
+    assert second.acquire_lock() is True
+    second.release_lock()
+
+def test_slot_stays_pending_when_lock_is_held(tmp_path, monkeypatch):
+    """ロックを取得できずに実行しなかった予定時刻は、次回の追いつき実行の対象に残ることのテスト"""
+    use_fake_clock(monkeypatch, datetime(2024, 6, 7, 10, 5))
+    schedules = [CronExpression.from_time("10:00"), CronExpression.from_time("21:00")]
+    holder = make_scheduler(tmp_path, schedules, enabled=True)
+    scheduler = make_scheduler(tmp_path, schedules, enabled=True)
+    scheduler.state_file.write_text(json.dumps({'last_run': datetime(2024, 6, 6, 21, 0).isoformat()}))
+
+    # 追いつき実行の開始時に他のプロセスが実行中
+    assert holder.acquire_lock() is True
+    assert scheduler.wait_for_execution_time() is True
+    assert scheduler.current_slot == datetime(2024, 6, 7, 10, 0)
+    assert scheduler.acquire_lock() is False
+    assert scheduler.missed_runs() == [datetime(2024, 6, 7, 10, 0)]
+    holder.release_lock()
+
+    # ロックを取得して実行した時点で実行済みになる
+    assert scheduler.wait_for_execution_time() is True
+    assert scheduler.acquire_lock() is True
+    scheduler.mark_started()
+    assert scheduler.missed_runs() == []
+    scheduler.release_lock()
+
+def test_wait_ends_on_wake_event(tmp_path):
+    """即時実行の要求（wake_event）で待機を終了できることのテスト"""
+    scheduler = make_scheduler(tmp_path, [CronExpression.from_time("10:00")], enabled=True)
+    wake_event = threading.Event()
+    wake_event.set()
+    assert scheduler.wait_for_execution_time(wake_event=wake_event) is False
+    assert not wake_event.is_set()
+    assert scheduler.current_slot is None
+
+def test_prewarm_and_keepalive_before_slot(tmp_path, monkeypatch):
+    """実行時刻の前に事前準備とセッション維持が呼ばれることのテスト"""
+    clock = use_fake_clock(monkeypatch, datetime(2024, 6, 7, 9, 50))
+    scheduler = make_scheduler(tmp_path, [CronExpression.from_time("10:00")], enabled=True)
+    scheduler.prewarm_minutes = 5
+    scheduler.keepalive_interval_sec = 120
+    calls = []
+
+    assert scheduler.wait_for_execution_time(
+        prewarm=lambda: calls.append(('prewarm', clock['now'])),
+        keepalive=lambda: calls.append(('keepalive', clock['now']))
+    ) is True
+    assert calls[0] == ('prewarm', datetime(2024, 6, 7, 9, 55))
+    assert [name for name, _ in calls[1:]] == ['keepalive', 'keepalive']
+    assert clock['now'] == datetime(2024, 6, 7, 10, 0)
+    assert scheduler.current_slot == datetime(2024, 6, 7, 10, 0)
+
+def test_prewarm_skipped_while_another_process_runs(tmp_path, monkeypatch):
+    """他のプロセスがロックを取得中は事前準備・セッション維持を行わないことのテスト"""
+    clock = use_fake_clock(monkeypatch, datetime(2024, 6, 7, 9, 50))
+    holder = make_scheduler(tmp_path, [CronExpression.from_time("10:00")], enabled=True)
+    scheduler = make_scheduler(tmp_path, [CronExpression.from_time("10:00")], enabled=True)
+    calls = []
+
+    assert holder.acquire_lock() is True
+    assert scheduler.wait_for_execution_time(
+        prewarm=lambda: calls.append('prewarm'),
+        keepalive=lambda: calls.append('keepalive')
+    ) is True
+    assert calls == []
+    assert clock['now'] == datetime(2024, 6, 7, 10, 0)
+    assert scheduler.acquire_lock() is False
+    holder.release_lock()
+
+    # 事前準備でロックを取得した場合は、実行時もそのロックを使用する
+    clock['now'] = datetime(2024, 6, 8, 9, 50)
+    assert scheduler.wait_for_execution_time(prewarm=lambda: calls.append('prewarm')) is True
+    assert calls == ['prewarm']
+    assert holder.acquire_lock() is False
+    assert scheduler.acquire_lock() is True
+    scheduler.release_lock()
+    assert holder.acquire_lock() is True
+    holder.release_lock()
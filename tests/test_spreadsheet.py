@@ -76,6 +76,38 @@ def test_empty_applicants():
     # 空のリストを追加
     assert spreadsheet.append_logs([]) is True, "空リストの追加でエラー"
 
+def test_last_row_cache():
+    """最終行のキャッシュが追加結果の範囲で更新されることのテスト（接続不要）"""
+    class FakeSheet:
+        title = "exe_logsheet"
+
+        def __init__(self):
+            self.col_values_calls = 0
+
+        def col_values(self, col):
+            self.col_values_calls += 1
+            return ["No"] + [str(i) for i in range(1, 100)]
+
+        def append_rows(self, rows):
+            return {'updates': {'updatedRange': f"exe_logsheet!A101:L{100 + len(rows)}"}}
+
+    class FakeWorkbook:
+        def values_append(self, range_name, params, body):
+            return {}
+
+    spreadsheet = SpreadSheet(Path("dummy.json"), "dummy")
+    spreadsheet.sheet = FakeSheet()
+    spreadsheet.sheet.spreadsheet = FakeWorkbook()
+
+    # tableRangeが返されない場合のみA列を取得する
+    assert spreadsheet.get_last_row() == 100
+    assert spreadsheet.append_rows([["a"], ["b"], ["c"]]) is True
+    assert spreadsheet.get_last_row() == 103
+    assert spreadsheet.sheet.col_values_calls == 1
+
+    assert SpreadSheet._range_end_row("exe_logsheet!A1:L1000") == 1000
+    assert SpreadSheet._range_end_row("") is None
+
 if __name__ == "__main__":
     print("スプレッドシートの接続テストを開始します...")
     
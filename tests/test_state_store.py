@@ -0,0 +1,99 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from datetime import date
+from types import SimpleNamespace
+from src.modules.adoption import Adoption
+from src.modules.state_store import StateStore, fingerprint, stable_until
+from src.modules.table_parser import TableParser
+from tests.stub_admin import StubAdminSite, generate_records
+from tests.test_reclassify import make_checker
+
+
+def make_record(application_id, pattern, status='不採用', training_start_date='未定', remark=''):
+    """状態ストアに保存する応募者データ"""
+    return {
+        'application_id': application_id,
+        'status': status,
+        'training_start_date': training_start_date,
+        'zaiseki': '',
+        'oiwai': '',
+        'remark': remark,
+        'pattern': pattern,
+        'pattern_reason': '',
+    }
+
+
+def test_stable_until_and_fingerprint():
+    """研修初日・翌月の初日・1ヶ月後のうち基準日より後の最も早い日が期限になる"""
+    today = date(2026, 10, 18)
+    assert stable_until('2026-10-25', today) == date(2026, 10, 25)
+    assert stable_until('2026-10-10', today) == date(2026, 11, 1)
+    assert stable_until('2026-09-30', today) == date(2026, 10, 30)
+    assert stable_until('2026-08-01', today) is None
+    assert stable_until('未定', today) is None
+
+    # 判定に使わない項目（応募者名など）はハッシュに含めない
+    record = make_record('A1', 99)
+    assert fingerprint(record) == fingerprint(dict(record, applicant_name='別名', pattern=1))
+    assert fingerprint(record) != fingerprint(dict(record, status='保留'))
+
+
+def test_unchanged_skips_only_stable_non_targets(tmp_path):
+    """変化が無いチェック対象外のレコードだけを省略し、変更・期限到来・判定条件の変更は判定し直す"""
+    store = StateStore(path=tmp_path / 'state.sqlite3', enabled=True)
+    today = date(2026, 10, 18)
+    records = [
+        make_record('A1', 99),                                         # 変化なし
+        make_record('A2', 1, status='保留'),                            # チェック対象
+        make_record('A3', 99, training_start_date='2026-10-25'),       # 期限あり
+        dict(make_record('A4', 2, remark='連絡済み'), confirm_checkbox='スキップ'),
+        make_record('A5', 99),                                         # 項目が変わる
+    ]
+    store.record(records, 'builtin', today)
+
+    current = [dict(record) for record in records] + [make_record('A6', 99)]
+    current[4]['status'] = '保留'
+    unchanged = store.unchanged(current, 'builtin', today)
+    assert set(unchanged) == {0, 2, 3}
+    assert unchanged[3] == {'pattern': 2, 'pattern_reason': '', 'action': 'スキップ'}
+    # 研修初日を過ぎると判定し直す
+    assert set(store.unchanged(current, 'builtin', date(2026, 10, 25))) == {0, 3}
+    # 判定条件が変わると全件判定し直す
+    assert store.unchanged(current, 'judge_list:other', today) == {}
+
+    # 操作を伴わない保存では前回の操作（スキップ）を引き継ぐ
+    store.record([make_record('A4', 2, remark='連絡済み')], 'builtin', today)
+    assert store.unchanged(current[3:4], 'builtin', today)[0]['action'] == 'スキップ'
+    store.close()
+
+    # 無効の場合は何も省略しない
+    disabled = StateStore(path=tmp_path / 'state.sqlite3', enabled=False)
+    assert disabled.unchanged(current, 'builtin', today) == {}
+
+
+def test_classify_records_reuses_stored_decisions(tmp_path):
+    """変化が無いレコードも保存した判定結果で出力され、判定結果は判定し直した場合と同じになる"""
+    checker = make_checker(tmp_path)
+    records = TableParser(checker.get_selectors()).parse(
+        StubAdminSite(generate_records(30, seed=11), per_page=30).adoptions_page({})
+    )
+    store = StateStore(path=tmp_path / 'state.sqlite3', enabled=True)
+    adoption = Adoption(SimpleNamespace(state_store=store), checker.get_selectors(), checker)
+
+    first, unchanged = adoption.classify_records(records)
+    assert unchanged == {}
+    second, unchanged = adoption.classify_records(records)
+    store.close()
+
+    assert second == first == checker.classify_many(records)
+    assert unchanged
+    assert all(first[index][0] == 99 for index in unchanged)
+
+    # 応募IDごとの処理では保存した操作から記録用のデータを作成する
+    index = next(iter(unchanged))
+    applicant_data = adoption.unchanged_applicant(records[index], unchanged[index])
+    assert applicant_data['id'] == records[index]['application_id']
+    assert applicant_data['pattern'] == '99'
+    assert applicant_data['confirm_checkbox'] == 'パターン99'
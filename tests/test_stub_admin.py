@@ -0,0 +1,57 @@
+import json
+import sys
+import urllib.request
+from http.cookiejar import CookieJar
+from pathlib import Path
+from urllib.parse import urlencode
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+from tests.stub_admin import NO_DATA_MESSAGE, StubAdminServer, StubAdminSite, generate_records
+
+@pytest.fixture
+def server():
+    """5レコード・1ページ2件のスタブサーバー"""
+    with StubAdminServer(StubAdminSite(generate_records(5), per_page=2)) as server:
+        yield server
+
+def login(server):
+    """ログイン済みのCookieを持つopener"""
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(CookieJar()))
+    data = urlencode({'login_id': 'admin', 'password': 'password'}).encode()
+    with opener.open(f"{server.admin_url}/login", data=data) as response:
+        assert 'page-heading' in response.read().decode('utf-8')
+    return opener
+
+def test_stub_admin_flow(server):
+    """ログイン・検索結果（1レコード3行）・ページネーション・更新・応募ID検索のテスト"""
+    opener = login(server)
+    html = opener.open(f"{server.admin_url}/adoptions?c[admin_check_flag]=false").read().decode('utf-8')
+    assert 'id="form_search"' in html
+    assert html.count('class="applicant-id"') == 2
+    assert html.count('<tr') == 6
+    assert 'page-item next"' in html
+
+    last_page = opener.open(f"{server.admin_url}/adoptions?page=3").read().decode('utf-8')
+    assert last_page.count('class="applicant-id"') == 1
+    assert 'page-item next disabled' in last_page
+
+    # 確認完了にしたレコードは c[admin_check_flag]=false の検索結果から除外される
+    request = urllib.request.Request(
+        f"{server.admin_url}/adoptions/update",
+        data=json.dumps({'ids': ['100000', '100001']}).encode(),
+        headers={'Content-Type': 'application/json'}
+    )
+    assert json.loads(opener.open(request).read())['updated'] == 2
+    assert server.site.confirmed_count() == 2
+    html = opener.open(f"{server.admin_url}/adoptions").read().decode('utf-8')
+    assert '100000' not in html and '100002' in html
+
+    html = opener.open(f"{server.admin_url}/adoptions?application_number=999").read().decode('utf-8')
+    assert NO_DATA_MESSAGE in html
+
+def test_stub_admin_requires_login(server):
+    """未ログインの場合はログインページに移動することのテスト"""
+    with urllib.request.urlopen(f"{server.admin_url}/adoptions") as response:
+        assert response.url.endswith('/admin/login')
+        assert 'id="login_id"' in response.read().decode('utf-8')